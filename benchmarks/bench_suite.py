@@ -0,0 +1,251 @@
+"""Benchmark loader data dan pembangun figure uas.py & debunk.py: cold/warm cache, skala data 1x-1000x.
+
+Contoh:
+    python benchmarks/bench_suite.py                              # skala 1x
+    python benchmarks/bench_suite.py --scales 1 10 100 1000
+    python benchmarks/bench_suite.py --filter figure/debunk --compare benchmarks/results/bench-<rev>.json
+
+Hasil ditulis sebagai JSON ke benchmarks/results/bench-<revisi git>.json agar bisa dibandingkan antar commit.
+"""
+import argparse
+import json
+import logging
+import statistics
+import subprocess
+import sys
+import time
+import warnings
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).resolve().parent / 'results'
+sys.path.insert(0, str(ROOT))
+
+import pandas as pd  # noqa: E402
+import pyarrow as pa  # noqa: E402
+
+import data_store  # noqa: E402
+import debunk_data  # noqa: E402
+import figure_cache  # noqa: E402
+import headless  # noqa: E402
+import uas_data  # noqa: E402
+
+# (label, fungsi ter-cache st.cache_data, argumen)
+LOADERS = [
+    ('uas.get_modern_slavery_data', uas_data.get_modern_slavery_data, ()),
+    ('uas.get_global_manufacturing_shift', uas_data.get_global_manufacturing_shift, ()),
+    ('uas.get_rights_vs_growth', uas_data.get_rights_vs_growth, ()),
+    ('uas.get_working_hours_vs_growth', uas_data.get_working_hours_vs_growth, ()),
+    ('uas.get_prison_stats', uas_data.get_prison_stats, ()),
+    ('uas.get_slavery_gdp', uas_data.get_slavery_gdp, ()),
+    ('uas.load_integrated_data', uas_data.load_integrated_data, ()),
+    ('debunk.load_data', debunk_data.load_data, ()),
+    ('debunk.load_rights_data', debunk_data.load_rights_data, (2024,)),
+]
+
+# Perlambatan yang ditandai sebagai regresi oleh --compare: rasio median DAN selisih absolut
+# (timing di bawah 1 ms terlalu bising untuk dibandingkan dengan rasio saja)
+REGRESSION_RATIO = 1.2
+REGRESSION_MIN_MS = 1.0
+
+
+# ---------------------------------------------------------
+# PENGUKURAN
+# ---------------------------------------------------------
+
+def measure(func, setup=None, repeat=5):
+    """Jalankan `setup()` lalu `func()` sebanyak `repeat` kali; hanya `func` yang diukur."""
+    times = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        t0 = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - t0)
+    return {
+        'min_ms': min(times) * 1000,
+        'median_ms': statistics.median(times) * 1000,
+        'mean_ms': statistics.fmean(times) * 1000,
+        'repeat': repeat,
+    }
+
+
+def measure_modes(name, scale, cold, warm):
+    """Hasil cold & warm; benchmark yang gagal (mis. batas skala) dicatat sebagai error, suite tetap jalan."""
+    try:
+        return [dict(name=name, scale=scale, mode='cold', **cold()),
+                dict(name=name, scale=scale, mode='warm', **warm())]
+    except Exception as e:
+        print(f'{name} ({scale}x) gagal: {type(e).__name__}: {str(e).splitlines()[0]}', file=sys.stderr)
+        return [dict(name=name, scale=scale, mode='error', error=f'{type(e).__name__}: {str(e).splitlines()[0]}')]
+
+
+def repeats_for(scale, repeat):
+    # Skala besar bisa memakan detik per iterasi; cukup beberapa sampel
+    return repeat if scale < 100 else min(repeat, 2)
+
+
+# ---------------------------------------------------------
+# DATA SINTETIS
+# ---------------------------------------------------------
+# Panel negara-tahun (mva, growth, hours_ilo, WDI) diperbesar ke belakang sepanjang sumbu tahun:
+# salinan ke-i digeser i * rentang tahun, sehingga tahun terbaru dan himpunan negara tetap sama
+# (hasil loader identik, hanya volume baris yang naik). Tabel per negara tanpa kolom Year
+# dibatasi jumlah negara (~200) dan tidak diskalakan.
+
+def synthetic_tables(scale):
+    tables = {}
+    for name in data_store.SOURCES:
+        df = data_store.get_frame(name)
+        if scale > 1 and 'Year' in df.columns:
+            year = df['Year'].astype('int64')
+            span = int(year.max() - year.min() + 1)
+            df = pd.concat([df.assign(Year=year - span * i) for i in range(scale)], ignore_index=True)
+        tables[name] = pa.Table.from_pandas(df, preserve_index=False).replace_schema_metadata(None)
+    return tables
+
+
+def reset_data(tables):
+    """Kondisi cold: data store dikosongkan lalu diisi tabel sintetis (atau dibaca ulang untuk 1x)."""
+    data_store.clear()
+    for name, table in (tables or {}).items():
+        data_store.set_table(name, table)
+
+
+def scale_inputs(obj, scale):
+    """Perbesar input figure: setiap DataFrame diulang `scale` kali, nilai lain apa adanya."""
+    if scale == 1:
+        return obj
+    if isinstance(obj, pd.DataFrame):
+        return pd.concat([obj] * scale, ignore_index=True)
+    if isinstance(obj, tuple):
+        return tuple(scale_inputs(item, scale) for item in obj)
+    if isinstance(obj, dict):
+        return {key: scale_inputs(value, scale) for key, value in obj.items()}
+    return obj
+
+
+# ---------------------------------------------------------
+# SUITE
+# ---------------------------------------------------------
+
+def bench_loaders(scale, repeat, selected):
+    results = []
+    tables = synthetic_tables(scale) if scale > 1 else None
+    for label, loader, args in LOADERS:
+        name = f'loader/{label}'
+        if not selected(name):
+            continue
+
+        def cold_setup():
+            loader.clear()
+            reset_data(tables)
+
+        def warm():
+            loader(*args)
+            return measure(lambda: loader(*args), repeat=repeat)
+
+        results += measure_modes(
+            name, scale,
+            lambda: measure(lambda: loader(*args), setup=cold_setup, repeat=repeats_for(scale, repeat)),
+            warm)
+        loader.clear()
+    reset_data(None)
+    return results
+
+
+def bench_figures(figure_inputs, scale, repeat, selected):
+    results = []
+    for label, (builder, inputs, params) in figure_inputs.items():
+        name = f'figure/{label}'
+        if not selected(name):
+            continue
+        inputs, params = scale_inputs(inputs, scale), scale_inputs(params, scale)
+        def warm():
+            figure_cache.clear()
+            figure_cache.cached_figure(builder, *inputs, **params)
+            return measure(lambda: figure_cache.cached_figure(builder, *inputs, **params), repeat=repeat)
+
+        results += measure_modes(
+            name, scale, lambda: measure(lambda: builder(*inputs, **params), repeat=repeats_for(scale, repeat)), warm)
+    figure_cache.clear()
+    return results
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(scales=(1,), repeat=5, pattern=None):
+    selected = (lambda name: pattern in name) if pattern else (lambda name: True)
+    # Perekaman input figure menjalankan kedua aplikasi; dilewati jika hanya loader yang dipilih
+    figure_inputs = {} if pattern and pattern.startswith('loader') else headless.record_figure_calls()
+    results = []
+    for scale in scales:
+        print(f'--- skala {scale}x', file=sys.stderr)
+        results += bench_loaders(scale, repeat, selected)
+        results += bench_figures(figure_inputs, scale, repeat, selected)
+    return {'revision': git_revision(), 'python': sys.version.split()[0],
+            'pandas': pd.__version__, 'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'scales': list(scales), 'results': results}
+
+
+def compare(current, baseline):
+    """Cetak rasio median terhadap hasil lain; mengembalikan jumlah regresi."""
+    base = {(r['name'], r['scale'], r['mode']): r for r in baseline['results']}
+    regressions = 0
+    print(f"\nPerbandingan terhadap {baseline.get('revision')} (rasio median, >{REGRESSION_RATIO:g}x = regresi)")
+    for r in current['results']:
+        old = base.get((r['name'], r['scale'], r['mode']))
+        if r['mode'] == 'error':
+            regressions += (r['name'], r['scale'], 'error') not in base
+            print(f"{r['name']:48s} {r['scale']:>5}x GAGAL {r['error']}")
+            continue
+        if old is None or old['median_ms'] == 0:
+            continue
+        ratio = r['median_ms'] / old['median_ms']
+        slower = ratio > REGRESSION_RATIO and r['median_ms'] - old['median_ms'] > REGRESSION_MIN_MS
+        flag = '  <-- REGRESI' if slower else ''
+        regressions += bool(flag)
+        print(f"{r['name']:48s} {r['scale']:>5}x {r['mode']:4s} {old['median_ms']:10.2f} -> "
+              f"{r['median_ms']:10.2f} ms  ({ratio:5.2f}x){flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scales', type=int, nargs='+', default=[1], help='faktor skala data sintetis')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--filter', dest='pattern', help="hanya benchmark yang namanya memuat teks ini")
+    parser.add_argument('--output', type=Path, help='default: benchmarks/results/bench-<revisi>.json')
+    parser.add_argument('--compare', type=Path, help='file hasil sebelumnya untuk dibandingkan')
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.CRITICAL)
+    warnings.simplefilter('ignore')
+    result = run(scales=args.scales, repeat=args.repeat, pattern=args.pattern)
+
+    output = args.output or RESULTS_DIR / f"bench-{result['revision'] or 'local'}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2), encoding='utf-8')
+
+    print(f"{'benchmark':48s} {'skala':>6s} {'mode':4s} {'median ms':>10s} {'min ms':>10s}")
+    for r in result['results']:
+        if r['mode'] == 'error':
+            print(f"{r['name']:48s} {r['scale']:>5}x GAGAL {r['error']}")
+            continue
+        print(f"{r['name']:48s} {r['scale']:>5}x {r['mode']:4s} {r['median_ms']:10.2f} {r['min_ms']:10.2f}")
+    print(f'Hasil ditulis ke {output}')
+
+    if args.compare:
+        regressions = compare(result, json.loads(args.compare.read_text(encoding='utf-8')))
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
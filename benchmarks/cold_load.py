@@ -0,0 +1,99 @@
+"""Waktu cold start pemuatan semua sumber data: serial vs thread pool vs process pool, dengan jalur kritis.
+
+Contoh:
+    python benchmarks/cold_load.py                   # parse file sumber (tanpa snapshot)
+    python benchmarks/cold_load.py --snapshot        # baca dari data_snapshot.arrow jika valid
+    python benchmarks/cold_load.py --modes thread process --repeat 5
+    python benchmarks/cold_load.py --disk-cache      # worker kedua: tabel dari disk_cache yang sudah diisi
+
+Setiap pengukuran dijalankan di proses baru agar tidak ada tabel, modul atau pool yang sudah hangat.
+Tanpa --disk-cache, cache disk antar-proses dimatikan agar yang diukur benar-benar parsing.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).resolve().parent / 'results'
+MODES = ('serial', 'thread', 'process')
+
+_LOAD_CODE = r"""
+import json, logging, sys, time, warnings
+logging.disable(logging.CRITICAL)
+warnings.simplefilter('ignore')
+import data_store
+
+mode, use_snapshot = sys.argv[1], sys.argv[2] == '1'
+names = list(data_store.SOURCES)
+t0 = time.perf_counter()
+if mode == 'serial':
+    for name in names:
+        data_store._load(name, use_snapshot=use_snapshot)
+else:
+    futures = data_store.load_async(names, processes=mode == 'process', use_snapshot=use_snapshot)
+    for future in futures.values():
+        future.result()
+total = time.perf_counter() - t0
+report, critical = data_store.load_report()
+print(json.dumps({'total_ms': total * 1000, 'critical': critical, 'datasets': report.to_dict('records')}))
+"""
+
+
+def measure(mode, use_snapshot, cache_dir=''):
+    env = {**os.environ, 'DASHBOARD_CACHE_DIR': cache_dir}
+    out = subprocess.run([sys.executable, '-c', _LOAD_CODE, mode, '1' if use_snapshot else '0'],
+                         cwd=ROOT, env=env, capture_output=True, text=True, check=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def run(modes=MODES, repeat=3, use_snapshot=False, disk_cache=False):
+    result = {'snapshot': use_snapshot, 'disk_cache': disk_cache, 'modes': {}}
+    with tempfile.TemporaryDirectory(prefix='cold_load_cache_') as cache_dir:
+        if disk_cache:
+            # Worker pertama mengisi cache; yang diukur adalah worker-worker berikutnya
+            measure('serial', use_snapshot, cache_dir)
+        for mode in modes:
+            result['modes'][mode] = _summarize([measure(mode, use_snapshot, cache_dir if disk_cache else '')
+                                                for _ in range(repeat)])
+    return result
+
+
+def _summarize(runs):
+    median = sorted(runs, key=lambda r: r['total_ms'])[len(runs) // 2]
+    return {
+        'total_ms': statistics.median(r['total_ms'] for r in runs),
+        'critical': median['critical'],
+        'datasets': median['datasets'],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--modes', nargs='+', choices=MODES, default=list(MODES))
+    parser.add_argument('--repeat', type=int, default=3, help='jumlah proses baru per mode (median)')
+    parser.add_argument('--snapshot', action='store_true', help='izinkan pembacaan dari snapshot Arrow')
+    parser.add_argument('--disk-cache', action='store_true', help='ukur worker yang memakai disk_cache terisi')
+    parser.add_argument('--output', type=Path, default=RESULTS_DIR / 'cold_load.json')
+    args = parser.parse_args(argv)
+
+    result = run(modes=args.modes, repeat=args.repeat, use_snapshot=args.snapshot, disk_cache=args.disk_cache)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(result, indent=2), encoding='utf-8')
+
+    for mode, r in result['modes'].items():
+        critical = next(d for d in r['datasets'] if d['dataset'] == r['critical'])
+        print(f"{mode:8s} total {r['total_ms']:8.1f} ms | jalur kritis: {r['critical']} "
+              f"({critical['file']}, antre {critical['wait_ms']:.1f} ms + muat {critical['load_ms']:.1f} ms)")
+        for d in r['datasets'][:4]:
+            print(f"    {d['dataset']:12s} {d['via']:8s} selesai {d['end_ms']:8.1f} ms  (muat {d['load_ms']:7.1f} ms)")
+    print(f'Hasil ditulis ke {args.output}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
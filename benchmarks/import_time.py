@@ -0,0 +1,155 @@
+"""Profil waktu import (`python -X importtime`) dan waktu render pertama untuk uas.py & debunk.py.
+
+Contoh:
+    python benchmarks/import_time.py                 # tulis benchmarks/results/import_time.json
+    python benchmarks/import_time.py --repeat 5 --top 15
+"""
+import argparse
+import ast
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).resolve().parent / 'results'
+APPS = ('uas.py', 'debunk.py')
+
+# Modul yang sudah dimuat oleh server Streamlit sebelum skrip aplikasi dijalankan
+SERVER_PRELOADED = ('streamlit',)
+
+# Dijalankan di proses baru: waktu sampai elemen pertama (set_page_config) dan sampai run pertama selesai
+_FIRST_RENDER_CODE = r"""
+import json, logging, sys, time
+logging.disable(logging.CRITICAL)
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+first = []
+_orig = st.set_page_config
+def _mark(*args, **kwargs):
+    if not first:
+        first.append(time.perf_counter())
+    return _orig(*args, **kwargs)
+st.set_page_config = _mark
+
+at = AppTest.from_file(sys.argv[1], default_timeout=300)
+t0 = time.perf_counter()
+at.run()
+t1 = time.perf_counter()
+print(json.dumps({
+    'first_element_s': (first[0] - t0) if first else None,
+    'first_run_s': t1 - t0,
+    'exceptions': [e.value for e in at.exception],
+}))
+"""
+
+
+def top_level_imports(path):
+    """Nama modul yang di-import di level teratas skrip (urutan kemunculan, tanpa duplikat)."""
+    tree = ast.parse(Path(path).read_text(encoding='utf-8'))
+    names = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0:
+            names.append(node.module)
+    return list(dict.fromkeys(names))
+
+
+def parse_importtime(stderr):
+    """Baris `import time: self | cumulative | package` -> list dict (depth = level indentasi)."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, package = line[len('import time:'):].split('|')
+        name = package.rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append({'module': name.strip(), 'self_us': int(self_us), 'cumulative_us': int(cumulative_us),
+                     'depth': depth})
+    return rows
+
+
+def profile_imports(modules, preload=()):
+    """Jalankan `import modules` di proses baru dengan -X importtime.
+
+    Modul di `preload` di-import lebih dulu dan biayanya dilaporkan terpisah,
+    sehingga `total_us` hanya berisi biaya tambahan dari skrip aplikasi.
+    """
+    code = ''.join(f'import {m}\n' for m in preload)
+    code += 'import sys; sys.stderr.write("-- app --\\n")\n'
+    code += ''.join(f'import {m}\n' for m in modules)
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=ROOT,
+                          capture_output=True, text=True, check=True)
+    before, _, after = proc.stderr.partition('-- app --\n')
+    preload_rows, rows = parse_importtime(before), parse_importtime(after)
+    return {
+        'preload_us': sum(r['cumulative_us'] for r in preload_rows if r['depth'] == 0),
+        'total_us': sum(r['cumulative_us'] for r in rows if r['depth'] == 0),
+        'modules': rows,
+    }
+
+
+def first_render(app):
+    proc = subprocess.run([sys.executable, '-c', _FIRST_RENDER_CODE, str(ROOT / app)], cwd=ROOT,
+                          capture_output=True, text=True, check=True)
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(repeat=3, top=10):
+    result = {'revision': git_revision(), 'python': sys.version.split()[0],
+              'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'), 'repeat': repeat, 'apps': {}}
+    for app in APPS:
+        modules = top_level_imports(ROOT / app)
+        profiles = [profile_imports(modules, preload=SERVER_PRELOADED) for _ in range(repeat)]
+        renders = [first_render(app) for _ in range(repeat)]
+        # Profil dengan total median dipakai untuk rincian per modul
+        median_profile = sorted(profiles, key=lambda p: p['total_us'])[len(profiles) // 2]
+        heaviest = sorted((r for r in median_profile['modules'] if r['depth'] == 0),
+                          key=lambda r: r['cumulative_us'], reverse=True)[:top]
+        result['apps'][app] = {
+            'top_level_imports': modules,
+            'import_total_ms': statistics.median(p['total_us'] for p in profiles) / 1000,
+            'server_preload_ms': statistics.median(p['preload_us'] for p in profiles) / 1000,
+            'first_element_ms': statistics.median(r['first_element_s'] for r in renders) * 1000,
+            'first_run_ms': statistics.median(r['first_run_s'] for r in renders) * 1000,
+            'exceptions': renders[-1]['exceptions'],
+            'heaviest_imports': [{'module': r['module'], 'cumulative_ms': r['cumulative_us'] / 1000}
+                                 for r in heaviest],
+        }
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=3, help='jumlah proses baru per pengukuran (median)')
+    parser.add_argument('--top', type=int, default=10, help='jumlah import terberat yang dicatat')
+    parser.add_argument('--output', type=Path, default=RESULTS_DIR / 'import_time.json')
+    args = parser.parse_args(argv)
+
+    result = run(repeat=args.repeat, top=args.top)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(result, indent=2), encoding='utf-8')
+
+    for app, r in result['apps'].items():
+        print(f"{app:10s} import {r['import_total_ms']:8.1f} ms | elemen pertama {r['first_element_ms']:8.1f} ms"
+              f" | run pertama {r['first_run_ms']:8.1f} ms")
+        for imp in r['heaviest_imports'][:5]:
+            print(f"    {imp['module']:28s} {imp['cumulative_ms']:8.1f} ms")
+    print(f'Hasil ditulis ke {args.output}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,40 @@
+"""Compile semua sumber xlsx/csv menjadi satu snapshot biner (data_snapshot.arrow).
+
+Pemakaian:
+    python build_snapshot.py          # tulis ulang snapshot
+    python build_snapshot.py --check  # exit 1 jika snapshot tidak ada / basi
+"""
+import argparse
+import sys
+import time
+
+import data_store
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--check', action='store_true', help='hanya cek apakah snapshot masih valid')
+    parser.add_argument('--output', default=str(data_store.SNAPSHOT_PATH), help='lokasi file snapshot')
+    args = parser.parse_args(argv)
+
+    if args.check:
+        snap = data_store.read_snapshot_manifest(args.output)
+        if snap is None:
+            print(f"{args.output}: tidak ada")
+            return 1
+        fresh = snap[0].get('version') == data_store.SNAPSHOT_VERSION and \
+            snap[0].get('input_hash') == data_store.input_hash()
+        print(f"{args.output}: {'valid' if fresh else 'BASI'} (hash {snap[0]['input_hash'][:12]})")
+        return 0 if fresh else 1
+
+    t0 = time.perf_counter()
+    manifest = data_store.write_snapshot(args.output)
+    for name, (offset, length) in manifest['tables'].items():
+        print(f"  {name:<12} {length / 1024:8.1f} KB  <- {data_store.SOURCES[name]}")
+    print(f"{args.output} v{manifest['version']} hash {manifest['input_hash'][:12]} "
+          f"({time.perf_counter() - t0:.2f}s)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,134 @@
+"""Layout memori ringkas untuk hasil loader: kategori, int16/float32, dan satu instance bersama per proses.
+
+`st.cache_data` mem-pickle hasil loader dan menyalinnya penuh untuk setiap sesi. Loader yang memakai
+`shared_data` disimpan sekali lewat `st.cache_resource` dalam bentuk ringkas (per versi file sumber);
+setiap pemanggil menerima salinan dangkal. Dengan Copy-on-Write pandas (default sejak pandas 3,
+dinyalakan eksplisit di modul ini untuk pandas 2), perubahan oleh pemanggil hanya menyalin kolom
+yang diubah dan tidak pernah menyentuh instance bersama.
+"""
+import functools
+import threading
+
+import numpy as np
+import pandas as pd
+
+import data_store
+import instrument
+
+# Kolom teks menjadi categorical jika jumlah nilai unik <= rasio ini terhadap jumlah baris
+CATEGORY_MAX_RATIO = 0.5
+YEAR_COLUMNS = ('Year', 'Tahun')
+
+_INT16 = np.iinfo(np.int16)
+
+# Salinan dangkal dari `shared_data` hanya aman dengan Copy-on-Write: di pandas 2 tanpa CoW,
+# `df[col] = ...` atau `df.loc[...] = ...` oleh satu sesi akan menulis ke instance bersama
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
+# Nama loader -> ukuran (byte) hasil asli vs ringkas, diisi saat cache miss
+_sizes = {}
+_sizes_lock = threading.Lock()
+
+
+def compact_frame(df):
+    """Salinan `df` dengan teks berulang sebagai categorical, tahun int16 dan float64 sebagai float32."""
+    columns = {}
+    for col in df.columns:
+        s = df[col]
+        if col in YEAR_COLUMNS and pd.api.types.is_integer_dtype(s) and not s.empty \
+                and _INT16.min <= s.min() and s.max() <= _INT16.max:
+            s = s.astype('int16')
+        elif s.dtype == np.float64:
+            s = s.astype('float32')
+        elif (pd.api.types.is_object_dtype(s) or pd.api.types.is_string_dtype(s)) and len(s) \
+                and s.nunique(dropna=True) <= CATEGORY_MAX_RATIO * len(s):
+            s = s.astype('category')
+        columns[col] = s
+    return pd.DataFrame(columns, index=df.index)
+
+
+def frame_bytes(obj):
+    """Ukuran memori (deep) semua DataFrame di dalam `obj`."""
+    if isinstance(obj, pd.DataFrame):
+        return int(obj.memory_usage(deep=True).sum())
+    if isinstance(obj, (list, tuple)):
+        return sum(frame_bytes(item) for item in obj)
+    if isinstance(obj, dict):
+        return sum(frame_bytes(item) for item in obj.values())
+    return 0
+
+
+def _map_frames(obj, func):
+    if isinstance(obj, pd.DataFrame):
+        return func(obj)
+    if isinstance(obj, (list, tuple)):
+        return type(obj)(_map_frames(item, func) for item in obj)
+    if isinstance(obj, dict):
+        return {key: _map_frames(value, func) for key, value in obj.items()}
+    return obj
+
+
+def shared_data(func=None, *, datasets=()):
+    """Pengganti `instrument.cache_data` untuk loader read-only: hasil ringkas, disimpan sekali per proses.
+
+    Kunci cache memuat versi file sumber `datasets` (lihat data_store.version). Saat watcher menukar
+    salah satu dataset itu, setiap argumen yang pernah dipanggil dibangun ulang di thread watcher,
+    baru kemudian entri versi lama dibuang; loader lain tidak tersentuh.
+    """
+    if func is None:
+        return lambda f: shared_data(f, datasets=datasets)
+    datasets = tuple(datasets)
+
+    @functools.wraps(func)
+    def build(source_versions, *args, **kwargs):
+        result = func(*args, **kwargs)
+        compacted = _map_frames(result, compact_frame)
+        with _sizes_lock:
+            _sizes[func.__name__] = (frame_bytes(result), frame_bytes(compacted))
+        return compacted
+
+    cached = instrument.cache_resource(build)
+    # Argumen yang pernah dipanggil -> versi sumber entri cache-nya
+    calls = {}
+    calls_lock = threading.Lock()
+
+    def fetch(args, kwargs):
+        source_versions = data_store.versions(datasets)
+        key = (args, tuple(sorted(kwargs.items())))
+        with calls_lock:
+            calls[key] = source_versions
+        return cached(source_versions, *args, **kwargs)
+
+    @functools.wraps(func)
+    def loader(*args, **kwargs):
+        return _map_frames(fetch(args, kwargs), lambda df: df.copy(deep=False))
+
+    def rebuild(name):
+        if name not in datasets:
+            return
+        with calls_lock:
+            stale = dict(calls)
+        for (args, kwargs), old_versions in stale.items():
+            fetch(args, dict(kwargs))
+            if old_versions != data_store.versions(datasets):
+                cached.clear(old_versions, *args, **dict(kwargs))
+
+    def clear():
+        with calls_lock:
+            calls.clear()
+        cached.clear()
+
+    data_store.on_reload(rebuild)
+    loader.clear = clear
+    loader.datasets = datasets
+    return loader
+
+
+def report():
+    """Per loader: ukuran hasil asli (salinan per sesi st.cache_data) vs instance bersama yang ringkas."""
+    with _sizes_lock:
+        sizes = dict(_sizes)
+    rows = [{'loader': name, 'asli_bytes': before, 'ringkas_bytes': after, 'hemat_ringkas_bytes': before - after}
+            for name, (before, after) in sorted(sizes.items())]
+    return pd.DataFrame(rows, columns=['loader', 'asli_bytes', 'ringkas_bytes', 'hemat_ringkas_bytes'])
@@ -0,0 +1,133 @@
+"""Indeks kanonik nama negara -> kode ISO3, dipakai bersama oleh semua join antar dataset."""
+import functools
+import re
+import unicodedata
+
+import pandas as pd
+
+import data_store
+import wdi
+
+# Alias yang tidak bisa diturunkan dari nama resmi WDI (Walk Free, ITUC, ILO, IMF, dll.)
+ALIASES = {
+    'Bahamas': 'BHS',
+    'Bolivia (Plurinational State of)': 'BOL',
+    'Brunei': 'BRN',
+    'Cape Verde': 'CPV',
+    'Congo': 'COG',
+    'Congo (Republic of)': 'COG',
+    'Republic of the Congo': 'COG',
+    'Congo (Democratic Republic of)': 'COD',
+    'Congo, Democratic Republic of the': 'COD',
+    'Democratic Republic of the Congo': 'COD',
+    'DR Congo': 'COD',
+    'Cook Islands': 'COK',
+    'Czech Republic (Czechia)': 'CZE',
+    'Czech Republic': 'CZE',
+    'Egypt': 'EGY',
+    'Falkland Islands, Malvinas': 'FLK',
+    'Gambia': 'GMB',
+    'Hong Kong': 'HKG',
+    'Hong Kong, China': 'HKG',
+    'Iran': 'IRN',
+    'Iran (Islamic Republic of)': 'IRN',
+    'Jersey': 'JEY',
+    'Korea (Republic of)': 'KOR',
+    'Republic of Korea': 'KOR',
+    'South Korea': 'KOR',
+    'North Korea': 'PRK',
+    'Kyrgyzstan': 'KGZ',
+    'Lao People\'s Democratic Republic': 'LAO',
+    'Laos': 'LAO',
+    'Macao': 'MAC',
+    'Macao, China': 'MAC',
+    'Micronesia': 'FSM',
+    'Micronesia (Federated States of)': 'FSM',
+    'Montserrat': 'MSR',
+    'Niue': 'NIU',
+    'Occupied Palestinian Territory': 'PSE',
+    'Palestine': 'PSE',
+    'State of Palestine': 'PSE',
+    'Puerto Rico': 'PRI',
+    'Republic of Moldova': 'MDA',
+    'Réunion': 'REU',
+    'Russia': 'RUS',
+    'Saint Kitts & Nevis': 'KNA',
+    'Saint Lucia': 'LCA',
+    'Saint Vincent and the Grenadines': 'VCT',
+    'St. Vincent & Grenadines': 'VCT',
+    'Sao Tome & Principe': 'STP',
+    'Slovakia': 'SVK',
+    'Somalia': 'SOM',
+    'Syria': 'SYR',
+    'Taiwan': 'TWN',
+    'Tanzania, United Republic of': 'TZA',
+    'Turkey': 'TUR',
+    'United Kingdom of Great Britain and Northern Ireland': 'GBR',
+    'United States of America': 'USA',
+    'Venezuela': 'VEN',
+    'Venezuela (Bolivarian Republic of)': 'VEN',
+    'Vietnam': 'VNM',
+    'Wallis and Futuna': 'WLF',
+    'Yemen': 'YEM',
+}
+
+
+def normalize_name(name):
+    """Kunci pencarian: tanpa aksen, huruf kecil, '&' -> 'and', spasi dirapikan."""
+    name = unicodedata.normalize('NFKD', str(name))
+    name = ''.join(ch for ch in name if not unicodedata.combining(ch))
+    name = name.casefold().replace('&', ' and ').replace('\u2019', "'")
+    return re.sub(r'\s+', ' ', name).strip()
+
+
+@functools.lru_cache(maxsize=None)
+def country_index():
+    """Dict nama ternormalisasi -> ISO3, dibangun sekali dari WDI + ALIASES."""
+    index = {}
+    for name in data_store.WDI_VALUE_NAMES:
+        codes = wdi.read_country_codes(data_store.BASE_DIR / data_store.SOURCES[name])
+        for country, code in codes.itertuples(index=False):
+            index[normalize_name(country)] = code
+    for alias, code in ALIASES.items():
+        index[normalize_name(alias)] = code
+    return index
+
+
+@functools.lru_cache(maxsize=None)
+def iso3_dtype():
+    """Satu CategoricalDtype bersama agar join antar tabel memakai kode integer yang sama."""
+    return pd.CategoricalDtype(sorted(set(country_index().values())))
+
+
+@data_store.on_reload
+def _refresh_index(name):
+    # Daftar negara WDI berubah: indeks nama & dtype ISO3 dibangun ulang saat dipakai berikutnya
+    if name in data_store.WDI_VALUE_NAMES:
+        country_index.cache_clear()
+        iso3_dtype.cache_clear()
+
+
+def to_iso3(names):
+    """Petakan Series nama negara ke kategori ISO3; nama yang tidak dikenal menjadi NaN."""
+    index = country_index()
+    uniques = pd.unique(names)
+    lookup = {name: index.get(normalize_name(name)) for name in uniques if pd.notna(name)}
+    return names.map(lookup).astype(iso3_dtype())
+
+
+def with_iso3(df, col):
+    """Salinan `df` dengan kolom 'ISO3' (categorical) dari kolom nama negara `col`."""
+    df = df.copy()
+    df['ISO3'] = to_iso3(df[col])
+    return df
+
+
+def merge_on_iso3(left, right, **kwargs):
+    """`pd.merge` pada kolom ISO3 tanpa baris yang ISO3-nya NaN (pandas memasangkan NaN dengan NaN)."""
+    return pd.merge(left.dropna(subset=['ISO3']), right.dropna(subset=['ISO3']), on='ISO3', **kwargs)
+
+
+def iso3(name):
+    """ISO3 untuk satu nama negara (None jika tidak dikenal)."""
+    return country_index().get(normalize_name(name))
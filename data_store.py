@@ -0,0 +1,491 @@
+import hashlib
+import itertools
+import json
+import logging
+import multiprocessing
+import os
+import re
+import struct
+import threading
+import time
+import warnings
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+import disk_cache
+import wdi
+
+# ---------------------------------------------------------
+# DATA STORE: SETIAP FILE SUMBER DI-PARSE SEKALI PER PROSES
+# ---------------------------------------------------------
+
+BASE_DIR = Path(__file__).resolve().parent
+
+# Nama dataset -> file sumber (World Bank, ILO, ITUC, Walk Free, Kemenkumham)
+SOURCES = {
+    'mva': 'clean_mva_share.xlsx',
+    'growth': 'clean_industrial_growth.xlsx',
+    'ituc_score': 'clean_ituc_score.xlsx',
+    'hours_ilo': 'clean_hours_ilo.xlsx',
+    'gdp': 'clean_gdp.csv',
+    'slavery': 'clean_data_modern_slavery.csv',
+    'tahanan': 'Tahanan_Indo.csv',
+    'ituc': 'ITUC.csv',
+    'ppp': 'PPP.csv',
+    'labor_force': 'Labor force.csv',
+}
+
+# Dataset -> kolom nama negara (sumber kode ISO3 untuk join & seleksi)
+COUNTRY_COLUMNS = {
+    'mva': 'Country Name',
+    'growth': 'Country Name',
+    'ituc_score': 'Country',
+    'hours_ilo': 'Country',
+    'gdp': 'Country',
+    'slavery': 'Country',
+    'ituc': 'Country',
+    'ppp': 'Country Name',
+    'labor_force': 'Country Name',
+}
+
+# File mentah WDI (format lebar) -> nama kolom nilai setelah di-melt ke long-form
+WDI_VALUE_NAMES = {
+    'ppp': 'GDP_PPP_Capita',
+    'labor_force': 'Labor_Force',
+}
+# Kode indikator yang diambil dari file WDI; bulk export berisi banyak indikator dalam satu file
+WDI_INDICATORS = {
+    'ppp': 'NY.GDP.PCAP.PP.CD',
+    'labor_force': 'SL.TLF.TOTL.IN',
+}
+
+# Snapshot biner hasil `python build_snapshot.py`
+SNAPSHOT_PATH = BASE_DIR / 'data_snapshot.arrow'
+SNAPSHOT_VERSION = 2
+_MAGIC = b'DASNAP01'
+
+# Interval (detik) watcher file sumber; 0 mematikan watcher
+WATCH_INTERVAL = float(os.environ.get('DASHBOARD_WATCH_INTERVAL', '5'))
+
+logger = logging.getLogger('dashboard.data_store')
+
+_tables = {}
+# Versi tabel yang sedang dilayani (kunci cache loader): (mtime_ns, size) file saat isinya terakhir
+# berubah, atau ('memory', n) dari set_table. _signatures: (mtime_ns, size) terakhir yang dicek watcher.
+_versions = {}
+_signatures = {}
+_memory_versions = itertools.count()
+_table_locks = {name: threading.Lock() for name in SOURCES}
+_snapshot = None
+_snapshot_checked = False
+# Dataset yang file sumbernya berubah sejak proses mulai: snapshot tidak lagi dipakai untuknya
+_changed_sources = set()
+_snapshot_lock = threading.Lock()
+
+
+# ---------------------------------------------------------
+# PEMBERSIHAN NUMERIK: SEKALI SAAT INGEST
+# ---------------------------------------------------------
+# Kolom teks yang seluruh isinya angka (mis. "277,236" di Tahanan_Indo.csv) diparse di sini,
+# sehingga loader menerima kolom numerik. Kolom yang sudah numerik tidak disentuh.
+
+_NUMBER_RE = re.compile(r'[-+]?(\d{1,3}(,\d{3})+|\d+)(\.\d+)?')
+_INT32 = np.iinfo(np.int32)
+
+
+def _numeric_text(series):
+    """Nilai teks kolom `series` (tanpa NaN) jika semuanya angka berpemisah ribuan, selain itu None."""
+    if not (pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)):
+        return None
+    text = series.str.strip()
+    # Nilai non-teks (campuran tipe) menjadi NaN di .str, kolom seperti itu tidak diparse
+    if text.isna().sum() != series.isna().sum():
+        return None
+    matched = text.dropna().str.fullmatch(_NUMBER_RE)
+    if matched.empty or not matched.all():
+        return None
+    return text.str.replace(',', '', regex=False)
+
+
+def _compact(values):
+    """Bilangan bulat yang muat -> Int32 (nullable), bulat besar -> Int64, selain itu float64."""
+    numbers = values.dropna()
+    if not (numbers == numbers.round()).all():
+        return values
+    if numbers.empty or (numbers.min() >= _INT32.min and numbers.max() <= _INT32.max):
+        return values.astype('Int32')
+    return values.astype('Int64')
+
+
+def clean_numeric(df):
+    """Parse kolom teks numerik `df` menjadi tipe numerik ringkas; kolom lain apa adanya."""
+    for col in df.columns:
+        text = _numeric_text(df[col])
+        if text is not None:
+            df[col] = _compact(pd.to_numeric(text))
+    return df
+
+
+def _parse_source(name):
+    path = BASE_DIR / SOURCES[name]
+    if name in WDI_VALUE_NAMES:
+        df = wdi.read_wdi(path, value_name=WDI_VALUE_NAMES[name], indicator=WDI_INDICATORS[name])
+    elif path.suffix == '.xlsx':
+        df = pd.read_excel(path)
+    else:
+        df = pd.read_csv(path)
+    df.columns = df.columns.str.strip()
+    df = clean_numeric(df)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    # Normalisasi tipe: semua teks menjadi string Arrow biasa, tanpa metadata pandas
+    schema = pa.schema([
+        pa.field(f.name, pa.string() if pa.types.is_large_string(f.type) else f.type)
+        for f in table.schema
+    ])
+    return table.cast(schema).replace_schema_metadata(None)
+
+
+# ---------------------------------------------------------
+# SNAPSHOT: SATU FILE ARROW IPC BERVERSI + HASH INPUT
+# ---------------------------------------------------------
+# Layout: MAGIC | panjang header (uint64 LE) | header JSON | stream IPC per tabel.
+# Header di-pad ke kelipatan 8 byte agar buffer Arrow tetap aligned saat di-mmap.
+
+def input_hash(names=None):
+    """SHA-256 dari isi file sumber, dipakai untuk mendeteksi snapshot yang basi."""
+    h = hashlib.sha256(str(SNAPSHOT_VERSION).encode())
+    for name in sorted(names or SOURCES):
+        h.update(name.encode())
+        h.update((BASE_DIR / SOURCES[name]).read_bytes())
+    return h.hexdigest()
+
+
+def write_snapshot(path=SNAPSHOT_PATH):
+    """Parse semua sumber dan tulis satu snapshot Arrow IPC; mengembalikan manifest."""
+    manifest = {'version': SNAPSHOT_VERSION, 'input_hash': input_hash(), 'tables': {}}
+    blobs = []
+    offset = 0
+    for name in SOURCES:
+        table = _parse_source(name)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        buf = sink.getvalue()
+        manifest['tables'][name] = [offset, buf.size]
+        offset += buf.size
+        blobs.append(buf)
+
+    header = json.dumps(manifest).encode()
+    header += b' ' * (-len(header) % 8)
+    path = Path(path)
+    tmp = path.with_suffix('.tmp')
+    with open(tmp, 'wb') as f:
+        f.write(_MAGIC + struct.pack('<Q', len(header)) + header)
+        for buf in blobs:
+            f.write(buf)
+    os.replace(tmp, path)
+    return manifest
+
+
+def read_snapshot_manifest(path=SNAPSHOT_PATH):
+    """Memory-map snapshot; mengembalikan (manifest, buffer data) atau None."""
+    path = Path(path)
+    if not path.exists():
+        return None
+    buf = pa.memory_map(str(path)).read_buffer()
+    if buf.size < 16 or buf.slice(0, 8).to_pybytes() != _MAGIC:
+        return None
+    (n,) = struct.unpack('<Q', buf.slice(8, 8).to_pybytes())
+    manifest = json.loads(buf.slice(16, n).to_pybytes())
+    return manifest, buf.slice(16 + n)
+
+
+def _open_snapshot():
+    try:
+        snap = read_snapshot_manifest()
+        if snap is None:
+            return None
+        manifest = snap[0]
+        current = input_hash()
+    except (OSError, ValueError) as e:
+        # Snapshot rusak atau ada file sumber yang hilang/tak terbaca: perlakukan sebagai basi, sehingga
+        # setiap dataset dimuat sendiri-sendiri dan hanya loader dataset yang rusak jatuh ke fallback-nya
+        warnings.warn(f"{SNAPSHOT_PATH.name} tidak dipakai ({type(e).__name__}: {e}), "
+                      "kembali ke parsing file sumber.")
+        return None
+    if manifest.get('version') != SNAPSHOT_VERSION or manifest.get('input_hash') != current:
+        warnings.warn(f"{SNAPSHOT_PATH.name} basi, kembali ke parsing file sumber. "
+                      "Jalankan `python build_snapshot.py` untuk memperbarui.")
+        return None
+    return snap
+
+
+def _read_from_snapshot(name):
+    global _snapshot, _snapshot_checked
+    with _snapshot_lock:
+        if not _snapshot_checked:
+            _snapshot = _open_snapshot()
+            _snapshot_checked = True
+    if _snapshot is None or name not in _snapshot[0]['tables'] or name in _changed_sources:
+        return None
+    offset, length = _snapshot[0]['tables'][name]
+    return pa.ipc.open_stream(_snapshot[1].slice(offset, length)).read_all()
+
+
+# ---------------------------------------------------------
+# AKSES DATA
+# ---------------------------------------------------------
+
+def get_table(name):
+    """Tabel Arrow (immutable) untuk dataset `name`, di-parse sekali per proses."""
+    table = _tables.get(name)
+    if table is None:
+        table = _load(name)
+    return table
+
+
+def _load(name, processes=None, use_snapshot=True, submitted=None):
+    # Lock per dataset: pemuatan di latar belakang tidak menahan dataset lain; pemanggil yang meminta
+    # dataset yang sedang dimuat thread lain cukup menunggu lock ini
+    with _table_locks[name]:
+        table = _tables.get(name)
+        if table is not None:
+            return table
+        t0 = time.perf_counter()
+        # Signature diambil sebelum membaca: perubahan selama parsing tertangkap watcher berikutnya
+        signature = file_signature(name)
+        table = _read_from_snapshot(name) if use_snapshot else None
+        via = 'snapshot'
+        if table is None and processes is not None and SOURCES[name].endswith('.xlsx'):
+            table, via = _parse_shared(name, signature, lambda: processes.submit(_parse_source, name).result(),
+                                       'process')
+        elif table is None:
+            table, via = _parse_shared(name, signature, lambda: _parse_source(name), 'parse')
+        _tables[name] = table
+        _versions[name] = _signatures[name] = signature
+        _load_log[name] = {'submitted': t0 if submitted is None else submitted, 'start': t0,
+                           'end': time.perf_counter(), 'via': via}
+    return table
+
+
+def _parse_shared(name, signature, parse, via):
+    # Hasil parse dibagi antar proses Streamlit di host yang sama lewat disk_cache (Arrow IPC di-mmap);
+    # kunci: file sumber + (mtime_ns, size) + versi format parse
+    table, how = disk_cache.get_or_build('source', name, (SOURCES[name], signature, SNAPSHOT_VERSION), parse)
+    return table, 'disk' if how == 'disk' else via
+
+
+def get_frame(name):
+    """DataFrame baru dari tabel Arrow, aman untuk dimodifikasi pemanggil."""
+    return get_table(name).to_pandas()
+
+
+def is_loaded(name):
+    return name in _tables
+
+
+def set_table(name, table):
+    """Ganti tabel `name` di memori proses (mis. data sintetis untuk benchmark)."""
+    with _table_locks[name]:
+        _tables[name] = table
+        _versions[name] = ('memory', next(_memory_versions))
+        _signatures.pop(name, None)
+
+
+def clear(names=None):
+    """Lupakan tabel yang sudah dimuat; akses berikutnya membaca ulang dari snapshot/file sumber."""
+    for name in list(names or SOURCES):
+        with _table_locks[name]:
+            _tables.pop(name, None)
+            _versions.pop(name, None)
+            _signatures.pop(name, None)
+
+
+# ---------------------------------------------------------
+# PEMUATAN PARALEL & JALUR KRITIS
+# ---------------------------------------------------------
+# Sumber yang independen dimuat bersamaan di thread pool (I/O, snapshot, CSV). Parse xlsx oleh openpyxl
+# adalah Python murni yang memegang GIL; dengan DASHBOARD_PARSE_PROCESSES=1 parse xlsx dijalankan
+# di process pool sehingga benar-benar paralel di mesin multi-core.
+
+LOAD_WORKERS = len(SOURCES)
+PARSE_PROCESSES = os.environ.get('DASHBOARD_PARSE_PROCESSES', '').strip().lower() in ('1', 'true', 'on')
+
+# Nama dataset -> waktu (perf_counter) diminta, mulai, selesai, dan asal tabel
+_load_log = {}
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def process_context():
+    """Konteks multiprocessing untuk process pool: forkserver, atau spawn jika tidak tersedia.
+
+    fork dari proses yang punya thread loader/watcher aktif bisa mewarisi lock yang sedang dipegang
+    (anak macet selamanya); forkserver/spawn memulai worker dari proses bersih.
+    """
+    method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+    return multiprocessing.get_context(method)
+
+
+def _pool(kind):
+    with _pools_lock:
+        pool = _pools.get(kind)
+        if pool is None:
+            if kind == 'thread':
+                pool = ThreadPoolExecutor(max_workers=LOAD_WORKERS, thread_name_prefix='data-load')
+            else:
+                pool = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=process_context())
+            _pools[kind] = pool
+    return pool
+
+
+def load_async(names, processes=None, use_snapshot=True):
+    """Mulai memuat `names` bersamaan; mengembalikan {nama: Future} yang hasilnya pa.Table.
+
+    Dataset yang sudah dimuat langsung mendapat Future yang selesai. `get_table` pada dataset yang
+    sedang dimuat menunggu pemuatan itu, tidak mem-parse ulang.
+    """
+    processes = PARSE_PROCESSES if processes is None else processes
+    process_pool = _pool('process') if processes else None
+    futures = {}
+    for name in dict.fromkeys(names):
+        table = _tables.get(name)
+        if table is not None:
+            futures[name] = Future()
+            futures[name].set_result(table)
+        else:
+            futures[name] = _pool('thread').submit(_load, name, process_pool, use_snapshot, time.perf_counter())
+    return futures
+
+
+def load_report(names=None):
+    """Waktu pemuatan per dataset (ms relatif terhadap permintaan pertama) dan jalur kritisnya.
+
+    Sumber saling independen, jadi jalur kritis = dataset yang selesai paling akhir; `wait_ms`
+    menunjukkan berapa lama ia mengantre di pool sebelum mulai dimuat.
+    """
+    log = {name: entry for name, entry in _load_log.items() if names is None or name in names}
+    if not log:
+        return pd.DataFrame(), None
+    t0 = min(entry['submitted'] for entry in log.values())
+    rows = [{'dataset': name, 'file': SOURCES[name], 'via': entry['via'],
+             'wait_ms': (entry['start'] - entry['submitted']) * 1000,
+             'load_ms': (entry['end'] - entry['start']) * 1000,
+             'end_ms': (entry['end'] - t0) * 1000}
+            for name, entry in log.items()]
+    report = pd.DataFrame(rows).sort_values('end_ms', ascending=False, ignore_index=True)
+    return report, report.iloc[0]['dataset']
+
+
+def prefetch(names):
+    """Muat dataset `names` yang belum ada di latar belakang (thread pool); tidak memblokir pemanggil.
+
+    Galat pemuatan tersimpan di Future; pemanggil di foreground melaporkannya saat benar-benar butuh.
+    """
+    pending = [name for name in dict.fromkeys(names) if not is_loaded(name)]
+    if not pending:
+        return None
+    return load_async(pending)
+
+
+# ---------------------------------------------------------
+# VERSI SUMBER & WATCHER: RELOAD PER DATASET SAAT FILE BERUBAH
+# ---------------------------------------------------------
+# Loader dan indeks turunan dikunci pada `version(name)`. Watcher mem-parse ulang file yang berubah di
+# thread latar belakang; tabel lama tetap dilayani sampai tabel baru siap, lalu ditukar sekaligus
+# dan listener (`on_reload`) dipanggil hanya untuk dataset yang berubah.
+
+_listeners = []
+_watcher = None
+_watcher_lock = threading.Lock()
+
+
+def file_signature(name):
+    """(mtime_ns, size) file sumber `name`."""
+    stat = (BASE_DIR / SOURCES[name]).stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def version(name):
+    """Versi tabel `name` yang sedang dilayani (memuat tabel jika belum); None jika gagal dimuat."""
+    try:
+        get_table(name)
+    except Exception:
+        # Loader yang membaca dataset ini melaporkan galatnya sendiri (atau memakai fallback)
+        return None
+    return _versions.get(name)
+
+
+def versions(names):
+    """Versi beberapa dataset; yang belum dimuat dimuat bersamaan (load_async)."""
+    futures = load_async(names)
+    for future in futures.values():
+        # Menunggu saja; galat dilaporkan loader yang membaca dataset itu
+        future.exception()
+    return tuple(_versions.get(name) for name in names)
+
+
+def on_reload(callback):
+    """Daftarkan `callback(name)`, dipanggil di thread watcher setelah tabel `name` diganti versi baru."""
+    _listeners.append(callback)
+    return callback
+
+
+def reload(name):
+    """Parse ulang file sumber `name`; tukar tabel jika isinya berubah. Mengembalikan True jika ditukar."""
+    signature = file_signature(name)
+    # Worker lain yang melihat perubahan yang sama memakai hasil parse watcher pertama
+    table, _ = _parse_shared(name, signature, lambda: _parse_source(name), 'parse')
+    with _table_locks[name]:
+        current = _tables.get(name)
+        _changed_sources.add(name)
+        _signatures[name] = signature
+        if current is not None and current.equals(table):
+            # Hanya mtime yang berubah (mis. file disalin ulang): versi tetap, cache tetap berlaku
+            return False
+        _tables[name] = table
+        _versions[name] = signature
+    for callback in list(_listeners):
+        try:
+            callback(name)
+        except Exception:
+            logger.exception('listener reload %s gagal', name)
+    return True
+
+
+def check_sources():
+    """Reload dataset termuat yang file sumbernya berubah; mengembalikan nama yang ditukar."""
+    changed = []
+    for name, seen in list(_signatures.items()):
+        try:
+            if file_signature(name) != seen and reload(name):
+                changed.append(name)
+        except Exception:
+            # File sedang ditulis / sementara tidak valid: versi lama tetap dilayani, dicoba lagi nanti
+            logger.warning('reload %s gagal, versi lama tetap dipakai', name, exc_info=True)
+    return changed
+
+
+def _watch(interval):
+    while True:
+        time.sleep(interval)
+        changed = check_sources()
+        if changed:
+            logger.info('dataset dimuat ulang: %s', ', '.join(changed))
+
+
+def start_watcher(interval=None):
+    """Mulai watcher file sumber (thread daemon, sekali per proses). No-op jika interval 0."""
+    global _watcher
+    interval = WATCH_INTERVAL if interval is None else interval
+    if interval <= 0:
+        return None
+    with _watcher_lock:
+        if _watcher is None:
+            _watcher = threading.Thread(target=_watch, args=(interval,), name='data-watcher', daemon=True)
+            _watcher.start()
+    return _watcher
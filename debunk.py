@@ -1,10 +1,18 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-import statsmodels.nonparametric.smoothers_lowess as lowess
-from plotly.subplots import make_subplots
+
+import countries
+import data_store
+import debunk_charts
+import debunk_data
+import derived
+import figure_cache
+import instrument
+import panel_index
+import projection
+import selection
+import wdi
 # ---------------------------------------------------------
 # 1. KONFIGURASI HALAMAN
 # ---------------------------------------------------------
@@ -12,6 +20,12 @@ st.set_page_config(
     page_title="Honest Data Dashboard: Truth Behind Statistics",
     layout="wide"
 )
+instrument.begin_run('debunk.py')
+data_store.start_watcher()
+# Sumber yang dipakai halaman ini (loader, indeks seleksi/panel, SQL, WDI): mulai dimuat bersamaan,
+# seksi menunggu dataset masing-masing. ituc_score tidak dipakai halaman ini.
+PAGE_DATASETS = ('gdp', 'slavery', 'tahanan', 'mva', 'growth', 'ituc', 'hours_ilo', 'ppp', 'labor_force')
+data_store.load_async(PAGE_DATASETS)
 
 st.title("Audit Transparansi Data: Meluruskan Distorsi Statistik")
 st.markdown("""
@@ -22,28 +36,9 @@ Berbeda dengan narasi sebelumnya, penyajian ini mengacu pada **Prinsip Integrita
 # ---------------------------------------------------------
 # 2. FUNGSI LOADING DATA (MENGGUNAKAN FILE ASLI)
 # ---------------------------------------------------------
+# Loader (di-cache) ada di debunk_data.py
 
-@st.cache_data
-def load_data():
-    # Load data dari CSV/Excel yang disediakan
-    # Note: File dengan nama '.xlsx - Sheet1.csv' adalah file CSV hasil export
-    mva_share = pd.read_excel('clean_mva_share.xlsx')
-    ituc_score = pd.read_excel('clean_ituc_score.xlsx')
-    ind_growth = pd.read_excel('clean_industrial_growth.xlsx')
-    hours_ilo = pd.read_excel('clean_hours_ilo.xlsx')
-    gdp_data = pd.read_csv('clean_gdp.csv')
-    slavery_data = pd.read_csv('clean_data_modern_slavery.csv')
-    tahanan_indo = pd.read_csv('Tahanan_Indo.csv')
-    
-    return mva_share, ituc_score, ind_growth, hours_ilo, gdp_data, slavery_data, tahanan_indo
-
-mva, ituc, growth, hours, gdp, slavery, tahanan = load_data()
-
-# Helper function untuk membersihkan data numerik
-def clean_num(df, col):
-    if col in df.columns:
-        df[col] = pd.to_numeric(df[col].astype(str).str.replace(',', '').str.strip(), errors='coerce')
-    return df
+gdp, slavery, tahanan = debunk_data.load_data()
 
 # ---------------------------------------------------------
 # BAB I: THE GLOBAL CONTEXT (VERSI JUJUR)
@@ -51,52 +46,44 @@ def clean_num(df, col):
 st.title("BAB I: ANALISIS LANSKAP INDUSTRI GLOBAL")
 st.subheader("1. Dekonstruksi 'Industrial Density': Efisiensi vs Otoritarianisme")
 
-# Daftar negara yang memiliki performa industri kuat (Kompetitor China)
+# Daftar negara yang memiliki performa industri kuat (Kompetitor China): pilihan awal di sidebar
 countries_to_show = ['China', 'Viet Nam', 'Korea, Rep.', 'Ireland']
 
-# Grafik MVA Line Chart
-df_mva_honest = mva[mva['Country Name'].isin(countries_to_show) & (mva['Year'] >= 2005)]
-fig1 = px.line(df_mva_honest, x='Year', y='MVA_Pct_GDP', color='Country Name',
-              title="MVA % GDP: China vs Negara Industri Maju & Berkembang",
-              labels={'MVA_Pct_GDP': 'Kontribusi Manufaktur (%)', 'Year': 'Tahun'},
-              template="plotly_white")
+# Seleksi negara/tahun/region/peringkat ITUC lewat indeks bitmap (tanpa isin atas seluruh panel WDI)
+mva_index = selection.get('mva')
+st.sidebar.title("Filter Data")
+filters = selection.sidebar_filters(mva_index, key='debunk', year_start=2005)
+iso3_mva = selection.country_picker("Negara (MVA & Modern Slavery)", mva_index, countries_to_show, filters,
+                                    key='debunk_countries')
 
-# Highlight China dengan garis putus-putus untuk kejujuran visual
-fig1.update_traces(patch={"line": {"width": 4, "dash": 'dot'}}, selector={'name': 'China'})
+# Grafik MVA Line Chart (negara & rentang tahun bisa diperluas hingga seluruh panel WDI sejak 1960)
+df_mva_honest = mva_index.take(country=iso3_mva, **filters)
+fig1 = figure_cache.cached_figure(debunk_charts.fig_mva_lines, df_mva_honest)
 st.plotly_chart(fig1, use_container_width=True)
 
-# --- BAGIAN METRIK MODERN SLAVERY (MENGGUNAKAN 4 KOLOM) ---
+# --- BAGIAN METRIK MODERN SLAVERY (4 KOLOM PER BARIS) ---
 st.markdown("### Modern Slavery Population")
 
-# Mapping nama negara untuk dataset slavery
-slavery_mapping = {
-    'China': 'China',
-    'Viet Nam': 'Viet Nam',
-    'Korea, Rep.': 'South Korea',
-    'Ireland': 'Ireland'
+slavery_index = selection.get('slavery')
+slavery_labels = {
+    'CHN': "🇨🇳 China",
+    'VNM': "🇻🇳 Vietnam",
+    'KOR': "🇰🇷 Korea Selatan",
+    'IRL': "🇮🇪 Irlandia",
 }
 
-# Filter dan bersihkan data slavery
-df_slv = slavery[slavery['Country'].isin(slavery_mapping.values())].copy()
-df_slv['Slavery_Count'] = pd.to_numeric(df_slv['Estimated number of people in modern slavery'].astype(str).str.replace(',', ''), errors='coerce')
-
-c1, c2, c3, c4 = st.columns(4)
-
-def get_val(country_name):
+def get_val(iso3):
     try:
-        val = df_slv[df_slv['Country'] == slavery_mapping[country_name]]['Slavery_Count'].values[0]
+        val = slavery_index.take(country=[iso3])['Estimated number of people in modern slavery'].values[0]
         return f"{val:,.0f}"
     except:
         return "N/A"
 
-with c1:
-    st.metric(label="🇨🇳 China", value=get_val('China'))
-with c2:
-    st.metric(label="🇻🇳 Vietnam", value=get_val('Viet Nam'))
-with c3:
-    st.metric(label="🇰🇷 Korea Selatan", value=get_val('Korea, Rep.'))
-with c4:
-    st.metric(label="🇮🇪 Irlandia", value=get_val('Ireland'))
+for i in range(0, len(iso3_mva), 4):
+    cols = st.columns(4)
+    for col, iso3 in zip(cols, iso3_mva[i:i + 4]):
+        with col:
+            st.metric(label=slavery_labels.get(iso3, mva_index.name(iso3)), value=get_val(iso3))
 
 st.markdown("""
 <div class="analysis-box">
@@ -109,29 +96,9 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
-import plotly.express as px
-import plotly.graph_objects as go
-import pandas as pd
-
-import pandas as pd
-import plotly.express as px
-import streamlit as st
-
-# --- Persiapan Data ---
-ituc = pd.read_csv('ITUC.csv')
-growth = pd.read_excel('clean_industrial_growth.xlsx')
-
-# 1. Membersihkan Skor ITUC (Mengonversi '5+' menjadi 6 untuk keperluan statistik)
-ituc['ITUC_Rights_Score'] = ituc['Rating'].replace('5+', '6').astype(float)
-
-# 2. Join data secara transparan (Inner Join)
+# --- Persiapan Data (di-cache, tidak dihitung ulang setiap rerun) ---
 # Menggunakan tahun terbaru 2024 sesuai data yang tersedia
-df_rights = pd.merge(
-    ituc[['Country', 'ITUC_Rights_Score', 'Rating']],
-    growth[growth['Year'] == 2024][['Country Name', 'Industrial_Growth_Pct']],
-    left_on='Country', 
-    right_on='Country Name'
-).dropna(subset=['Industrial_Growth_Pct']) # Menghapus data kosong agar jujur secara statistik
+df_rights = debunk_data.load_rights_data(2024)
 
 # --- Visualisasi ---
 st.subheader("2. The Liberty Penalty: Analisis Transparan")
@@ -141,25 +108,7 @@ if not df_rights.empty:
     df_rights = df_rights.sort_values('ITUC_Rights_Score')
 
     # Scatter Plot dengan Trendline OLS (Ordinary Least Squares)
-    fig2 = px.scatter(
-        df_rights, 
-        x='ITUC_Rights_Score', 
-        y='Industrial_Growth_Pct',
-        color='ITUC_Rights_Score',
-        hover_name='Country',
-        hover_data={'ITUC_Rights_Score': False, 'Rating': True},
-        trendline="ols", 
-        title="Hubungan Skor Hak Buruh vs Pertumbuhan Industri (Global 2024)",
-        labels={
-            'ITUC_Rights_Score': 'Indeks Hak ITUC (1=Baik, 6=Tanpa Jaminan)',
-            'Industrial_Growth_Pct': 'Pertumbuhan Industri (%)'
-        },
-        color_continuous_scale='RdYlGn_r',
-        template="plotly_dark"
-    )
-
-    # Tambahkan garis horizontal nol
-    fig2.add_hline(y=0, line_dash="dash", line_color="rgba(255,255,255,0.5)")
+    fig2 = figure_cache.cached_figure(debunk_charts.fig_liberty_penalty, df_rights)
 
     st.plotly_chart(fig2, use_container_width=True)
 
@@ -185,45 +134,21 @@ countries_discipline = [
     'Denmark', 'Korea, Rep.', 'Ireland', 'Germany',
     'Norway', 'France', 'Mexico', 'Pakistan', 'Rwanda'
 ]
+growth_index = selection.get('growth')
+iso3_discipline = selection.country_picker("Negara (Jam Kerja vs Pertumbuhan)", growth_index, countries_discipline,
+                                           filters, key='debunk_discipline')
 
-hours_latest = hours.sort_values('Year', ascending=False).drop_duplicates('Country')
-name_map_discipline = {'Republic of Korea': 'Korea, Rep.', 'Vietnam': 'Viet Nam'}
-hours_latest['Country_Sync'] = hours_latest['Country'].replace(name_map_discipline)
+# Jam kerja ILO terbaru per negara + pertumbuhan industri 2024 (filter negara didorong ke query SQL)
+df_honest_discipline = debunk_data.load_hours_growth(tuple(iso3_discipline), 2024)
 
-latest_growth_discipline = growth[growth['Year'] == 2024].dropna(subset=['Industrial_Growth_Pct'])
-
-df_honest_discipline = pd.merge(
-    hours_latest, 
-    latest_growth_discipline, 
-    left_on='Country_Sync', 
-    right_on='Country Name'
-)
-df_honest_discipline = df_honest_discipline[df_honest_discipline['Country Name'].isin(countries_discipline)].copy()
-
-df_honest_discipline['Growth_Magnitude'] = df_honest_discipline['Industrial_Growth_Pct'].abs() + 2 
-
-fig3 = px.scatter(
-    df_honest_discipline, 
-    x='Annual_Hours_Est', 
-    y='Industrial_Growth_Pct',
-    text='Country Name', 
-    size='Growth_Magnitude',
-    color='Industrial_Growth_Pct',
-    color_continuous_scale='Viridis',
-    title="Scatter Plot: Jam Kerja Tahunan vs Pertumbuhan Industri 2024",
-    labels={'Annual_Hours_Est': 'Estimasi Jam Kerja per Tahun', 'Industrial_Growth_Pct': 'Pertumbuhan (%)'},
-    template="plotly_white"
-)
-
-fig3.update_traces(
-    textposition='top center', 
-    marker=dict(line=dict(width=1, color='DarkSlateGrey')),
-    textfont_size=12
-)
+if not df_honest_discipline.empty:
+    df_honest_discipline['Growth_Magnitude'] = df_honest_discipline['Industrial_Growth_Pct'].abs() + 2 
 
-fig3.add_hline(y=0, line_dash="dot", line_color="red", annotation_text="Titik Kontraksi")
+    fig3 = figure_cache.cached_figure(debunk_charts.fig_hours_vs_growth, df_honest_discipline)
 
-st.plotly_chart(fig3, use_container_width=True)
+    st.plotly_chart(fig3, use_container_width=True)
+else:
+    st.warning("Tidak ada data jam kerja & pertumbuhan 2024 untuk negara yang dipilih di sidebar.")
 
 st.markdown("""
 <div class="analysis-box">
@@ -248,10 +173,10 @@ wage_data = pd.DataFrame({
 })
 
 # Ambil data real untuk hitung GDP per Capita
-gdp_fair = gdp[gdp['Country'].isin(wage_data['Country'])]
-pop_fair = slavery[slavery['Country'].isin(wage_data['Country'])][['Country', 'Population']]
+wage_data = countries.with_iso3(wage_data, 'Country')
 
-df_fair = pd.merge(pd.merge(wage_data, gdp_fair, on='Country'), pop_fair, on='Country')
+with instrument.span('merge', 'upah + gdp & populasi (ISO3)'):
+    df_fair = countries.merge_on_iso3(wage_data, derived.get('gdp_population'))
 df_fair['GDP_per_Capita'] = df_fair['GDP (nominal, 2023)'] / df_fair['Population']
 df_fair['Annual_Wage'] = df_fair['Monthly_Wage_USD'] * 12
 
@@ -270,9 +195,7 @@ for i in range(0, len(df_fair), n_cols):
 
 # 2. Visualisasi Perbandingan (Nominal vs Beban Riil)
 
-    fig_nominal = px.bar(df_fair, x='Country', y='Monthly_Wage_USD', 
-                        title="Upah Bulanan Rata-rata (USD)",
-                        color='Country', template="plotly_white", text_auto=True)
+    fig_nominal = figure_cache.cached_figure(debunk_charts.fig_nominal_wage, df_fair)
     st.plotly_chart(fig_nominal, use_container_width=True)
 
 
@@ -287,8 +210,7 @@ st.markdown(f"""
 # ---------------------------------------------------------
 st.subheader("2. Krisis Kapasitas Pemasyarakatan (Humanitarian Crisis)")
 
-# Pemrosesan data riil dari Tahanan_Indo.csv
-tahanan = clean_num(tahanan, 'Jumlah')
+# Pemrosesan data riil dari Tahanan_Indo.csv (kolom Jumlah sudah numerik sejak ingest)
 total_penghuni = tahanan[tahanan['Kapasitas Penghuni'].str.contains("TP")]['Jumlah'].values[0]
 kapasitas = tahanan[tahanan['Kapasitas Penghuni'].str.contains("KP")]['Jumlah'].values[0]
 overcrowding_rate = (total_penghuni / kapasitas) * 100
@@ -299,29 +221,7 @@ df_prison_honest = pd.DataFrame({
     'Jumlah Jiwa': [kapasitas, total_penghuni]
 })
 
-# Membuat Bar Chart yang menekankan selisih kapasitas
-fig5 = px.bar(
-    df_prison_honest,
-    x='Status',
-    y='Jumlah Jiwa',
-    color='Status',
-    color_discrete_map={
-        'Kapasitas Resmi': '#6c757d', # Abu-abu netral
-        'Penghuni Aktual': '#b02a37'  # Merah peringatan
-    },
-    text_auto=',.0f',
-    title="Realitas Kapasitas Lapas Indonesia",
-    template="plotly_white"
-)
-
-# Menambahkan garis ambang batas kapasitas agar kelebihan terlihat jelas
-fig5.add_hline(
-    y=kapasitas, 
-    line_dash="dash", 
-    line_color="black", 
-    annotation_text="Batas Maksimum Kapasitas",
-    annotation_position="top left"
-)
+fig5 = figure_cache.cached_figure(debunk_charts.fig_prison_capacity, df_prison_honest, kapasitas)
 
 st.plotly_chart(fig5, use_container_width=True)
 
@@ -345,15 +245,9 @@ st.markdown("""
 # 4.2.3. Korelasi GDP vs Populasi Modern Slavery
 st.subheader("3. Korelasi GDP vs Populasi Modern Slavery")
 # Menggunakan prevalensi per 1.000 (X) dan GDP (Y) untuk menunjukkan realitas
-honest_slavery = pd.merge(slavery, gdp, on='Country')
-honest_slavery = clean_num(honest_slavery, 'Estimated prevalence of modern slavery per 1,000 population')
-honest_slavery = clean_num(honest_slavery, 'GDP (nominal, 2023)')
-
-fig6 = px.scatter(honest_slavery, x='Estimated prevalence of modern slavery per 1,000 population', 
-                 y='GDP (nominal, 2023)', hover_name='Country', log_y=True,
-                 title="Prevalensi Modern Slavery vs GDP (Skala Logaritma)",
-                 labels={'Estimated prevalence of modern slavery per 1,000 population': 'Prevalensi (per 1.000 orang)'},
-                 template="plotly_white")
+honest_slavery = derived.get('slavery_gdp')
+
+fig6 = figure_cache.cached_figure(debunk_charts.fig_prevalence_vs_gdp, honest_slavery)
 st.plotly_chart(fig6, use_container_width=True)
 st.caption("Analisis Jujur: Negara-negara terkaya (GDP tinggi) justru secara konsisten memiliki tingkat prevalensi perbudakan terendah.")
 
@@ -367,20 +261,8 @@ st.subheader("1. Kontradiksi Hukum dan Resiko Isolasi Ekonomi")
 # Menghitung surplus tahanan secara dinamis
 prison_surplus = total_penghuni - kapasitas
 modern_slavery_count = slavery[slavery['Country'] == 'Indonesia']['Estimated number of people in modern slavery'].values[0]
-# Pastikan conversion ke integer jika masih string
-if isinstance(modern_slavery_count, str):
-    modern_slavery_count = int(modern_slavery_count.replace(',', ''))
-
-fig7 = px.bar(
-    x=['Modern Slavery Population', 'Prison Surplus (Overcrowding)'], 
-    y=[modern_slavery_count, prison_surplus],
-    title="Perbandingan Kelompok Populasi Terdampak",
-    labels={'x': 'Kategori Kelompok', 'y': 'Jumlah Jiwa'},
-    color=['Slavery', 'Prison'], 
-    color_discrete_sequence=['#E64A19', '#37474F'],
-    template="plotly_white",
-    text_auto='.3s'
-)
+
+fig7 = figure_cache.cached_figure(debunk_charts.fig_affected_groups, modern_slavery_count, prison_surplus)
 st.plotly_chart(fig7, use_container_width=True)
 
 st.markdown("""
@@ -391,14 +273,18 @@ st.markdown("""
 
 st.header("2. Analisis Diagnostik: Produktivitas & Daya Saing Riil")
 
-# --- DATASET RIIL (Estimasi 2023/2024) ---
+# --- DATASET RIIL (World Bank WDI, tahun terbaru yang tersedia) ---
 # Menggunakan indikator ekonomi standar internasional
 df_prod = pd.DataFrame({
     'Negara': ['Indonesia', 'Russia', 'China', 'India'],
-    'GDP_PPP_Capita': [17634, 41705, 23846, 12100], # GDP per Capita PPP (Daya Beli)
-    'Labor_Force_Million': [147.0, 72.0, 780.0, 523.0], # Angkatan Kerja Total
+    'Kode': ['IDN', 'RUS', 'CHN', 'IND'],
     'GDP_Nominal_Trillion': [1.37, 2.02, 17.79, 3.55]
 })
+ppp_latest = wdi.latest_values(data_store.get_frame('ppp'), 'GDP_PPP_Capita')
+labor_latest = wdi.latest_values(data_store.get_frame('labor_force'), 'Labor_Force')
+df_prod['GDP_PPP_Capita'] = df_prod['Kode'].map(ppp_latest['GDP_PPP_Capita']) # GDP per Capita PPP (Daya Beli)
+df_prod['Labor_Force_Million'] = df_prod['Kode'].map(labor_latest['Labor_Force']) / 1e6 # Angkatan Kerja Total
+wdi_year = int(min(ppp_latest.loc[df_prod['Kode'], 'Year'].min(), labor_latest.loc[df_prod['Kode'], 'Year'].min()))
 
 # Hitung Produktivitas: GDP Nominal per Tenaga Kerja (USD)
 df_prod['GDP_per_Worker'] = (df_prod['GDP_Nominal_Trillion'] * 1e12) / (df_prod['Labor_Force_Million'] * 1e6)
@@ -407,80 +293,60 @@ col1, col2 = st.columns(2)
 
 with col1:
     # Grafik 1: Daya Saing Riil (GDP per Capita PPP)
-    # Ini menunjukkan standar hidup dan kekuatan ekonomi per individu
-    fig1 = px.bar(
-        df_prod.sort_values('GDP_PPP_Capita', ascending=False),
-        x='Negara',
-        y='GDP_PPP_Capita',
-        title="Daya Saing Riil (GDP per Kapita PPP)",
-        labels={'GDP_PPP_Capita': 'USD (PPP)'},
-        color='Negara',
-        color_discrete_map={'Indonesia': '#FF4B4B'}, # Highlight Indonesia secara jujur
-        text_auto='.0s',
-        template="plotly_dark"
-    )
+    fig1 = figure_cache.cached_figure(debunk_charts.fig_ppp_competitiveness, df_prod)
     st.plotly_chart(fig1, use_container_width=True)
 
 with col2:
     # Grafik 2: Produktivitas Sistemik (GDP per Tenaga Kerja)
-    # Menunjukkan berapa nilai ekonomi yang dihasilkan satu orang pekerja
-    fig2 = px.bar(
-        df_prod.sort_values('GDP_per_Worker', ascending=False),
-        x='Negara',
-        y='GDP_per_Worker',
-        title="Produktivitas per Tenaga Kerja (Nominal)",
-        labels={'GDP_per_Worker': 'Output per Pekerja (USD)'},
-        color='Negara',
-        color_discrete_map={'Indonesia': '#FF4B4B'},
-        text_auto='.0s',
-        template="plotly_dark"
-    )
+    fig2 = figure_cache.cached_figure(debunk_charts.fig_worker_productivity, df_prod)
     st.plotly_chart(fig2, use_container_width=True)
 
 # --- Diagnosis Berbasis Data Objektif ---
+prod = df_prod.set_index('Negara')
+ppp, per_worker = prod['GDP_PPP_Capita'], prod['GDP_per_Worker']
 st.markdown(f"""
 <div class="analysis-box" style="border-left: 5px solid #1E90FF; background-color: #1e1e1e; padding: 15px;">
     <h4>🔍 Diagnosis Efisiensi Sistemik:</h4>
     <p>Analisis ini menggunakan metrik ekonomi makro standar untuk menghindari bias interpretasi:</p>
     <ul>
-        <li><b>Kesenjangan Daya Saing:</b> GDP per Kapita PPP Indonesia (<b>$17,634</b>) menunjukkan posisi daya beli yang lebih kuat dibandingkan India, namun masih jauh di bawah Russia (<b>$41,705</b>) dan China (<b>$23,846</b>).</li>
-        <li><b>Produktivitas Pekerja:</b> Setiap pekerja di Indonesia rata-rata menghasilkan output nominal <b>$9,319/tahun</b>. Sebagai perbandingan, pekerja di Russia menghasilkan 3x lipat (<b>$28,055</b>) dan China 2.5x lipat (<b>$22,807</b>).</li>
+        <li><b>Kesenjangan Daya Saing:</b> GDP per Kapita PPP Indonesia (<b>${ppp['Indonesia']:,.0f}</b>) menunjukkan posisi daya beli yang lebih kuat dibandingkan India, namun masih jauh di bawah Russia (<b>${ppp['Russia']:,.0f}</b>) dan China (<b>${ppp['China']:,.0f}</b>).</li>
+        <li><b>Produktivitas Pekerja:</b> Setiap pekerja di Indonesia rata-rata menghasilkan output nominal <b>${per_worker['Indonesia']:,.0f}/tahun</b>. Sebagai perbandingan, pekerja di Russia menghasilkan {per_worker['Russia'] / per_worker['Indonesia']:.1f}x lipat (<b>${per_worker['Russia']:,.0f}</b>) dan China {per_worker['China'] / per_worker['Indonesia']:.1f}x lipat (<b>${per_worker['China']:,.0f}</b>).</li>
         <li><b>Akar Masalah Riil:</b> Inefisiensi bukan berasal dari "pemanfaatan tenaga kerja non-regulasi", melainkan dari <b>intensitas modal dan teknologi</b>. Russia dan China memiliki output per pekerja yang tinggi karena mekanisasi dan industrialisasi yang lebih maju dibandingkan Indonesia yang masih didominasi sektor jasa dan manufaktur rendah teknologi.</li>
     </ul>
-    <p style="font-size: 0.9em; color: #888;">*Data disesuaikan dengan angka World Bank & IMF 2023-2024.</p>
+    <p style="font-size: 0.9em; color: #888;">*PPP & angkatan kerja: World Bank WDI ({wdi_year}); GDP nominal: World Bank & IMF 2023.</p>
 </div>
 """, unsafe_allow_html=True)
 
 # 4.3.3. Proyeksi Dominasi Global
 st.subheader("3. Proyeksi Pertumbuhan Ekonomi: Skenario Risiko & Stabilitas")
 
-avg_growth_indo = growth[growth['Country Name'] == 'Indonesia']['Industrial_Growth_Pct'].mean() / 100
+growth_indo_rows = panel_index.get('growth').country('Indonesia').dropna(subset=['Industrial_Growth_Pct'])
+growth_indo = growth_indo_rows['Industrial_Growth_Pct']
+avg_growth_indo = growth_indo.mean() / 100
 current_gdp = gdp[gdp['Country'] == 'Indonesia']['GDP (nominal, 2023)'].values[0] / 1e12
 
-years = np.arange(2025, 2036)
+# Parameter simulasi bisa diubah analis; 10.000+ jalur dihitung dalam hitungan milidetik
+col_h, col_n = st.columns(2)
+with col_h:
+    horizon = st.slider("Horizon proyeksi (tahun)", min_value=5, max_value=30, value=11)
+with col_n:
+    n_sims = st.select_slider("Jumlah simulasi bootstrap", options=[1_000, 5_000, 10_000, 25_000, 50_000, 100_000], value=10_000)
+
+# Bootstrap: resampling pertumbuhan historis Indonesia, dikompaunkan sebagai array (n_sims, n_tahun)
+years = np.arange(2025, 2025 + horizon)
+paths = projection.bootstrap_paths(growth_indo, current_gdp, horizon, n_sims=n_sims)
+bands = projection.percentile_bands(paths, years, percentiles=(5, 50, 95))
 proj_honest = pd.DataFrame({
     'Tahun': years,
-    'Lower_CI': [current_gdp * (1 + 0.01)**(y-2025) for y in years],
-    'Mean_Proj': [current_gdp * (1 + avg_growth_indo)**(y-2025) for y in years],
-    'Upper_CI': [current_gdp * (1 + (avg_growth_indo + 0.02))**(y-2025) for y in years]
+    'Lower_CI': bands['P5'],
+    'Median_Proj': bands['P50'],
+    'Upper_CI': bands['P95']
 })
 
-fig9 = go.Figure()
-fig9.add_trace(go.Scatter(x=proj_honest['Tahun'], y=proj_honest['Upper_CI'], mode='lines', line_color='rgba(0,0,0,0)', showlegend=False))
-fig9.add_trace(go.Scatter(
-    x=proj_honest['Tahun'], y=proj_honest['Lower_CI'], 
-    fill='tonexty', fillcolor='rgba(255, 75, 75, 0.2)', 
-    line_color='rgba(0,0,0,0)', name='Zona Resiko Sanksi/Instabilitas'
-))
-
-fig9.add_trace(go.Scatter(x=proj_honest['Tahun'], y=proj_honest['Mean_Proj'], mode='lines+markers', line_color='#1E88E5', name='Proyeksi Historis'))
-
-fig9.update_layout(
-    title=f"Proyeksi GDP Indonesia Berdasarkan Tren ({avg_growth_indo*100:.1f}%)", 
-    xaxis_title="Tahun", yaxis_title="Estimasi GDP (Triliun IDR)", 
-    template="plotly_white"
-)
+fig9 = figure_cache.cached_figure(debunk_charts.fig_gdp_projection, proj_honest, avg_growth_indo)
 st.plotly_chart(fig9, use_container_width=True)
+st.caption(f"Pita = persentil 5–95 dari {n_sims:,} jalur bootstrap pertumbuhan industri historis Indonesia "
+           f"({len(growth_indo)} tahun data, {int(growth_indo_rows['Year'].min())}–{int(growth_indo_rows['Year'].max())}).")
 
 st.markdown("""
 <div class="analysis-box">
@@ -489,4 +355,9 @@ st.markdown("""
     Keberlanjutan ekonomi hanya dapat dicapai melalui perlindungan hak asasi manusia dan peningkatan kualitas sumber daya manusia, 
     bukan melalui pengaktifan kembali model kerja paksa yang secara matematis justru merugikan ketahanan GDP nasional.
 </div>
-""", unsafe_allow_html=True)
\ No newline at end of file
+""", unsafe_allow_html=True)
+
+# ---------------------------------------------------------
+# INSTRUMENTASI (hanya tampil jika DASHBOARD_INSTRUMENT aktif)
+# ---------------------------------------------------------
+instrument.render_panel()
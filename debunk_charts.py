@@ -0,0 +1,204 @@
+"""Pembangun figure Plotly untuk debunk.py (fungsi murni: DataFrame/parameter -> figure)."""
+
+import downsample
+import regression
+
+# ---------------------------------------------------------
+# BAB I
+# ---------------------------------------------------------
+
+def fig_mva_lines(df_mva_honest):
+    import plotly.express as px
+
+    # Banyak negara x sejak 1960: titik dipangkas (LTTB) dan dirender WebGL di atas ambang
+    df_mva_honest = downsample.downsample_long(df_mva_honest, 'Year', 'MVA_Pct_GDP', by='Country Name')
+    fig1 = px.line(df_mva_honest, x='Year', y='MVA_Pct_GDP', color='Country Name',
+                  title="MVA % GDP: China vs Negara Industri Maju & Berkembang",
+                  labels={'MVA_Pct_GDP': 'Kontribusi Manufaktur (%)', 'Year': 'Tahun'},
+                  template="plotly_white", render_mode=downsample.render_mode(len(df_mva_honest)))
+
+    # Highlight China dengan garis putus-putus untuk kejujuran visual
+    fig1.update_traces(patch={"line": {"width": 4, "dash": 'dot'}}, selector={'name': 'China'})
+    return fig1
+
+
+def fig_liberty_penalty(df_rights):
+    import plotly.express as px
+
+    # Scatter Plot dengan Trendline OLS (Ordinary Least Squares) + pita kepercayaan 95%
+    fig2 = px.scatter(
+        df_rights,
+        x='ITUC_Rights_Score',
+        y='Industrial_Growth_Pct',
+        color='ITUC_Rights_Score',
+        hover_name='Country',
+        hover_data={'ITUC_Rights_Score': False, 'Rating': True},
+        title="Hubungan Skor Hak Buruh vs Pertumbuhan Industri (Global 2024)",
+        labels={
+            'ITUC_Rights_Score': 'Indeks Hak ITUC (1=Baik, 6=Tanpa Jaminan)',
+            'Industrial_Growth_Pct': 'Pertumbuhan Industri (%)'
+        },
+        color_continuous_scale='RdYlGn_r',
+        template="plotly_dark"
+    )
+
+    # Trendline dihitung NumPy bentuk tertutup (tanpa statsmodels)
+    fit = regression.fit_ols(df_rights['ITUC_Rights_Score'], df_rights['Industrial_Growth_Pct'])
+    fig2.add_traces(regression.trendline_traces(
+        fit, df_rights['ITUC_Rights_Score'].min(), df_rights['ITUC_Rights_Score'].max(),
+        y_label='Industrial_Growth_Pct', x_label='ITUC_Rights_Score'
+    ))
+
+    # Tambahkan garis horizontal nol
+    fig2.add_hline(y=0, line_dash="dash", line_color="rgba(255,255,255,0.5)")
+    return fig2
+
+
+def fig_hours_vs_growth(df_honest_discipline):
+    import plotly.express as px
+
+    fig3 = px.scatter(
+        df_honest_discipline,
+        x='Annual_Hours_Est',
+        y='Industrial_Growth_Pct',
+        text='Country Name',
+        size='Growth_Magnitude',
+        color='Industrial_Growth_Pct',
+        color_continuous_scale='Viridis',
+        title="Scatter Plot: Jam Kerja Tahunan vs Pertumbuhan Industri 2024",
+        labels={'Annual_Hours_Est': 'Estimasi Jam Kerja per Tahun', 'Industrial_Growth_Pct': 'Pertumbuhan (%)'},
+        template="plotly_white"
+    )
+
+    fig3.update_traces(
+        textposition='top center',
+        marker=dict(line=dict(width=1, color='DarkSlateGrey')),
+        textfont_size=12
+    )
+
+    fig3.add_hline(y=0, line_dash="dot", line_color="red", annotation_text="Titik Kontraksi")
+    return fig3
+
+
+# ---------------------------------------------------------
+# BAB II
+# ---------------------------------------------------------
+
+def fig_nominal_wage(df_fair):
+    import plotly.express as px
+
+    return px.bar(df_fair, x='Country', y='Monthly_Wage_USD',
+                  title="Upah Bulanan Rata-rata (USD)",
+                  color='Country', template="plotly_white", text_auto=True)
+
+
+def fig_prison_capacity(df_prison_honest, kapasitas):
+    import plotly.express as px
+
+    # Membuat Bar Chart yang menekankan selisih kapasitas
+    fig5 = px.bar(
+        df_prison_honest,
+        x='Status',
+        y='Jumlah Jiwa',
+        color='Status',
+        color_discrete_map={
+            'Kapasitas Resmi': '#6c757d', # Abu-abu netral
+            'Penghuni Aktual': '#b02a37'  # Merah peringatan
+        },
+        text_auto=',.0f',
+        title="Realitas Kapasitas Lapas Indonesia",
+        template="plotly_white"
+    )
+
+    # Menambahkan garis ambang batas kapasitas agar kelebihan terlihat jelas
+    fig5.add_hline(
+        y=kapasitas,
+        line_dash="dash",
+        line_color="black",
+        annotation_text="Batas Maksimum Kapasitas",
+        annotation_position="top left"
+    )
+    return fig5
+
+
+def fig_prevalence_vs_gdp(honest_slavery):
+    import plotly.express as px
+
+    return px.scatter(honest_slavery, x='Estimated prevalence of modern slavery per 1,000 population',
+                      y='GDP (nominal, 2023)', hover_name='Country', log_y=True,
+                      title="Prevalensi Modern Slavery vs GDP (Skala Logaritma)",
+                      labels={'Estimated prevalence of modern slavery per 1,000 population': 'Prevalensi (per 1.000 orang)'},
+                      template="plotly_white")
+
+
+# ---------------------------------------------------------
+# BAB III
+# ---------------------------------------------------------
+
+def fig_affected_groups(modern_slavery_count, prison_surplus):
+    import plotly.express as px
+
+    return px.bar(
+        x=['Modern Slavery Population', 'Prison Surplus (Overcrowding)'],
+        y=[modern_slavery_count, prison_surplus],
+        title="Perbandingan Kelompok Populasi Terdampak",
+        labels={'x': 'Kategori Kelompok', 'y': 'Jumlah Jiwa'},
+        color=['Slavery', 'Prison'],
+        color_discrete_sequence=['#E64A19', '#37474F'],
+        template="plotly_white",
+        text_auto='.3s'
+    )
+
+
+def fig_ppp_competitiveness(df_prod):
+    import plotly.express as px
+
+    # Ini menunjukkan standar hidup dan kekuatan ekonomi per individu
+    return px.bar(
+        df_prod.sort_values('GDP_PPP_Capita', ascending=False),
+        x='Negara',
+        y='GDP_PPP_Capita',
+        title="Daya Saing Riil (GDP per Kapita PPP)",
+        labels={'GDP_PPP_Capita': 'USD (PPP)'},
+        color='Negara',
+        color_discrete_map={'Indonesia': '#FF4B4B'}, # Highlight Indonesia secara jujur
+        text_auto='.0s',
+        template="plotly_dark"
+    )
+
+
+def fig_worker_productivity(df_prod):
+    import plotly.express as px
+
+    # Menunjukkan berapa nilai ekonomi yang dihasilkan satu orang pekerja
+    return px.bar(
+        df_prod.sort_values('GDP_per_Worker', ascending=False),
+        x='Negara',
+        y='GDP_per_Worker',
+        title="Produktivitas per Tenaga Kerja (Nominal)",
+        labels={'GDP_per_Worker': 'Output per Pekerja (USD)'},
+        color='Negara',
+        color_discrete_map={'Indonesia': '#FF4B4B'},
+        text_auto='.0s',
+        template="plotly_dark"
+    )
+
+
+def fig_gdp_projection(proj_honest, avg_growth_indo):
+    import plotly.graph_objects as go
+    fig9 = go.Figure()
+    fig9.add_trace(go.Scatter(x=proj_honest['Tahun'], y=proj_honest['Upper_CI'], mode='lines', line_color='rgba(0,0,0,0)', showlegend=False))
+    fig9.add_trace(go.Scatter(
+        x=proj_honest['Tahun'], y=proj_honest['Lower_CI'],
+        fill='tonexty', fillcolor='rgba(255, 75, 75, 0.2)',
+        line_color='rgba(0,0,0,0)', name='Interval Bootstrap 90% (P5–P95)'
+    ))
+
+    fig9.add_trace(go.Scatter(x=proj_honest['Tahun'], y=proj_honest['Median_Proj'], mode='lines+markers', line_color='#1E88E5', name='Median Proyeksi (Bootstrap)'))
+
+    fig9.update_layout(
+        title=f"Proyeksi GDP Indonesia Berdasarkan Tren ({avg_growth_indo*100:.1f}%)",
+        xaxis_title="Tahun", yaxis_title="Estimasi GDP (Triliun IDR)",
+        template="plotly_white"
+    )
+    return fig9
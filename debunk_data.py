@@ -0,0 +1,42 @@
+"""Loader data (di-cache) untuk debunk.py, bisa dipanggil tanpa menjalankan halaman Streamlit."""
+import compact
+import data_store
+import query
+
+
+# Urutan = urutan nilai kembali load_data()
+DATASETS = ('gdp', 'slavery', 'tahanan')
+
+
+@compact.shared_data(datasets=DATASETS)
+def load_data():
+    # Ketiga sumber dimuat bersamaan (data_store.load_async); setiap file hanya di-parse sekali per proses
+    futures = data_store.load_async(DATASETS)
+    return tuple(futures[name].result().to_pandas() for name in DATASETS)
+
+@compact.shared_data(datasets=('ituc', 'growth'))
+def load_rights_data(year):
+    """Skor ITUC Global Rights Index (ITUC.csv) digabung dengan pertumbuhan industri tahun `year`."""
+    # Skor numerik ('5+' -> 6) ada di view ituc_rights; join pada kode ISO3, baris tanpa data
+    # pertumbuhan dibuang agar jujur secara statistik
+    return query.query('''
+        SELECT r."Country", r."ITUC_Rights_Score", r."Rating", r."ISO3", g."Country Name", g."Industrial_Growth_Pct"
+        FROM ituc_rights r
+        JOIN growth g ON g."ISO3" = r."ISO3"
+        WHERE g."Year" = ? AND g."Industrial_Growth_Pct" IS NOT NULL
+        ORDER BY r._row, g._row
+    ''', [year], label='ituc + growth (ISO3)')
+
+@compact.shared_data(datasets=('hours_ilo', 'growth'))
+def load_hours_growth(iso3_codes, year):
+    """Jam kerja ILO terbaru per negara `iso3_codes` digabung (ISO3) dengan pertumbuhan industri tahun `year`."""
+    iso3_codes = list(iso3_codes)
+    return query.query(f'''
+        SELECT h."Country", h."Year", h."Weekly_Hours", h."Annual_Hours_Est", h."ISO3",
+               g."Country Name", g."Year" AS "Year_growth", g."Industrial_Growth_Pct"
+        FROM hours_latest h
+        JOIN growth g ON g."ISO3" = h."ISO3"
+        WHERE g."Year" = ? AND g."Industrial_Growth_Pct" IS NOT NULL
+          AND g."ISO3" IN ({query.placeholders(iso3_codes)})
+        ORDER BY h."Year" DESC, h._row, g._row
+    ''', [year, *iso3_codes], label='hours_ilo + growth (ISO3)')
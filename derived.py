@@ -0,0 +1,239 @@
+"""DAG tabel turunan bersama uas.py & debunk.py: sumber mentah -> bersih -> gabungan -> view per chart.
+
+Setiap node dihitung sekali per proses dan dipakai ulang oleh semua konsumen di kedua aplikasi,
+sehingga merge yang sama tidak diulang dan kedua dashboard melihat data antara yang identik.
+Hasil node di-memo per versi file sumber (data_store.version); node yang sumbernya berubah dihitung
+ulang pada akses berikutnya, node lain tidak tersentuh. Memo berupa tabel Arrow dari disk_cache
+(di-mmap, dipakai bersama semua worker di host); DataFrame baru dibuat hanya saat konsumen memanggil `get`.
+
+Pemakaian (debugging):
+    python derived.py              # daftar node, dependensi, sumber, status cache
+    python derived.py --dot        # graf dalam format Graphviz DOT
+    python derived.py --build      # hitung semua node lalu tampilkan ukuran & waktu
+"""
+import argparse
+import functools
+import hashlib
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+
+import countries
+import data_store
+import disk_cache
+import instrument
+
+SOURCE_PREFIX = 'source:'
+
+
+class Node:
+    """Satu tabel turunan: fungsi murni dari tabel-tabel dependensinya (urutan argumen = `deps`)."""
+
+    def __init__(self, name, func, deps):
+        self.name = name
+        self.func = func
+        self.deps = tuple(deps)
+        self.doc = (func.__doc__ or '').strip().splitlines()[0] if func.__doc__ else ''
+        self.lock = threading.Lock()
+        self.key = None
+        self.value = None
+        self.build_ms = None
+
+
+NODES = {}
+
+
+def node(*deps, name=None):
+    """Daftarkan fungsi sebagai node DAG. Dependensi berupa nama node lain atau 'source:<dataset>'."""
+    def register(func):
+        node_name = name or func.__name__
+        for dep in deps:
+            if not dep.startswith(SOURCE_PREFIX) and dep not in NODES:
+                raise ValueError(f"node {node_name!r}: dependensi {dep!r} belum terdaftar")
+        NODES[node_name] = Node(node_name, func, deps)
+        return func
+    return register
+
+
+def sources(name):
+    """Dataset data_store yang (secara transitif) menjadi sumber node `name`, terurut."""
+    if name.startswith(SOURCE_PREFIX):
+        return (name[len(SOURCE_PREFIX):],)
+    return tuple(sorted({src for dep in NODES[name].deps for src in sources(dep)}))
+
+
+def _frame(name):
+    # Setiap fungsi node menerima DataFrame baru, jadi tidak bisa mengubah hasil node lain
+    if name.startswith(SOURCE_PREFIX):
+        return data_store.get_frame(name[len(SOURCE_PREFIX):])
+    return _compute(name).to_pandas()
+
+
+def _build(entry):
+    result = entry.func(*(_frame(dep) for dep in entry.deps))
+    return pa.Table.from_pandas(result)
+
+
+@functools.lru_cache(maxsize=None)
+def _code_version():
+    # Kode node & pemetaan ISO3: entri disk dari versi kode lama tidak dipakai ulang
+    h = hashlib.sha256()
+    for module in (sys.modules[__name__], countries):
+        h.update(Path(module.__file__).read_bytes())
+    return h.hexdigest()[:16]
+
+
+def _disk_key(name, key):
+    """Kunci disk_cache untuk node `name`: None jika ada sumber yang bukan file (set_table) atau gagal dimuat."""
+    if any(v is None or v[0] == 'memory' for v in key):
+        return None
+    # Kolom ISO3 bergantung pada daftar negara di file WDI, bukan hanya pada sumber node
+    wdi_files = tuple(data_store.file_signature(n) for n in data_store.WDI_VALUE_NAMES)
+    return (_code_version(), sources(name), key, wdi_files)
+
+
+def _compute(name):
+    entry = NODES[name]
+    key = data_store.versions(sources(name))
+    if entry.key == key and entry.value is not None:
+        return entry.value
+    with entry.lock:
+        if entry.key != key or entry.value is None:
+            t0 = time.perf_counter()
+            disk_key = _disk_key(name, key)
+            if disk_key is None:
+                entry.value = _build(entry)
+            else:
+                entry.value, _ = disk_cache.get_or_build('derived', name, disk_key, lambda: _build(entry))
+            entry.build_ms = (time.perf_counter() - t0) * 1000
+            entry.key = key
+    return entry.value
+
+
+def get_table(name):
+    """Hasil node `name` sebagai tabel Arrow bersama (immutable, tanpa salinan)."""
+    return _compute(name)
+
+
+def get(name):
+    """Hasil node `name` sebagai DataFrame baru, aman untuk dimodifikasi pemanggil."""
+    return _compute(name).to_pandas()
+
+
+def clear(names=None):
+    """Lupakan hasil node (semua jika `names` None)."""
+    for name in names or NODES:
+        entry = NODES[name]
+        with entry.lock:
+            entry.key = entry.value = entry.build_ms = None
+
+
+def describe():
+    """Ringkasan graf: satu baris per node dengan dependensi, sumber, status memo, ukuran dan waktu build."""
+    rows = []
+    for name, entry in NODES.items():
+        fresh = entry.value is not None and entry.key == tuple(data_store._versions.get(s) for s in sources(name))
+        rows.append({
+            'node': name,
+            'deps': ', '.join(entry.deps),
+            'sources': ', '.join(sources(name)),
+            'status': 'segar' if fresh else ('basi' if entry.value is not None else '-'),
+            'rows': None if entry.value is None else len(entry.value),
+            'build_ms': entry.build_ms,
+            'keterangan': entry.doc,
+        })
+    return pd.DataFrame(rows)
+
+
+def to_dot():
+    lines = ['digraph derived {', '  rankdir=LR;']
+    for name in sorted({dep for entry in NODES.values() for dep in entry.deps if dep.startswith(SOURCE_PREFIX)}):
+        lines.append(f'  "{name}" [shape=cylinder];')
+    for name, entry in NODES.items():
+        lines.append(f'  "{name}" [shape=box];')
+        lines += [f'  "{dep}" -> "{name}";' for dep in entry.deps]
+    lines.append('}')
+    return '\n'.join(lines)
+
+
+# ---------------------------------------------------------
+# BERSIH: SUMBER + KODE ISO3
+# ---------------------------------------------------------
+
+@node('source:slavery')
+def slavery_iso3(slavery):
+    """Walk Free (modern slavery) dengan kolom ISO3."""
+    return countries.with_iso3(slavery, 'Country')
+
+
+@node('source:gdp')
+def gdp_iso3(gdp):
+    """GDP nominal 2023 dengan kolom ISO3."""
+    return countries.with_iso3(gdp, 'Country')
+
+
+# ---------------------------------------------------------
+# GABUNGAN
+# ---------------------------------------------------------
+
+@node('slavery_iso3', 'gdp_iso3')
+def slavery_gdp(slavery, gdp):
+    """Slavery + GDP (inner join ISO3), dengan GDP_Trillion & Slavery_Pop."""
+    # Join pada ISO3 ('Russia' vs 'Russian Federation', 'Vietnam' vs 'Viet Nam', dst.)
+    with instrument.span('merge', 'slavery + gdp (ISO3)'):
+        df = countries.merge_on_iso3(slavery, gdp.drop(columns='Country'))
+    df['GDP_Trillion'] = df['GDP (nominal, 2023)'] / 1e12
+    df['Slavery_Pop'] = df['Estimated number of people in modern slavery']
+    return df
+
+
+# ---------------------------------------------------------
+# VIEW PER CHART
+# ---------------------------------------------------------
+
+@node('slavery_gdp')
+def slavery_gdp_by_country(df):
+    """uas.py BAB II: bubble GDP vs populasi slavery (kolom 'Negara')."""
+    df['Negara'] = df['Country']
+    return df
+
+
+@node('slavery_gdp')
+def efficiency_bench(df):
+    """uas.py BAB III: Efficiency_Score empat negara pembanding."""
+    targets = ['China', 'Russia', 'India', 'Indonesia']
+    df = df[df['Country'].isin(targets)].copy()
+    # Efficiency Score: Output per person
+    df['Efficiency_Score'] = (df['GDP_Trillion'] * 1e6) / df['Slavery_Pop']
+    return df
+
+
+@node('slavery_gdp')
+def gdp_population(df):
+    """GDP + populasi per ISO3 (debunk.py: GDP per kapita untuk rasio upah)."""
+    return df[['ISO3', 'GDP (nominal, 2023)', 'GDP Growth', 'Population']]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--dot', action='store_true', help='cetak graf dalam format Graphviz DOT')
+    parser.add_argument('--build', action='store_true', help='hitung semua node sebelum menampilkan ringkasan')
+    args = parser.parse_args(argv)
+
+    if args.dot:
+        print(to_dot())
+        return 0
+    if args.build:
+        for name in NODES:
+            get(name)
+    with pd.option_context('display.width', 200, 'display.max_colwidth', 60):
+        print(describe().to_string(index=False))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
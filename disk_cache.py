@@ -0,0 +1,170 @@
+"""Cache tabel di disk yang dipakai bersama semua proses Streamlit di satu host.
+
+Setiap entri adalah satu file Arrow IPC dengan kunci fingerprint file input (nama, mtime, ukuran)
+ditambah versi format/kode. Proses pertama yang butuh entri membangunnya di bawah file lock;
+proses lain menunggu lock lalu memakai file yang sama lewat memory-map. Buffer tabel Arrow menunjuk
+langsung ke page cache OS, jadi N worker berbagi satu salinan fisik alih-alih N hasil parse.
+
+Direktori diatur dengan DASHBOARD_CACHE_DIR (default `.table_cache/` di samping kode);
+DASHBOARD_CACHE_DIR= (kosong) mematikan cache.
+"""
+import hashlib
+import logging
+import os
+import threading
+from pathlib import Path
+
+import pyarrow as pa
+
+try:
+    import fcntl
+except ImportError:  # Windows: tanpa lock antar-proses, penulisan tetap atomik (os.replace)
+    fcntl = None
+
+BASE_DIR = Path(__file__).resolve().parent
+CACHE_DIR = os.environ.get('DASHBOARD_CACHE_DIR', str(BASE_DIR / '.table_cache'))
+
+logger = logging.getLogger('dashboard.disk_cache')
+
+_stats = {'hits': 0, 'builds': 0, 'errors': 0}
+_stats_lock = threading.Lock()
+# Lock file bersifat per proses (flock), thread di proses yang sama dikunci terpisah
+_thread_locks = {}
+_thread_locks_lock = threading.Lock()
+
+
+def enabled():
+    return bool(CACHE_DIR)
+
+
+def digest(key):
+    """Hash stabil antar-proses dari kunci (tuple/str/angka; memakai repr)."""
+    return hashlib.sha256(repr(key).encode()).hexdigest()[:32]
+
+
+def _paths(namespace, name, key):
+    directory = Path(CACHE_DIR)
+    stem = f'{namespace}.{name}'
+    return directory / f'{stem}.{digest(key)}.arrow', directory / f'{stem}.lock'
+
+
+def _read(path):
+    # read_all dari memory-map tidak menyalin: buffer kolom menunjuk ke halaman file yang di-mmap
+    # (mmap tetap hidup selama masih ada buffer yang memakainya)
+    return pa.ipc.open_file(pa.memory_map(str(path))).read_all()
+
+
+def _write(path, table):
+    tmp = path.with_name(f'{path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+    with pa.OSFile(str(tmp), 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    os.replace(tmp, path)
+    # Entri versi lama untuk nama yang sama tidak akan dipakai lagi; proses yang masih me-mmap-nya
+    # tetap aman (POSIX), di Windows penghapusan yang gagal diabaikan
+    for old in path.parent.glob(path.name.rsplit('.', 2)[0] + '.*.arrow'):
+        if old != path:
+            try:
+                old.unlink()
+            except OSError:
+                pass
+
+
+class _FileLock:
+    def __init__(self, path):
+        self.path = path
+        with _thread_locks_lock:
+            self.thread_lock = _thread_locks.setdefault(str(path), threading.Lock())
+
+    def __enter__(self):
+        self.thread_lock.acquire()
+        self.file = None
+        if fcntl is not None:
+            try:
+                self.file = open(self.path, 'a+b')
+                fcntl.flock(self.file, fcntl.LOCK_EX)
+            except OSError:
+                # Lock file tidak bisa dibuat: tetap jalan, paling buruk dua proses membangun entri yang sama
+                logger.warning('lock %s tidak tersedia', self.path.name, exc_info=True)
+                if self.file is not None:
+                    self.file.close()
+                    self.file = None
+        return self
+
+    def __exit__(self, *exc):
+        if self.file is not None:
+            fcntl.flock(self.file, fcntl.LOCK_UN)
+            self.file.close()
+        self.thread_lock.release()
+
+
+def _count(stat):
+    with _stats_lock:
+        _stats[stat] += 1
+
+
+def _try_read(path):
+    try:
+        return _read(path) if path.exists() else None
+    except (OSError, pa.ArrowInvalid):
+        # Entri rusak/terpotong (mis. disk penuh saat ditulis proses lain): bangun ulang
+        logger.warning('entri disk cache %s tidak terbaca', path.name, exc_info=True)
+        return None
+
+
+def get_or_build(namespace, name, key, build):
+    """Tabel Arrow untuk (`namespace`, `name`, `key`): dari disk jika ada, selain itu `build()` lalu simpan.
+
+    Mengembalikan (tabel, 'disk' | 'build'). Jika cache mati atau direktori tidak bisa ditulis,
+    hasil `build()` dipakai langsung tanpa disimpan.
+    """
+    if not enabled():
+        return build(), 'build'
+    path, lock_path = _paths(namespace, name, key)
+    table = _try_read(path)
+    if table is not None:
+        _count('hits')
+        return table, 'disk'
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        logger.warning('direktori disk cache %s tidak bisa dipakai', CACHE_DIR, exc_info=True)
+        _count('errors')
+        return build(), 'build'
+    with _FileLock(lock_path):
+        # Proses lain mungkin baru selesai membangun entri ini selagi kita menunggu lock
+        table = _try_read(path)
+        if table is not None:
+            _count('hits')
+            return table, 'disk'
+        table = build()
+        try:
+            _write(path, table)
+        except OSError:
+            logger.warning('gagal menulis disk cache %s', path.name, exc_info=True)
+            _count('errors')
+            return table, 'build'
+        _count('builds')
+        # Baca balik dari file agar buffer di proses ini pun berasal dari mmap bersama
+        shared = _try_read(path)
+    return (table if shared is None else shared), 'build'
+
+
+def stats():
+    """Jumlah hit/build/galat di proses ini serta jumlah & ukuran file cache di disk."""
+    with _stats_lock:
+        result = dict(_stats)
+    files = list(Path(CACHE_DIR).glob('*.arrow')) if enabled() and Path(CACHE_DIR).is_dir() else []
+    result['files'] = len(files)
+    result['bytes'] = sum(f.stat().st_size for f in files)
+    return result
+
+
+def clear():
+    """Hapus semua entri di direktori cache (lock file dibiarkan)."""
+    if not enabled() or not Path(CACHE_DIR).is_dir():
+        return 0
+    removed = 0
+    for path in Path(CACHE_DIR).glob('*.arrow'):
+        path.unlink(missing_ok=True)
+        removed += 1
+    return removed
@@ -0,0 +1,95 @@
+"""Downsampling deret waktu di sisi server (LTTB) dan pemilihan trace WebGL untuk chart dengan banyak titik.
+
+LTTB (Largest-Triangle-Three-Buckets, Steinarsson 2013) memilih satu titik per bucket yang membentuk
+segitiga terbesar dengan titik terpilih sebelumnya dan rata-rata bucket berikutnya, sehingga puncak,
+lembah dan bentuk garis tetap terlihat walaupun jumlah titik dipangkas jauh.
+"""
+import numpy as np
+import pandas as pd
+
+# Batas total titik yang dikirim ke browser per chart, dan ambang beralih ke Scattergl (WebGL)
+MAX_POINTS = 4000
+WEBGL_THRESHOLD = 1500
+# LTTB butuh titik pertama, terakhir dan minimal satu bucket di antaranya
+MIN_POINTS_PER_SERIES = 3
+
+
+def lttb_indices(x, y, n_out):
+    """Posisi (terurut) dari `n_out` titik terpilih LTTB; semua posisi jika deret sudah cukup pendek."""
+    n = len(x)
+    if n_out >= n or n_out < MIN_POINTS_PER_SERIES:
+        return np.arange(n)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    # n_out - 2 bucket untuk titik di antara titik pertama & terakhir
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    out = np.empty(n_out, dtype=np.intp)
+    out[0], out[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_lo, next_hi = edges[i + 1], edges[i + 2]
+            avg_x, avg_y = x[next_lo:next_hi].mean(), y[next_lo:next_hi].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(np.argmax(area))
+        out[i + 1] = a
+    return out
+
+
+def _series_positions(x, y, n_out):
+    """Posisi titik yang dipertahankan untuk satu deret; NaN pemutus garis tetap disimpan."""
+    valid = ~(pd.isna(x) | pd.isna(y))
+    positions = np.flatnonzero(valid)
+    kept = positions[lttb_indices(x[valid], y[valid], n_out)]
+    # Satu NaN setelah titik valid cukup untuk memutus garis Plotly (connectgaps=False)
+    gaps = np.flatnonzero(~valid[1:] & valid[:-1]) + 1
+    return np.union1d(kept, gaps)
+
+
+def downsample_long(df, x, y, by=None, max_points=MAX_POINTS):
+    """Frame long-form (satu baris per titik, dikelompokkan per `by`) dengan maksimal ~`max_points` titik.
+
+    Anggaran titik dibagi rata antar kelompok (minimal MIN_POINTS_PER_SERIES); deret yang sudah di bawah
+    anggaran tidak disentuh. Baris terpilih dikembalikan dalam urutan aslinya.
+    """
+    if len(df) <= max_points:
+        return df
+    groups = [np.arange(len(df))] if by is None else list(df.groupby(by, sort=False).indices.values())
+    budget = max(max_points // max(len(groups), 1), MIN_POINTS_PER_SERIES)
+    xs, ys = df[x].to_numpy(), df[y].to_numpy(dtype=float)
+    keep = []
+    for positions in groups:
+        # Titik tiap kelompok diurutkan menurut sumbu x sebelum dipilih
+        positions = positions[np.argsort(xs[positions], kind='stable')]
+        keep.append(positions[_series_positions(xs[positions], ys[positions], budget)])
+    return df.iloc[np.sort(np.concatenate(keep))]
+
+
+def downsample_wide(df, x, ys, max_points=MAX_POINTS):
+    """Frame lebar (satu kolom per deret, sumbu `x` bersama): gabungan titik LTTB setiap kolom `ys`."""
+    per_series = max(max_points // max(len(ys), 1), MIN_POINTS_PER_SERIES)
+    if len(df) <= per_series:
+        return df
+    xs = df[x].to_numpy()
+    keep = [_series_positions(xs, df[col].to_numpy(dtype=float), per_series) for col in ys]
+    return df.iloc[np.unique(np.concatenate(keep))]
+
+
+def use_webgl(n_points, threshold=WEBGL_THRESHOLD):
+    return n_points > threshold
+
+
+def render_mode(n_points, threshold=WEBGL_THRESHOLD):
+    """Nilai `render_mode` plotly.express: 'webgl' di atas ambang, selain itu 'svg' (tanpa mode 'auto')."""
+    return 'webgl' if use_webgl(n_points, threshold) else 'svg'
+
+
+def scatter_trace(n_points, threshold=WEBGL_THRESHOLD):
+    """Kelas trace graph_objects: Scattergl di atas ambang, selain itu Scatter."""
+    import plotly.graph_objects as go
+
+    return go.Scattergl if use_webgl(n_points, threshold) else go.Scatter
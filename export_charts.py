@@ -0,0 +1,146 @@
+"""Ekspor semua chart uas.py & debunk.py ke HTML (dan SVG/PNG jika renderer Kaleido tersedia).
+
+Pemakaian:
+    python export_charts.py                       # exports/<app>/<figure>.html, hanya yang berubah
+    python export_charts.py --formats html svg png --jobs 4
+    python export_charts.py --force --output laporan/
+"""
+import argparse
+import hashlib
+import importlib.util
+import inspect
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import data_store
+import figure_cache
+import headless
+
+BASE_DIR = Path(__file__).resolve().parent
+DEFAULT_OUTPUT = BASE_DIR / 'exports'
+MANIFEST_NAME = 'export_manifest.json'
+IMAGE_FORMATS = ('svg', 'png')
+
+
+def image_renderer_available():
+    return importlib.util.find_spec('kaleido') is not None
+
+
+def figure_key(builder, inputs, params):
+    """Kunci ekspor: fingerprint input + parameter, ditambah hash kode builder (perubahan styling ikut terdeteksi)."""
+    source = hashlib.sha1(inspect.getsource(builder).encode()).hexdigest()
+    return f'{source}:{figure_cache.fingerprint((inputs, params))}'
+
+
+def output_paths(output, name, formats):
+    app, figure = name.split('.', 1)
+    return {fmt: output / app / f'{figure}.{fmt}' for fmt in formats}
+
+
+def export_one(name, builder, inputs, params, paths):
+    """Dijalankan di proses worker: bangun figure lalu tulis setiap format. Mengembalikan (nama, detik, galat)."""
+    t0 = time.perf_counter()
+    fig = builder(*inputs, **params)
+    errors = {}
+    for fmt, path in paths.items():
+        try:
+            if fmt == 'html':
+                # plotly.min.js ditulis sekali per direktori oleh proses utama
+                fig.write_html(path, include_plotlyjs='directory')
+            else:
+                fig.write_image(path, format=fmt)
+        except Exception as e:
+            errors[fmt] = f'{type(e).__name__}: {e}'
+    return name, time.perf_counter() - t0, errors
+
+
+def load_manifest(output):
+    path = output / MANIFEST_NAME
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding='utf-8'))
+    except ValueError:
+        return {}
+
+
+def export_all(output=DEFAULT_OUTPUT, formats=('html',), jobs=None, force=False):
+    """Ekspor semua figure; figure yang kunci dan file-nya sudah ada dilewati. Mengembalikan ringkasan."""
+    output = Path(output)
+    calls = headless.record_figure_calls()
+    manifest = load_manifest(output)
+
+    pending = {}
+    for name, (builder, inputs, params) in calls.items():
+        key = figure_key(builder, inputs, params)
+        paths = output_paths(output, name, formats)
+        entry = manifest.get(name, {})
+        done = entry.get('key') == key and all(p.exists() for p in paths.values())
+        if done and not force:
+            continue
+        pending[name] = (builder, inputs, params, paths, key)
+
+    for app in {name.split('.', 1)[0] for name in pending}:
+        (output / app).mkdir(parents=True, exist_ok=True)
+        if 'html' in formats:
+            bundle = output / app / 'plotly.min.js'
+            if not bundle.exists():
+                from plotly.offline import get_plotlyjs
+                bundle.write_text(get_plotlyjs(), encoding='utf-8')
+
+    results = {}
+    if pending:
+        # Pada titik ini AppTest sudah menyalakan thread watcher & loader data_store: worker tidak di-fork
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=data_store.process_context()) as pool:
+            futures = [pool.submit(export_one, name, builder, inputs, params, paths)
+                       for name, (builder, inputs, params, paths, _) in pending.items()]
+            for future in as_completed(futures):
+                name, seconds, errors = future.result()
+                results[name] = (seconds, errors)
+                key, paths = pending[name][4], pending[name][3]
+                written = [str(p.relative_to(output)) for fmt, p in paths.items() if fmt not in errors]
+                # Entri yang sebagian gagal tidak disimpan kuncinya agar dicoba lagi di run berikutnya
+                manifest[name] = {'key': key if not errors else None, 'files': written}
+
+    output.mkdir(parents=True, exist_ok=True)
+    (output / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding='utf-8')
+    return {'total': len(calls), 'exported': results, 'skipped': sorted(set(calls) - set(pending))}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--output', type=Path, default=DEFAULT_OUTPUT, help='direktori tujuan')
+    parser.add_argument('--formats', nargs='+', choices=('html',) + IMAGE_FORMATS,
+                        help='default: html, ditambah svg & png jika Kaleido terpasang')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count(), help='jumlah proses worker')
+    parser.add_argument('--force', action='store_true', help='ekspor ulang walaupun input tidak berubah')
+    args = parser.parse_args(argv)
+
+    formats = args.formats or (['html'] + (list(IMAGE_FORMATS) if image_renderer_available() else []))
+    if any(fmt in IMAGE_FORMATS for fmt in formats) and not image_renderer_available():
+        print("Kaleido tidak terpasang; SVG/PNG dilewati (pip install kaleido).")
+        formats = [fmt for fmt in formats if fmt not in IMAGE_FORMATS]
+    if not formats:
+        return 1
+
+    logging.disable(logging.CRITICAL)
+    t0 = time.perf_counter()
+    summary = export_all(args.output, formats=formats, jobs=args.jobs, force=args.force)
+
+    failed = 0
+    for name, (seconds, errors) in sorted(summary['exported'].items()):
+        status = 'OK' if not errors else 'GAGAL ' + '; '.join(f'{fmt}: {e}' for fmt, e in errors.items())
+        failed += bool(errors)
+        print(f"  {name:40s} {seconds * 1000:7.0f} ms  {status}")
+    print(f"{len(summary['exported'])} diekspor, {len(summary['skipped'])} tidak berubah (dilewati), "
+          f"format {', '.join(formats)} -> {args.output} ({time.perf_counter() - t0:.1f}s)")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,130 @@
+"""Cache figure Plotly (JSON ter-serialisasi) dengan kunci fingerprint data input + parameter."""
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+import instrument
+
+# Batas total ukuran JSON figure yang disimpan per proses
+MAX_BYTES = 32 * 1024 * 1024
+
+
+def fingerprint(obj):
+    """Hash stabil untuk DataFrame/Series/array/skalar (rekursif untuk list, tuple, dict)."""
+    h = hashlib.sha1()
+    _update(h, obj)
+    return h.hexdigest()
+
+
+def _update(h, obj):
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        labels = list(obj.columns) if isinstance(obj, pd.DataFrame) else [obj.name]
+        h.update(repr((type(obj).__name__, obj.shape, labels,
+                       [str(t) for t in np.atleast_1d(obj.dtypes)])).encode())
+        h.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+    elif isinstance(obj, np.ndarray):
+        h.update(repr((obj.dtype.str, obj.shape)).encode())
+        h.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, dict):
+        for key in sorted(obj, key=repr):
+            h.update(repr(key).encode())
+            _update(h, obj[key])
+    elif isinstance(obj, (list, tuple)):
+        h.update(f'{type(obj).__name__}[{len(obj)}]'.encode())
+        for item in obj:
+            _update(h, item)
+    else:
+        h.update(repr(obj).encode())
+
+
+class FigureCache:
+    """LRU berbatas byte: kunci -> JSON figure."""
+
+    def __init__(self, max_bytes=MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            fig_json = self._entries.get(key)
+            if fig_json is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return fig_json
+
+    def put(self, key, fig_json):
+        size = len(fig_json)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= len(old)
+            self._entries[key] = fig_json
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def items(self):
+        """Salinan entri (kunci, JSON) dari yang paling lama tidak dipakai."""
+        with self._lock:
+            return list(self._entries.items())
+
+    def stats(self):
+        return {'entries': len(self._entries), 'bytes': self._bytes,
+                'hits': self.hits, 'misses': self.misses}
+
+
+_cache = FigureCache()
+
+
+def cached_figure(builder, *inputs, **params):
+    """Figure `builder(*inputs, **params)`, diambil dari cache jika input & parameter tidak berubah."""
+    import plotly.graph_objects as go
+    import plotly.io as pio
+    with instrument.span('figure', builder.__name__):
+        key = f'{builder.__module__}.{builder.__qualname__}:{fingerprint((inputs, params))}'
+        fig_json = _cache.get(key)
+        if fig_json is None:
+            instrument.cache_status('miss')
+            fig = builder(*inputs, **params)
+            _cache.put(key, pio.to_json(fig, validate=False))
+            return fig
+        instrument.cache_status('hit')
+        # JSON berasal dari figure yang sudah tervalidasi, jadi validasi ulang bisa dilewati
+        return go.Figure(json.loads(fig_json), _validate=False)
+
+
+def stats():
+    return _cache.stats()
+
+
+def clear():
+    _cache.clear()
+
+
+def export_entries():
+    """Semua entri cache (kunci, JSON figure), mis. untuk dipindah dari proses warm-up ke server."""
+    return _cache.items()
+
+
+def import_entries(entries):
+    """Masukkan entri hasil `export_entries` (urutan dipertahankan untuk LRU)."""
+    for key, fig_json in entries:
+        _cache.put(key, fig_json)
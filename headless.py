@@ -0,0 +1,251 @@
+"""Jalankan uas.py / debunk.py tanpa browser dan tanpa server (Streamlit AppTest), dengan waktu per seksi.
+
+Pemakaian:
+    python headless.py                          # semua halaman uas.py + debunk.py
+    python headless.py uas.py --reruns 3        # ukur latensi rerun (run pertama = cold)
+    python headless.py --cold --memory          # cache dikosongkan per halaman, puncak memori per seksi
+    python headless.py --json hasil.json
+"""
+import argparse
+import contextlib
+import itertools
+import json
+import logging
+import re
+import resource
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import streamlit as st
+
+import compact
+import data_store
+import figure_cache
+
+BASE_DIR = Path(__file__).resolve().parent
+APPS = ('uas.py', 'debunk.py')
+
+# Pemanggilan judul yang menandai awal seksi baru; judul "BAB ..." menandai bab
+HEADING_CALLS = ('title', 'header', 'subheader')
+CHAPTER_RE = re.compile(r'^BAB [IVX]+\b')
+PROLOG = '(prolog)'
+
+
+class SectionTimer:
+    """Mencatat waktu (dan opsional puncak tracemalloc) antar pemanggilan judul st.title/header/subheader."""
+
+    def __init__(self, trace_memory=False):
+        self.trace_memory = trace_memory
+        self.marks = []
+
+    def mark(self, text):
+        peak = None
+        if self.trace_memory:
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.reset_peak()
+        self.marks.append((str(text), time.perf_counter(), peak))
+
+    @contextlib.contextmanager
+    def patched(self):
+        originals = {name: getattr(st, name) for name in HEADING_CALLS}
+        active = [True]
+
+        def wrap(func):
+            def heading(body, *args, **kwargs):
+                if active[0]:
+                    self.mark(body)
+                return func(body, *args, **kwargs)
+            return heading
+
+        wrappers = {name: wrap(func) for name, func in originals.items()}
+        for name, wrapper in wrappers.items():
+            setattr(st, name, wrapper)
+        try:
+            yield self
+        finally:
+            active[0] = False
+            # Jika modul lain (mis. instrument) sudah membungkus di atasnya, biarkan rantai utuh
+            for name, func in originals.items():
+                if getattr(st, name) is wrappers[name]:
+                    setattr(st, name, func)
+
+    def sections(self, t_start, t_end, end_peak=None):
+        """Seksi (judul, bab, durasi, puncak memori) dari daftar tanda; bab = judul 'BAB ...' terakhir."""
+        marks = [(PROLOG, t_start, None)] + self.marks
+        out, chapter = [], None
+        for i, (text, t0, _) in enumerate(marks):
+            t1, peak = (marks[i + 1][1], marks[i + 1][2]) if i + 1 < len(marks) else (t_end, end_peak)
+            if CHAPTER_RE.match(text):
+                chapter = text
+            out.append({'section': text, 'chapter': chapter, 'seconds': t1 - t0,
+                        'peak_bytes': peak})
+        return [s for s in out if not (s['section'] == PROLOG and s['seconds'] < 1e-4)]
+
+
+def chapter_totals(sections):
+    totals = {}
+    for s in sections:
+        key = s['chapter'] or PROLOG
+        totals[key] = totals.get(key, 0.0) + s['seconds']
+    return totals
+
+
+def clear_caches():
+    """Kondisi cold: cache Streamlit, data store dan cache figure dikosongkan."""
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    data_store.clear()
+    figure_cache.clear()
+
+
+def _page_matches(page, query):
+    # "BAB I" cocok dengan "BAB I: The Global Context", tetapi tidak dengan "BAB II: ..."
+    return page is not None and (page == query or page.split(':')[0].strip() == query.strip())
+
+
+def _run_once(at, timer, trace_memory):
+    timer.marks.clear()
+    if trace_memory:
+        tracemalloc.reset_peak()
+    t0 = time.perf_counter()
+    at.run()
+    t1 = time.perf_counter()
+    end_peak = tracemalloc.get_traced_memory()[1] if trace_memory else None
+    sections = timer.sections(t0, t1, end_peak)
+    return {
+        'seconds': t1 - t0,
+        'sections': sections,
+        'chapters': chapter_totals(sections),
+        'peak_bytes': max((s['peak_bytes'] or 0 for s in sections), default=0) if trace_memory else None,
+        'elements': {kind: len(at.get(kind)) for kind in ('plotly_chart', 'metric', 'markdown')},
+        'exceptions': [e.value for e in at.exception],
+    }
+
+
+def run_app(script, pages=None, reruns=1, cold=False, trace_memory=False, timeout=300):
+    """Jalankan `script` untuk setiap pilihan halaman di sidebar (radio pertama) sebanyak `reruns` kali.
+
+    `pages=None` berarti semua opsi radio sidebar (atau satu run jika skrip tidak punya radio).
+    Mengembalikan list hasil per run: halaman, indeks run, durasi total, seksi, bab, elemen, exception.
+    """
+    from streamlit.testing.v1 import AppTest
+
+    timer = SectionTimer(trace_memory=trace_memory)
+    results = []
+    # ScriptRunner Streamlit mengganti sys.modules['__main__'] dengan modul skrip; pulihkan setelahnya
+    main_module = sys.modules.get('__main__')
+    try:
+        with timer.patched():
+            if cold:
+                clear_caches()
+            at = AppTest.from_file(str(BASE_DIR / script), default_timeout=timeout)
+            first = _run_once(at, timer, trace_memory)
+            radios = at.sidebar.radio
+            options = list(radios[0].options) if len(radios) else [None]
+            default = radios[0].value if len(radios) else None
+            # Skrip tanpa radio (debunk.py) selalu dijalankan utuh, filter halaman tidak berlaku
+            selected = options if pages is None or not len(radios) else \
+                [p for p in options if any(_page_matches(p, q) for q in pages)]
+
+            for page in selected:
+                for i in range(reruns):
+                    if page == default and i == 0 and not results:
+                        result = first
+                    else:
+                        if cold and i == 0:
+                            clear_caches()
+                        if page is not None:
+                            at.sidebar.radio[0].set_value(page)
+                        result = _run_once(at, timer, trace_memory)
+                    results.append({'app': script, 'page': page, 'run': i, **result})
+    finally:
+        sys.modules['__main__'] = main_module
+    return results
+
+
+def record_figure_calls(apps=APPS, build=False):
+    """Jalankan setiap halaman `apps` dan rekam argumen setiap `figure_cache.cached_figure`.
+
+    Mengembalikan {'<app>.<builder>': (builder, inputs, params)}. Dengan `build=False` figure tidak
+    dibangun (halaman menerima figure kosong), jadi hanya data layer yang bekerja.
+    """
+    import plotly.graph_objects as go
+
+    calls = {}
+    counter = itertools.count()
+    original = figure_cache.cached_figure
+
+    def recorder(builder, *inputs, **params):
+        name = f"{builder.__module__.replace('_charts', '')}.{builder.__name__}"
+        calls.setdefault(name, (builder, inputs, params))
+        if build:
+            return original(builder, *inputs, **params)
+        # Judul unik: Streamlit menolak dua chart identik (DuplicateElementId)
+        return go.Figure(layout={'title': {'text': f'{name} #{next(counter)}'}})
+
+    figure_cache.cached_figure = recorder
+    try:
+        runs = [r for app in apps for r in run_app(app)]
+    finally:
+        figure_cache.cached_figure = original
+    errors = [f"{r['app']} [{r['page']}]: {e}" for r in runs for e in r['exceptions']]
+    if errors:
+        raise RuntimeError('Halaman gagal saat merekam figure:\n' + '\n'.join(errors))
+    return calls
+
+
+def _fmt_bytes(n):
+    return '-' if n is None else f'{n / 2**20:7.1f} MB'
+
+
+def print_report(results, file=sys.stdout):
+    for r in results:
+        label = f"{r['app']}" + (f" [{r['page']}]" if r['page'] else '')
+        print(f"\n{label}  run {r['run']}: {r['seconds'] * 1000:.0f} ms, puncak {_fmt_bytes(r['peak_bytes'])}, "
+              f"{r['elements']['plotly_chart']} chart", file=file)
+        for e in r['exceptions']:
+            print(f"    EXCEPTION: {e}", file=file)
+        for s in r['sections']:
+            indent = '  ' if CHAPTER_RE.match(s['section']) else '      '
+            print(f"{indent}{s['section'][:60]:60s} {s['seconds'] * 1000:8.1f} ms  {_fmt_bytes(s['peak_bytes'])}",
+                  file=file)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('apps', nargs='*', default=list(APPS), help='skrip yang dijalankan (default: keduanya)')
+    parser.add_argument('--page', action='append', help='nama halaman atau babnya, mis. "BAB II" (bisa berulang)')
+    parser.add_argument('--reruns', type=int, default=1, help='jumlah run per halaman')
+    parser.add_argument('--cold', action='store_true', help='kosongkan semua cache sebelum setiap halaman')
+    parser.add_argument('--memory', action='store_true', help='puncak memori per seksi (tracemalloc, lebih lambat)')
+    parser.add_argument('--json', type=Path, help='tulis hasil lengkap sebagai JSON')
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.CRITICAL)
+    if args.memory:
+        tracemalloc.start()
+    results = []
+    for app in args.apps:
+        results += run_app(app, pages=args.page, reruns=args.reruns, cold=args.cold, trace_memory=args.memory)
+    # ru_maxrss dalam KB di Linux
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+    sizes = compact.report()
+
+    print_report(results)
+    print(f"\nPuncak RSS proses: {_fmt_bytes(max_rss)}")
+    if not sizes.empty:
+        print(f"Loader bersama: {_fmt_bytes(sizes['asli_bytes'].sum())} asli -> "
+              f"{_fmt_bytes(sizes['ringkas_bytes'].sum())} ringkas (hemat "
+              f"{_fmt_bytes(sizes['hemat_ringkas_bytes'].sum())}), tanpa salinan per sesi")
+    if args.json:
+        args.json.write_text(json.dumps({'max_rss_bytes': max_rss, 'runs': results,
+                                         'shared_loaders': sizes.to_dict('records')}, indent=2, default=str),
+                             encoding='utf-8')
+    return 1 if any(r['exceptions'] for r in results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,248 @@
+"""Instrumentasi opsional: waktu (dan memori) per loader, merge, figure dan seksi halaman.
+
+Aktif lewat variabel lingkungan sebelum server dijalankan:
+    DASHBOARD_INSTRUMENT=1        timer + status cache hit/miss
+    DASHBOARD_INSTRUMENT=memory   ditambah alokasi & puncak memori (tracemalloc)
+    DASHBOARD_INSTRUMENT_LOG=path tulis satu baris JSON per run ke file (selain logger 'dashboard.instrument')
+
+Saat nonaktif, `cache_data` identik dengan `st.cache_data`, `span` mengembalikan context manager kosong,
+dan tidak ada fungsi Streamlit yang dibungkus.
+"""
+import contextlib
+import functools
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+
+MODE = os.environ.get('DASHBOARD_INSTRUMENT', '').strip().lower()
+ENABLED = MODE not in ('', '0', 'false', 'off')
+TRACE_MEMORY = MODE == 'memory'
+
+PROLOG = '(prolog)'
+# Fungsi Streamlit yang menandai awal seksi baru
+HEADING_CALLS = ('title', 'header', 'subheader')
+
+logger = logging.getLogger('dashboard.instrument')
+
+_local = threading.local()
+_NULL = contextlib.nullcontext()
+_hooks_lock = threading.Lock()
+_hooks_installed = False
+
+
+class Run:
+    """Catatan satu run skrip: penanda seksi dan span (loader/merge/figure/render) bersarang."""
+
+    def __init__(self, app):
+        self.app = app
+        self.t0 = time.perf_counter()
+        self.marks = [(PROLOG, self.t0)]
+        self.spans = []
+        self._open = []
+
+    @property
+    def section(self):
+        return self.marks[-1][0]
+
+    def mark_section(self, title):
+        self.marks.append((str(title), time.perf_counter()))
+
+    @contextlib.contextmanager
+    def span(self, kind, label):
+        record = {'kind': kind, 'label': label, 'section': self.section, 'depth': len(self._open),
+                  'cache': None, 'alloc_bytes': None, 'peak_bytes': None}
+        if TRACE_MEMORY:
+            self._attribute_peak()
+            record['peak_bytes'] = mem_start = tracemalloc.get_traced_memory()[0]
+        self._open.append(record)
+        t0 = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record['start_ms'] = (t0 - self.t0) * 1000
+            record['ms'] = (time.perf_counter() - t0) * 1000
+            if TRACE_MEMORY:
+                self._attribute_peak()
+                record['alloc_bytes'] = tracemalloc.get_traced_memory()[0] - mem_start
+            self._open.pop()
+            self.spans.append(record)
+
+    def _attribute_peak(self):
+        # Puncak sejak reset terakhir dimiliki semua span yang sedang terbuka
+        peak = tracemalloc.get_traced_memory()[1]
+        for record in self._open:
+            record['peak_bytes'] = max(record['peak_bytes'] or 0, peak)
+        tracemalloc.reset_peak()
+
+    def report(self):
+        t_end = time.perf_counter()
+        marks = self.marks + [(None, t_end)]
+        sections = []
+        for (title, t0), (_, t1) in zip(marks, marks[1:]):
+            if title == PROLOG and t1 - t0 < 1e-4:
+                continue
+            top = [s for s in self.spans if s['section'] == title and s['depth'] == 0]
+            entry = {'section': title, 'ms': (t1 - t0) * 1000}
+            for kind in ('loader', 'merge', 'figure', 'render'):
+                entry[f'{kind}_ms'] = sum(s['ms'] for s in top if s['kind'] == kind)
+            sections.append(entry)
+        spans = sorted(self.spans, key=lambda s: s['start_ms'])
+        return {
+            'app': self.app,
+            'total_ms': (t_end - self.t0) * 1000,
+            'cache': {status: sum(s['cache'] == status for s in spans) for status in ('hit', 'miss')},
+            'sections': sections,
+            'spans': spans,
+        }
+
+
+def current():
+    return getattr(_local, 'run', None)
+
+
+def begin_run(app):
+    """Mulai mencatat run skrip `app` di thread ini (no-op jika instrumentasi nonaktif)."""
+    if not ENABLED:
+        return
+    _install_hooks()
+    if TRACE_MEMORY and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    _local.run = Run(app)
+
+
+def span(kind, label):
+    """Context manager pengukur waktu; mengembalikan dict catatan span (atau None jika nonaktif)."""
+    if not ENABLED:
+        return _NULL
+    run = current()
+    return _NULL if run is None else run.span(kind, label)
+
+
+def section(title):
+    run = current()
+    if run is not None:
+        run.mark_section(title)
+
+
+def cache_status(status):
+    """Tandai span terdalam yang sedang terbuka sebagai 'hit' atau 'miss'."""
+    run = current()
+    if run is not None and run._open:
+        run._open[-1]['cache'] = status
+
+
+def cache_data(func=None, **kwargs):
+    """Pengganti `st.cache_data` yang, saat aktif, mencatat loader sebagai span dengan status hit/miss."""
+    import streamlit as st
+
+    return _cached(st.cache_data, func, kwargs)
+
+
+def cache_resource(func=None, **kwargs):
+    """Seperti `cache_data`, untuk `st.cache_resource` (satu instance bersama, tanpa salinan per sesi)."""
+    import streamlit as st
+
+    return _cached(st.cache_resource, func, kwargs)
+
+
+def _cached(decorator, func, kwargs):
+    if func is None:
+        return lambda f: _cached(decorator, f, kwargs)
+    if not ENABLED:
+        return decorator(func, **kwargs)
+
+    @functools.wraps(func)
+    def compute(*args, **kw):
+        # Hanya dieksekusi saat cache miss
+        cache_status('miss')
+        return func(*args, **kw)
+
+    cached = decorator(compute, **kwargs)
+
+    @functools.wraps(func)
+    def loader(*args, **kw):
+        with span('loader', func.__name__):
+            cache_status('hit')
+            return cached(*args, **kw)
+
+    loader.clear = cached.clear
+    return loader
+
+
+def _install_hooks():
+    """Bungkus st.title/header/subheader (penanda seksi) dan st.plotly_chart (span render) sekali per proses.
+
+    Pembungkus hanya mencatat jika thread pemanggil sedang menjalankan run yang diinstrumentasi.
+    """
+    global _hooks_installed
+    import streamlit as st
+
+    with _hooks_lock:
+        if _hooks_installed:
+            return
+
+        def heading(func):
+            @functools.wraps(func)
+            def wrapper(body, *args, **kwargs):
+                section(body)
+                return func(body, *args, **kwargs)
+            return wrapper
+
+        def plotly_chart(func):
+            @functools.wraps(func)
+            def wrapper(figure_or_data, *args, **kwargs):
+                title = getattr(getattr(getattr(figure_or_data, 'layout', None), 'title', None), 'text', None)
+                with span('render', title or 'plotly_chart'):
+                    return func(figure_or_data, *args, **kwargs)
+            return wrapper
+
+        for name in HEADING_CALLS:
+            setattr(st, name, heading(getattr(st, name)))
+        st.plotly_chart = plotly_chart(st.plotly_chart)
+        _hooks_installed = True
+
+
+def _log(report):
+    line = json.dumps(report, default=str)
+    logger.info(line)
+    path = os.environ.get('DASHBOARD_INSTRUMENT_LOG')
+    if path:
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(line + '\n')
+
+
+def render_panel():
+    """Akhiri run, tulis log terstruktur, dan tampilkan rincian di panel sidebar yang bisa dilipat."""
+    run = current()
+    if run is None:
+        return None
+    _local.run = None
+    report = run.report()
+    _log(report)
+
+    import pandas as pd
+    import streamlit as st
+
+    with st.sidebar.expander("⏱ Instrumentasi", expanded=False):
+        st.caption(f"Run {report['total_ms']:.0f} ms · cache hit {report['cache']['hit']} / "
+                   f"miss {report['cache']['miss']}" + (" · tracemalloc aktif" if TRACE_MEMORY else ""))
+        st.dataframe(pd.DataFrame(report['sections']).round(1), hide_index=True)
+        spans = pd.DataFrame(report['spans'])
+        if not spans.empty:
+            columns = ['section', 'kind', 'label', 'ms', 'cache']
+            if TRACE_MEMORY:
+                spans['alloc_mb'] = spans['alloc_bytes'] / 2**20
+                spans['peak_mb'] = spans['peak_bytes'] / 2**20
+                columns += ['alloc_mb', 'peak_mb']
+            st.dataframe(spans[columns].round(2), hide_index=True)
+
+        import compact
+        sizes = compact.report()
+        if not sizes.empty:
+            st.caption(f"Loader bersama (compact.shared_data): {sizes['asli_bytes'].sum() / 2**20:.2f} MB salinan "
+                       f"per sesi dihindari, instance ringkas {sizes['ringkas_bytes'].sum() / 2**20:.2f} MB")
+            st.dataframe(sizes, hide_index=True)
+    return report
@@ -0,0 +1,105 @@
+"""Indeks panel negara-tahun (mva, growth): deret per negara tanpa scan boolean mask seluruh panel.
+
+Lookup per tahun (`latest_growth`, `hours_latest`) ada di view SQL (query.py), bukan di sini.
+
+Indeks dibangun sekali per tabel Arrow di data_store dan dibangun ulang otomatis jika tabelnya diganti.
+"""
+import threading
+
+import numpy as np
+import pandas as pd
+
+import data_store
+
+# Dataset panel -> (kolom negara, kolom nilai)
+PANELS = {
+    'mva': ('Country Name', 'MVA_Pct_GDP'),
+    'growth': ('Country Name', 'Industrial_Growth_Pct'),
+}
+
+_EMPTY = np.array([], dtype=np.intp)
+
+
+class PanelIndex:
+    """Indeks atas DataFrame panel long-form (negara, tahun, nilai).
+
+    - `country(name, min_year)`: deret satu negara terurut tahun, O(log n) untuk batas tahun
+    - `rows(names, min_year)`: baris beberapa negara dalam urutan baris asli
+    - `group_stat(names, stat, min_year)`: agregat per tahun untuk grup negara (di-memo per grup)
+
+    Semua hasil berupa DataFrame baru dengan label index baris asli, aman dimodifikasi pemanggil.
+    """
+
+    def __init__(self, df, country_col, value_col, year_col='Year'):
+        self.frame = df
+        self.country_col, self.value_col, self.year_col = country_col, value_col, year_col
+
+        years = df[year_col].to_numpy()
+        codes, uniques = pd.factorize(df[country_col])
+        self._code = {name: i for i, name in enumerate(uniques)}
+        self.countries = sorted(self._code)
+
+        # Blok per negara, di dalam blok terurut tahun
+        self._by_country = np.lexsort((years, codes))
+        self._bounds = np.concatenate([[0], np.cumsum(np.bincount(codes, minlength=len(uniques)))])
+        self._country_years = years[self._by_country]
+
+        self._group_cache = {}
+        self._lock = threading.Lock()
+
+    def _rows(self, positions):
+        return self.frame.iloc[positions]
+
+    def _country_positions(self, name, min_year=None):
+        code = self._code.get(name)
+        if code is None:
+            return _EMPTY
+        lo, hi = self._bounds[code], self._bounds[code + 1]
+        if min_year is not None:
+            lo += np.searchsorted(self._country_years[lo:hi], min_year, side='left')
+        return self._by_country[lo:hi]
+
+    def country(self, name, min_year=None):
+        """Baris negara `name` terurut tahun, opsional hanya tahun >= `min_year`."""
+        return self._rows(self._country_positions(name, min_year))
+
+    def rows(self, names, min_year=None):
+        """Baris beberapa negara (urutan baris asli), opsional hanya tahun >= `min_year`."""
+        positions = [self._country_positions(name, min_year) for name in dict.fromkeys(names)]
+        return self._rows(np.sort(np.concatenate(positions)) if positions else _EMPTY)
+
+    def group_stat(self, names, stat='median', min_year=None):
+        """Agregat `stat` per tahun atas grup negara `names` (NaN diabaikan), mis. median G7."""
+        key = (tuple(sorted(set(names))), stat, min_year)
+        with self._lock:
+            result = self._group_cache.get(key)
+        if result is None:
+            result = self.rows(names, min_year).groupby(self.year_col)[self.value_col].agg(stat).reset_index()
+            with self._lock:
+                self._group_cache[key] = result
+        return result.copy()
+
+
+_indexes = {}
+_locks = {name: threading.Lock() for name in PANELS}
+
+
+def get(name):
+    """PanelIndex untuk dataset panel `name`, dibangun sekali per tabel data_store."""
+    table = data_store.get_table(name)
+    cached = _indexes.get(name)
+    if cached is None or cached[0] is not table:
+        with _locks[name]:
+            cached = _indexes.get(name)
+            if cached is None or cached[0] is not table:
+                country_col, value_col = PANELS[name]
+                cached = (table, PanelIndex(table.to_pandas(), country_col, value_col))
+                _indexes[name] = cached
+    return cached[1]
+
+
+@data_store.on_reload
+def _rebuild(name):
+    # Indeks versi baru dibangun di thread watcher, bukan pada request pertama setelah reload
+    if name in PANELS:
+        get(name)
@@ -0,0 +1,32 @@
+"""Proyeksi GDP dengan bootstrap pertumbuhan historis, dihitung sebagai satu operasi array NumPy."""
+import numpy as np
+import pandas as pd
+
+
+def bootstrap_paths(growth_pct, start_value, n_years, n_sims=10_000, seed=0):
+    """Jalur nilai hasil resampling pertumbuhan historis (%), bentuk (n_sims, n_years).
+
+    Kolom pertama adalah `start_value` (tahun dasar); kolom berikutnya mengompaunkan
+    pertumbuhan yang diambil acak (dengan pengembalian) dari `growth_pct`.
+    """
+    history = np.asarray(growth_pct, dtype=float)
+    history = history[~np.isnan(history)]
+    if history.size == 0:
+        raise ValueError("Seri pertumbuhan historis kosong")
+    rng = np.random.default_rng(seed)
+    draws = rng.choice(1 + history / 100, size=(n_sims, n_years - 1))
+    paths = np.empty((n_sims, n_years))
+    paths[:, 0] = start_value
+    np.cumprod(draws, axis=1, out=paths[:, 1:])
+    paths[:, 1:] *= start_value
+    return paths
+
+
+def percentile_bands(paths, years, percentiles=(5, 50, 95)):
+    """Ringkas jalur simulasi menjadi DataFrame persentil per tahun (+ rata-rata)."""
+    bands = np.percentile(paths, percentiles, axis=0)
+    df = pd.DataFrame({'Tahun': years})
+    for p, values in zip(percentiles, bands):
+        df[f'P{p:g}'] = values
+    df['Mean'] = paths.mean(axis=0)
+    return df
@@ -0,0 +1,303 @@
+"""Lapisan SQL in-process atas semua dataset dashboard (DuckDB jika terpasang, selain itu SQLite).
+
+Setiap sumber data_store terdaftar sebagai tabel dengan nama dataset-nya (mva, growth, ituc_score,
+hours_ilo, gdp, slavery, tahanan, ituc, ppp, labor_force) ditambah dua kolom:
+    ISO3  -- kode negara dari kolom nama negara (countries.to_iso3), NULL jika tidak dikenal
+    _row  -- nomor baris di file sumber, untuk ORDER BY yang mengikuti urutan file
+Setiap file `views/<nama>.sql` (satu SELECT) menjadi view `<nama>`: analis bisa menambah view
+tanpa menyentuh kode pandas.
+
+Tabel dan view didaftarkan saat pertama kali disebut sebuah query (langsung atau lewat view),
+dengan kunci versi dataset-nya: query BAB I tidak memuat dataset yang tidak disebutnya.
+
+Backend:
+- DuckDB (opsional, `pip install duckdb`): tabel Arrow data_store didaftarkan tanpa salinan dan
+  filter/proyeksi didorong ke pemindaian kolom. Setiap thread memakai cursor sendiri dari pool,
+  jadi query dari sesi berbeda berjalan paralel.
+- SQLite (fallback stdlib, dipakai jika DuckDB tidak terpasang): setiap tabel yang dipakai DISALIN
+  sekali per versi sumber ke database in-memory (bukan zero-copy). Semua sesi berbagi satu koneksi;
+  query berjalan bersamaan, hanya pendaftaran tabel/view yang eksklusif.
+DASHBOARD_SQL_BACKEND=sqlite memaksa SQLite.
+
+Pemakaian (debugging):
+    python query.py                                          # daftar tabel & view
+    python query.py "SELECT * FROM latest_growth LIMIT 5"
+"""
+import argparse
+import contextlib
+import os
+import re
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+import countries
+import data_store
+import instrument
+
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
+
+BASE_DIR = Path(__file__).resolve().parent
+VIEWS_DIR = BASE_DIR / 'views'
+
+BACKEND = 'duckdb' if duckdb is not None and os.environ.get('DASHBOARD_SQL_BACKEND', '').lower() != 'sqlite' \
+    else 'sqlite'
+
+# Kolom yang diberi index di SQLite (DuckDB memakai zone map pada scan kolom)
+INDEX_COLUMNS = ('ISO3', 'Year')
+
+# Nama yang disebut SQL: identifier bertanda kutip atau kata biasa (komentar & literal string dibuang dulu)
+_IDENTIFIER = re.compile(r'"([^"]+)"|([A-Za-z_]\w*)')
+_COMMENT_OR_LITERAL = re.compile(r"--[^\n]*|'(?:[^']|'')*'")
+
+
+class _Session:
+    """Satu koneksi/cursor beserta tabel & view yang sudah didaftarkan di dalamnya."""
+
+    def __init__(self, con):
+        self.con = con
+        # Dataset -> kunci versi tabel terdaftar; view -> SQL terdaftar
+        self.tables = {}
+        self.views = {}
+
+
+class _ReadWriteLock:
+    """Banyak pembaca bersamaan, satu penulis eksklusif."""
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._readers = 0
+        self._writer = False
+
+    @contextlib.contextmanager
+    def read(self):
+        with self._cond:
+            self._cond.wait_for(lambda: not self._writer)
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                self._cond.notify_all()
+
+    @contextlib.contextmanager
+    def write(self):
+        with self._cond:
+            self._cond.wait_for(lambda: not self._writer and not self._readers)
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer = False
+                self._cond.notify_all()
+
+
+_connect_lock = threading.Lock()
+# DuckDB: koneksi induk + cursor menganggur (tabel Arrow terdaftar hanya terlihat di cursor pendaftarnya)
+_duck = None
+_idle = []
+# Tabel Arrow + ISO3 + _row per dataset, dibagi semua cursor DuckDB: dataset -> (kunci versi, tabel)
+_arrow_tables = {}
+_arrow_lock = threading.Lock()
+# SQLite: satu koneksi bersama; query memegang sisi baca, pendaftaran sisi tulis
+_sqlite = None
+_sqlite_lock = _ReadWriteLock()
+
+
+def sql_table(name):
+    """Tabel Arrow `name` seperti yang dilihat SQL: kolom sumber + ISO3 + _row."""
+    table = data_store.get_table(name)
+    if name in data_store.COUNTRY_COLUMNS:
+        names = table.column(data_store.COUNTRY_COLUMNS[name]).to_pandas()
+        iso3 = countries.to_iso3(names).astype(object)
+        table = table.append_column('ISO3', pa.array(iso3.where(iso3.notna(), None), type=pa.string()))
+    return table.append_column('_row', pa.array(np.arange(table.num_rows, dtype=np.int64)))
+
+
+def view_files():
+    """Nama view -> isi SQL dari VIEWS_DIR."""
+    return {path.stem: path.read_text(encoding='utf-8') for path in sorted(VIEWS_DIR.glob('*.sql'))}
+
+
+def _referenced(sql):
+    names = set()
+    for quoted, word in _IDENTIFIER.findall(_COMMENT_OR_LITERAL.sub(' ', sql)):
+        names.add(quoted or word.lower())
+    return names
+
+
+def _plan(names, views):
+    """Dataset dan view (urut dependensi) yang dibutuhkan nama-nama `names`."""
+    tables, ordered = [], []
+
+    def visit(name, visiting):
+        if name in views:
+            if name in ordered or name in visiting:
+                return
+            for dep in sorted(_referenced(views[name])):
+                visit(dep, visiting | {name})
+            ordered.append(name)
+        elif name in data_store.SOURCES and name not in tables:
+            tables.append(name)
+
+    for name in names:
+        visit(name, frozenset())
+    return tables, ordered
+
+
+def _table_keys(tables):
+    """Dataset -> kunci versi (None jika gagal dimuat); hanya dataset `tables` yang dimuat."""
+    versions = dict(zip(tables, data_store.versions(tuple(tables))))
+    # Kolom ISO3 bergantung pada daftar negara file WDI (countries.country_index), bukan tabel WDI-nya
+    wdi_files = tuple(data_store.file_signature(n) for n in data_store.WDI_VALUE_NAMES) \
+        if any(name in data_store.COUNTRY_COLUMNS for name in tables) else None
+    return {name: None if version is None else (version, wdi_files if name in data_store.COUNTRY_COLUMNS else None)
+            for name, version in versions.items()}
+
+
+def _stale(session, keys, views, view_sql):
+    # Dataset yang gagal dimuat (kunci None) dilewati; query yang memakainya gagal dengan pesan jelas
+    return any(key is not None and session.tables.get(name) != key for name, key in keys.items()) \
+        or any(session.views.get(name) != view_sql[name] for name in views)
+
+
+def _shared_arrow(name, key):
+    with _arrow_lock:
+        cached = _arrow_tables.get(name)
+        if cached is None or cached[0] != key:
+            cached = (key, sql_table(name))
+            _arrow_tables[name] = cached
+    return cached[1]
+
+
+def _copy_to_sqlite(con, name, table):
+    # Salinan langsung dari batch Arrow (tanpa DataFrame perantara); tipe mengikuti afinitas SQLite
+    def affinity(t):
+        if pa.types.is_integer(t) or pa.types.is_boolean(t):
+            return 'INTEGER'
+        return 'REAL' if pa.types.is_floating(t) else 'TEXT'
+
+    columns = ', '.join(f'"{f.name}" {affinity(f.type)}' for f in table.schema)
+    con.execute(f'DROP TABLE IF EXISTS "{name}"')
+    con.execute(f'CREATE TABLE "{name}" ({columns})')
+    insert = f'INSERT INTO "{name}" VALUES ({placeholders(table.schema)})'
+    for batch in table.to_batches(max_chunksize=10_000):
+        con.executemany(insert, zip(*(col.to_pylist() for col in batch.columns)))
+    for col in INDEX_COLUMNS:
+        if col in table.column_names:
+            con.execute(f'CREATE INDEX "{name}_{col}" ON "{name}" ("{col}")')
+    con.commit()
+
+
+def _prepare(session, keys, views, view_sql):
+    """Daftarkan tabel yang versinya berubah dan view yang baru/berubah di `session`."""
+    for name, key in keys.items():
+        if key is not None and session.tables.get(name) != key:
+            if BACKEND == 'duckdb':
+                session.con.register(name, _shared_arrow(name, key))
+            else:
+                _copy_to_sqlite(session.con, name, sql_table(name))
+            session.tables[name] = key
+    for name in views:
+        sql = view_sql[name]
+        if session.views.get(name) != sql:
+            session.con.execute(f'DROP VIEW IF EXISTS "{name}"')
+            session.con.execute(f'CREATE TEMP VIEW "{name}" AS {sql.strip().rstrip(";")}')
+            session.views[name] = sql
+
+
+@contextlib.contextmanager
+def _session(names):
+    """Sesi tempat `names` (tabel/view, beserta dependensinya) sudah terdaftar dengan versi terbaru."""
+    global _duck, _sqlite
+    view_sql = view_files()
+    tables, views = _plan(names, view_sql)
+    keys = _table_keys(tables)
+    if BACKEND == 'duckdb':
+        with _connect_lock:
+            if _duck is None:
+                _duck = duckdb.connect(':memory:')
+            session = _idle.pop() if _idle else _Session(_duck.cursor())
+        try:
+            # Cursor ini hanya dipakai thread ini sampai dikembalikan: pendaftaran & query tanpa lock global
+            _prepare(session, keys, views, view_sql)
+            yield session
+        finally:
+            with _connect_lock:
+                _idle.append(session)
+        return
+    with _connect_lock:
+        if _sqlite is None:
+            _sqlite = _Session(sqlite3.connect(':memory:', check_same_thread=False))
+    if _stale(_sqlite, keys, views, view_sql):
+        with _sqlite_lock.write():
+            _prepare(_sqlite, keys, views, view_sql)
+    with _sqlite_lock.read():
+        yield _sqlite
+
+
+def refresh(names=None):
+    """Daftarkan `names` (default: semua view di VIEWS_DIR) beserta tabel yang dipakainya."""
+    with _session(view_files() if names is None else names):
+        pass
+
+
+def placeholders(values):
+    """'?, ?, ?' untuk klausa IN dengan parameter sebanyak `values` ('NULL' jika kosong: tidak cocok apa pun)."""
+    return ', '.join('?' * len(values)) or 'NULL'
+
+
+def query(sql, params=(), label=None):
+    """Jalankan SELECT atas tabel & view dashboard; hasilnya DataFrame baru.
+
+    Hanya tabel/view yang disebut `sql` (dan dependensi view-nya) yang dimuat & didaftarkan.
+    Parameter memakai placeholder posisi `?` (berlaku untuk DuckDB dan SQLite).
+    """
+    params = list(params)
+    with _session(_referenced(sql)) as session, \
+            instrument.span('sql', label or ' '.join(sql.split())[:60]):
+        if BACKEND == 'duckdb':
+            result = session.con.execute(sql, params).arrow()
+            # DuckDB baru mengembalikan RecordBatchReader, versi lama langsung pa.Table
+            if isinstance(result, pa.RecordBatchReader):
+                result = result.read_all()
+            return result.to_pandas()
+        return pd.read_sql_query(sql, session.con, params=params)
+
+
+def tables():
+    """Daftar semua tabel & view yang bisa di-query, beserta jumlah baris (memuat semua dataset)."""
+    views = view_files()
+    with _session([*data_store.SOURCES, *views]) as session:
+        rows = [{'nama': name, 'jenis': 'tabel', 'baris': data_store.get_table(name).num_rows}
+                for name in session.tables]
+    rows += [{'nama': name, 'jenis': 'view', 'baris': None} for name in views]
+    return pd.DataFrame(rows).astype({'baris': 'Int64'})
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('sql', nargs='?', help='SELECT yang dijalankan; tanpa argumen: daftar tabel & view')
+    args = parser.parse_args(argv)
+
+    with pd.option_context('display.width', 200, 'display.max_columns', 20):
+        if args.sql is None:
+            print(f'Backend: {BACKEND}')
+            print(tables().to_string(index=False))
+        else:
+            print(query(args.sql).to_string(index=False))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""Regresi linear OLS bentuk tertutup (NumPy), tervektorisasi untuk banyak grup sekaligus.
+
+Pengganti `trendline="ols"` Plotly Express agar statsmodels tidak perlu di-import.
+"""
+import math
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+
+def t_quantile(p, dof):
+    """Kuantil distribusi t Student (tervektorisasi atas `dof`), tanpa SciPy.
+
+    dof 1 dan 2 memakai rumus eksak; selebihnya ekspansi Cornish-Fisher. Galat relatif terhadap SciPy:
+    < 0.2% untuk p <= 0.975 (pita 95%) pada dof >= 3, < 0.1% untuk p <= 0.995 pada dof >= 5.
+    """
+    dof = np.asarray(dof, dtype=float)
+    z = NormalDist().inv_cdf(p)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = (z
+             + (z**3 + z) / (4 * dof)
+             + (5 * z**5 + 16 * z**3 + 3 * z) / (96 * dof**2)
+             + (3 * z**7 + 19 * z**5 + 17 * z**3 - 15 * z) / (384 * dof**3)
+             + (79 * z**9 + 776 * z**7 + 1482 * z**5 - 1920 * z**3 - 945 * z) / (92160 * dof**4))
+    t = np.where(dof == 1, math.tan(math.pi * (p - 0.5)), t)
+    t = np.where(dof == 2, (2 * p - 1) / math.sqrt(2 * p * (1 - p)), t)
+    return np.where(dof >= 1, t, np.nan)
+
+
+def fit_ols(x, y, groups=None):
+    """Slope, intercept, R² dan statistik pendukung per grup, dihitung dari jumlah-jumlah (bincount).
+
+    Mengembalikan DataFrame dengan satu baris per grup (index = label grup, atau 'all').
+    Pasangan dengan NaN dibuang.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if groups is None:
+        labels, codes = np.array(['all']), np.zeros(len(x), dtype=np.intp)
+    else:
+        codes, labels = pd.factorize(np.asarray(groups), sort=True)
+    valid = ~(np.isnan(x) | np.isnan(y)) & (codes >= 0)
+    x, y, codes = x[valid], y[valid], codes[valid]
+
+    k = len(labels)
+    n = np.bincount(codes, minlength=k).astype(float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x_mean = np.bincount(codes, x, minlength=k) / n
+        y_mean = np.bincount(codes, y, minlength=k) / n
+        dx, dy = x - x_mean[codes], y - y_mean[codes]
+        sxx = np.bincount(codes, dx * dx, minlength=k)
+        syy = np.bincount(codes, dy * dy, minlength=k)
+        sxy = np.bincount(codes, dx * dy, minlength=k)
+
+        slope = sxy / sxx
+        intercept = y_mean - slope * x_mean
+        r2 = np.where(syy > 0, sxy**2 / (sxx * syy), np.nan)
+        # Varians residual dengan derajat bebas n - 2
+        resid_var = np.clip(syy - slope * sxy, 0, None) / (n - 2)
+
+    return pd.DataFrame({
+        'slope': slope, 'intercept': intercept, 'r2': r2, 'n': n.astype(int),
+        'x_mean': x_mean, 'sxx': sxx, 'resid_var': resid_var,
+    }, index=pd.Index(labels, name='group'))
+
+
+def predict(fit, x_grid, level=0.95):
+    """Garis tren dan pita kepercayaan rata-rata untuk setiap grup pada `x_grid`.
+
+    Mengembalikan (yhat, lower, upper), masing-masing array berbentuk (n_grup, len(x_grid)).
+    """
+    x_grid = np.asarray(x_grid, dtype=float)[None, :]
+    slope = fit['slope'].to_numpy()[:, None]
+    intercept = fit['intercept'].to_numpy()[:, None]
+    n = fit['n'].to_numpy()[:, None].astype(float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        yhat = intercept + slope * x_grid
+        se = np.sqrt(fit['resid_var'].to_numpy()[:, None]
+                     * (1 / n + (x_grid - fit['x_mean'].to_numpy()[:, None])**2 / fit['sxx'].to_numpy()[:, None]))
+    half = t_quantile(0.5 + level / 2, n - 2) * se
+    return yhat, yhat - half, yhat + half
+
+
+def trendline_traces(fit, x_min, x_max, y_label='y', x_label='x', level=0.95, points=50,
+                     colors=None, band_opacity=0.15):
+    """Trace Plotly (pita kepercayaan + garis OLS) per grup, untuk ditumpuk di atas scatter."""
+    import plotly.graph_objects as go
+    x_grid = np.linspace(x_min, x_max, points)
+    yhat, lower, upper = predict(fit, x_grid, level=level)
+    traces = []
+    for i, (group, row) in enumerate(fit.iterrows()):
+        color = (colors or {}).get(group, '#FFA500')
+        name = 'OLS trendline' if group == 'all' else f'OLS {group}'
+        rgb = _hex_to_rgb(color)
+        traces.append(go.Scatter(
+            x=np.concatenate([x_grid, x_grid[::-1]]),
+            y=np.concatenate([upper[i], lower[i][::-1]]),
+            fill='toself', fillcolor=f'rgba({rgb}, {band_opacity})', line=dict(width=0),
+            hoverinfo='skip', showlegend=False, name=f'{name} CI {level:.0%}'
+        ))
+        traces.append(go.Scatter(
+            x=x_grid, y=yhat[i], mode='lines', line=dict(color=color, width=2), name=name, showlegend=False,
+            hovertemplate=(f"<b>{name}</b><br>{y_label} = {row['slope']:.6g} * {x_label} + {row['intercept']:.6g}"
+                           f"<br>R<sup>2</sup>={row['r2']:.6f}<br>n={row['n']}<extra></extra>")
+        ))
+    return traces
+
+
+def _hex_to_rgb(color):
+    color = color.lstrip('#')
+    return ', '.join(str(int(color[i:i + 2], 16)) for i in (0, 2, 4))
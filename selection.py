@@ -0,0 +1,190 @@
+"""Indeks bitmap untuk seleksi negara/tahun/region/peringkat ITUC dari widget sidebar.
+
+Untuk setiap dataset data_store dibangun sekali (per versi sumber) satu bitmap per nilai dimensi:
+    country -- kode ISO3 (countries.to_iso3 dari kolom nama negara)
+    year    -- kolom Year/Tahun
+    region  -- region Walk Free (slavery.csv) negara tersebut, lewat ISO3
+    rating  -- peringkat ITUC Global Rights Index (ITUC.csv) negara tersebut, lewat ISO3
+Seleksi apa pun di-resolve dengan OR di dalam satu dimensi dan AND antar dimensi menjadi posisi
+baris, lalu data chart diambil dengan `iloc` tanpa scan `isin` atas seluruh frame.
+"""
+import threading
+
+import numpy as np
+import pandas as pd
+
+import countries
+import data_store
+
+YEAR_COLUMNS = ('Year', 'Tahun')
+
+# Dataset sumber dimensi region (slavery) dan rating (ituc), selain dataset yang diindeks
+DIMENSION_DATASETS = ('slavery', 'ituc')
+
+_EMPTY = np.array([], dtype=np.intp)
+
+
+class BitmapIndex:
+    """Bitmap (np.packbits) per nilai dimensi atas satu DataFrame.
+
+    - `positions(**kriteria)`: posisi baris yang memenuhi semua dimensi, urutan baris asli
+    - `take(frame=None, **kriteria)`: baris terpilih dari frame indeks atau frame lain yang barisnya
+      sejajar (mis. hasil loader yang hanya menambah kolom)
+    - `values(dim, **kriteria)` / `names(**kriteria)`: nilai dimensi / nama negara yang masih tersedia
+
+    Kriteria berupa iterable nilai per dimensi (mis. `country=['CHN', 'VNM'], year=range(2005, 2025)`);
+    None atau dimensi yang tidak disebut berarti tanpa filter.
+    """
+
+    def __init__(self, df, country_col, region_of=None, rating_of=None):
+        self.frame = df
+        self.n = len(df)
+        iso3 = countries.to_iso3(df[country_col]).astype(object)
+        keys = {'country': iso3}
+        year_col = next((col for col in YEAR_COLUMNS if col in df.columns), None)
+        if year_col is not None:
+            keys['year'] = df[year_col].astype('Int64').astype(object)
+        if region_of is not None:
+            keys['region'] = iso3.map(region_of)
+        if rating_of is not None:
+            keys['rating'] = iso3.map(rating_of)
+        self._bitmaps = {dim: self._build(values) for dim, values in keys.items()}
+
+        # Nama tampilan per ISO3 (nama pertama di frame) dan sebaliknya, untuk widget
+        named = pd.DataFrame({'name': df[country_col].to_numpy(), 'iso3': iso3.to_numpy()}).dropna()
+        self._name_of = dict(zip(named['iso3'][::-1], named['name'][::-1]))
+        self._iso3_of = dict(zip(named['name'], named['iso3']))
+
+    def _build(self, values):
+        codes, uniques = pd.factorize(values)
+        # Satu bitmap per nilai; nilai kosong (NaN) tidak masuk bitmap mana pun
+        return {_plain(value): np.packbits(codes == i) for i, value in enumerate(uniques)}
+
+    def has(self, dim):
+        return dim in self._bitmaps
+
+    def _mask(self, criteria):
+        mask = None
+        for dim, wanted in criteria.items():
+            if wanted is None:
+                continue
+            if dim not in self._bitmaps:
+                raise KeyError(f'dimensi {dim!r} tidak ada di indeks ini (tersedia: {", ".join(self._bitmaps)})')
+            bitmaps = self._bitmaps[dim]
+            selected = np.zeros((self.n + 7) // 8, dtype=np.uint8)
+            for value in wanted:
+                bitmap = bitmaps.get(_plain(value))
+                if bitmap is not None:
+                    np.bitwise_or(selected, bitmap, out=selected)
+            mask = selected if mask is None else np.bitwise_and(mask, selected, out=mask)
+        return mask
+
+    def positions(self, **criteria):
+        """Posisi baris (urutan asli) yang memenuhi semua kriteria."""
+        mask = self._mask(criteria)
+        if mask is None:
+            return np.arange(self.n)
+        return np.flatnonzero(np.unpackbits(mask, count=self.n)) if mask.any() else _EMPTY
+
+    def take(self, frame=None, **criteria):
+        """Baris terpilih dari `frame` (default: frame indeks)."""
+        frame = self.frame if frame is None else frame
+        if len(frame) != self.n:
+            raise ValueError(f'frame berisi {len(frame)} baris, indeks dibangun atas {self.n} baris')
+        return frame.iloc[self.positions(**criteria)]
+
+    def values(self, dim, **criteria):
+        """Nilai `dim` yang muncul di baris terpilih, terurut."""
+        mask = self._mask(criteria)
+        bitmaps = self._bitmaps.get(dim, {})
+        found = [value for value, bitmap in bitmaps.items() if mask is None or np.bitwise_and(bitmap, mask).any()]
+        return sorted(found)
+
+    def names(self, **criteria):
+        """Nama negara (sesuai kolom frame) yang punya baris terpilih, terurut."""
+        return sorted(self._name_of[iso3] for iso3 in self.values('country', **criteria))
+
+    def name(self, iso3):
+        """Nama negara untuk ISO3 seperti tertulis di frame ini (ISO3 itu sendiri jika tidak ada)."""
+        return self._name_of.get(iso3, iso3)
+
+    def iso3(self, names):
+        """Nama negara (seperti di frame ini) -> ISO3; nama yang tidak dikenal dilewati."""
+        return [self._iso3_of[name] for name in names if name in self._iso3_of]
+
+
+def _plain(value):
+    # Kunci bitmap sebagai tipe Python biasa: 2024 dan np.int64(2024) menemukan bitmap yang sama
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _country_map(name, column):
+    """ISO3 -> nilai `column` dataset `name` (baris pertama per negara)."""
+    df = countries.with_iso3(data_store.get_frame(name), data_store.COUNTRY_COLUMNS[name]).dropna(subset=['ISO3'])
+    df = df.drop_duplicates('ISO3')
+    return dict(zip(df['ISO3'].astype(str), df[column]))
+
+
+_indexes = {}
+_locks = {name: threading.Lock() for name in data_store.COUNTRY_COLUMNS}
+
+
+def datasets(name):
+    """Dataset data_store yang dimuat untuk membangun indeks `name`."""
+    return tuple(dict.fromkeys((name, *DIMENSION_DATASETS)))
+
+
+def get(name):
+    """BitmapIndex untuk dataset `name`, dibangun sekali per versi `datasets(name)` dan file WDI."""
+    # ISO3 bergantung pada daftar negara di file WDI (countries.country_index), bukan tabel WDI-nya:
+    # cukup signature file, tabel ppp/labor_force tidak ikut dimuat
+    wdi_files = tuple(data_store.file_signature(n) for n in data_store.WDI_VALUE_NAMES)
+    key = (data_store.versions(datasets(name)), wdi_files)
+    cached = _indexes.get(name)
+    if cached is None or cached[0] != key:
+        with _locks[name]:
+            cached = _indexes.get(name)
+            if cached is None or cached[0] != key:
+                index = BitmapIndex(data_store.get_frame(name), data_store.COUNTRY_COLUMNS[name],
+                                    region_of=_country_map('slavery', 'Region'),
+                                    rating_of=_country_map('ituc', 'Rating'))
+                cached = (key, index)
+                _indexes[name] = cached
+    return cached[1]
+
+
+@data_store.on_reload
+def _rebuild(name):
+    # Indeks yang sudah pernah dipakai dibangun ulang di thread watcher, bukan saat widget berikutnya berubah
+    for dataset in list(_indexes):
+        if name in datasets(dataset) or name in data_store.WDI_VALUE_NAMES:
+            get(dataset)
+
+
+# ---------------------------------------------------------
+# WIDGET SIDEBAR
+# ---------------------------------------------------------
+
+def sidebar_filters(index, key, year_start=None):
+    """Widget sidebar Region, Peringkat ITUC dan rentang tahun; mengembalikan kriteria untuk `take`."""
+    import streamlit as st
+
+    regions = st.sidebar.multiselect("Region", index.values('region'), key=f'{key}_region')
+    ratings = st.sidebar.multiselect("Peringkat ITUC", index.values('rating'), key=f'{key}_rating')
+    criteria = {'region': regions or None, 'rating': ratings or None}
+    if index.has('year'):
+        years = index.values('year')
+        start = years[0] if year_start is None else min(max(year_start, years[0]), years[-1])
+        first, last = st.sidebar.slider("Rentang tahun", years[0], years[-1], (start, years[-1]), key=f'{key}_years')
+        criteria['year'] = range(first, last + 1)
+    return criteria
+
+
+def country_picker(label, index, default, criteria, key):
+    """Multiselect negara di sidebar (pilihan dibatasi kriteria region/peringkat); mengembalikan ISO3."""
+    import streamlit as st
+
+    # Kriteria boleh berasal dari indeks dataset lain: dimensi yang tidak ada di indeks ini diabaikan
+    options = index.names(**{dim: wanted for dim, wanted in criteria.items() if index.has(dim)})
+    picked = st.sidebar.multiselect(label, options, default=[name for name in default if name in options], key=key)
+    return index.iso3(picked)
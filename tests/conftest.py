@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Modul dashboard ada di root repo (layout datar), bukan paket
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
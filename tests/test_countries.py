@@ -0,0 +1,43 @@
+"""Join ISO3: nama negara yang tidak dikenal tidak boleh saling berpasangan."""
+import pandas as pd
+
+import countries
+import derived
+
+
+def _slavery():
+    return countries.with_iso3(pd.DataFrame({
+        'Country': ['Indonesia', 'Atlantis'],
+        'Estimated number of people in modern slavery': [1_800_000, 999],
+    }), 'Country')
+
+
+def _gdp():
+    return countries.with_iso3(pd.DataFrame({
+        'Country': ['Indonesia', 'Lemuria'],
+        'GDP (nominal, 2023)': [1.37e12, 1.0],
+        'GDP Growth': [5.0, 0.0],
+        'Population': [277_000_000, 1],
+    }), 'Country')
+
+
+def test_unmapped_names_get_nan_iso3():
+    assert _slavery()['ISO3'].isna().tolist() == [False, True]
+    assert _gdp()['ISO3'].isna().tolist() == [False, True]
+
+
+def test_merge_on_iso3_drops_unmapped_rows():
+    df = countries.merge_on_iso3(_slavery(), _gdp().drop(columns='Country'))
+    assert df['ISO3'].tolist() == ['IDN']
+    assert df['Country'].tolist() == ['Indonesia']
+
+
+def test_slavery_gdp_drops_unmapped_rows():
+    df = derived.slavery_gdp(_slavery(), _gdp())
+    assert df['Country'].tolist() == ['Indonesia']
+    assert df['GDP_Trillion'].tolist() == [1.37]
+    assert df['Slavery_Pop'].tolist() == [1_800_000]
+
+    wage = countries.with_iso3(pd.DataFrame({'Country': ['Indonesia', 'El Dorado'], 'Wage': [200.0, 1.0]}), 'Country')
+    fair = countries.merge_on_iso3(wage, derived.gdp_population(df))
+    assert fair[['Country', 'ISO3']].astype(str).values.tolist() == [['Indonesia', 'IDN']]
@@ -0,0 +1,63 @@
+"""downsample.lttb_indices dan downsample_long/downsample_wide."""
+import numpy as np
+import pandas as pd
+import pytest
+
+import downsample
+
+
+@pytest.fixture
+def series():
+    rng = np.random.default_rng(0)
+    x = np.arange(5000, dtype=float)
+    y = np.sin(x / 300) + rng.normal(0, 0.05, len(x))
+    y[3217] = 25.0  # puncak tunggal yang harus tetap terlihat
+    return x, y
+
+
+@pytest.mark.parametrize('n_out', [3, 10, 137, 1000])
+def test_lttb_endpoints_and_count(series, n_out):
+    x, y = series
+    idx = downsample.lttb_indices(x, y, n_out)
+    assert len(idx) == n_out
+    assert idx[0] == 0 and idx[-1] == len(x) - 1
+    assert (np.diff(idx) > 0).all()
+
+
+def test_lttb_keeps_spike(series):
+    x, y = series
+    assert 3217 in downsample.lttb_indices(x, y, 100)
+
+
+@pytest.mark.parametrize('n_out', [2, 5000, 6000])
+def test_lttb_returns_all_when_not_reducible(series, n_out):
+    x, y = series
+    np.testing.assert_array_equal(downsample.lttb_indices(x, y, n_out), np.arange(len(x)))
+
+
+def test_downsample_long_per_group_budget():
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame({
+        'Year': np.tile(np.arange(3000), 2),
+        'Country': np.repeat(['A', 'B'], 3000),
+        'Value': rng.normal(size=6000),
+    })
+    out = downsample.downsample_long(df, 'Year', 'Value', by='Country', max_points=1000)
+    counts = out['Country'].value_counts()
+    assert counts['A'] == counts['B'] == 500
+    # Baris terpilih tetap dalam urutan asli, dengan titik pertama & terakhir tiap negara
+    assert out.index.is_monotonic_increasing
+    for country, rows in out.groupby('Country'):
+        assert rows['Year'].iloc[0] == 0 and rows['Year'].iloc[-1] == 2999
+
+
+def test_downsample_wide_keeps_gap_breaks():
+    x = np.arange(10_000)
+    y = np.cos(x / 500.0)
+    y[4000:4100] = np.nan
+    df = pd.DataFrame({'Tahun': x, 'A': y})
+    out = downsample.downsample_wide(df, 'Tahun', ['A'], max_points=400)
+    assert len(out) < len(df)
+    # NaN pertama setelah titik valid dipertahankan agar garis tetap terputus di celah data
+    assert 4000 in out['Tahun'].to_numpy()
+    assert out['A'].isna().sum() == 1
@@ -0,0 +1,57 @@
+"""PanelIndex dibandingkan dengan boolean mask pandas biasa."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from panel_index import PanelIndex
+
+COUNTRIES = ['China', 'France', 'Germany', 'Japan', 'Viet Nam']
+
+
+@pytest.fixture
+def panel():
+    rng = np.random.default_rng(5)
+    df = pd.DataFrame([(c, y) for c in COUNTRIES for y in range(1995, 2025)], columns=['Country Name', 'Year'])
+    df['Value'] = rng.normal(10, 3, len(df))
+    df.loc[rng.choice(len(df), 20, replace=False), 'Value'] = np.nan
+    # Urutan baris acak: indeks tidak boleh bergantung pada file yang sudah terurut
+    return df.sample(frac=1, random_state=3).reset_index(drop=True)
+
+
+@pytest.fixture
+def index(panel):
+    return PanelIndex(panel, 'Country Name', 'Value')
+
+
+@pytest.mark.parametrize('min_year', [None, 1995, 2005, 2024, 2030])
+def test_country_matches_mask(panel, index, min_year):
+    for name in COUNTRIES + ['Atlantis']:
+        mask = panel['Country Name'] == name
+        if min_year is not None:
+            mask &= panel['Year'] >= min_year
+        expected = panel[mask].sort_values('Year')
+        pd.testing.assert_frame_equal(index.country(name, min_year), expected)
+
+
+def test_rows_matches_isin(panel, index):
+    names = ['Viet Nam', 'China', 'China', 'Atlantis']
+    expected = panel[panel['Country Name'].isin(names) & (panel['Year'] >= 2010)]
+    pd.testing.assert_frame_equal(index.rows(names, min_year=2010), expected)
+    assert index.rows([]).empty
+
+
+@pytest.mark.parametrize('stat', ['median', 'mean', 'max'])
+def test_group_stat_matches_groupby(panel, index, stat):
+    names = ['France', 'Germany', 'Japan']
+    subset = panel[panel['Country Name'].isin(names) & (panel['Year'] >= 2005)]
+    expected = subset.groupby('Year')['Value'].agg(stat).reset_index()
+    pd.testing.assert_frame_equal(index.group_stat(names, stat, min_year=2005), expected)
+
+
+def test_results_are_independent_copies(panel, index):
+    first = index.group_stat(['France'], 'median')
+    first['Value'] = 0
+    assert not (index.group_stat(['France'], 'median')['Value'] == 0).all()
+    country = index.country('China')
+    country['Value'] = -1
+    assert (panel.loc[panel['Country Name'] == 'China', 'Value'] != -1).all()
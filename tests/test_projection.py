@@ -0,0 +1,48 @@
+"""projection.bootstrap_paths / percentile_bands: bentuk, determinisme seed dan urutan pita."""
+import numpy as np
+import pytest
+
+import projection
+
+GROWTH = [4.2, 5.1, np.nan, -1.3, 3.8, 6.0, 2.5]
+
+
+def test_paths_shape_and_start():
+    paths = projection.bootstrap_paths(GROWTH, 100.0, n_years=6, n_sims=500, seed=7)
+    assert paths.shape == (500, 6)
+    assert (paths[:, 0] == 100.0).all()
+
+
+def test_paths_resample_history_only():
+    paths = projection.bootstrap_paths(GROWTH, 100.0, n_years=6, n_sims=500, seed=7)
+    ratios = paths[:, 1:] / paths[:, :-1]
+    history = 1 + np.array([g for g in GROWTH if not np.isnan(g)]) / 100
+    # Setiap rasio tahun-ke-tahun adalah salah satu pertumbuhan historis (NaN dibuang)
+    assert np.isclose(ratios[..., None], history).any(axis=-1).all()
+
+
+def test_seed_is_deterministic():
+    a = projection.bootstrap_paths(GROWTH, 100.0, n_years=6, n_sims=200, seed=3)
+    b = projection.bootstrap_paths(GROWTH, 100.0, n_years=6, n_sims=200, seed=3)
+    c = projection.bootstrap_paths(GROWTH, 100.0, n_years=6, n_sims=200, seed=4)
+    np.testing.assert_array_equal(a, b)
+    assert not np.array_equal(a, c)
+
+
+def test_empty_history_raises():
+    with pytest.raises(ValueError):
+        projection.bootstrap_paths([np.nan, np.nan], 100.0, n_years=3)
+
+
+def test_percentile_bands_ordering():
+    years = list(range(2024, 2031))
+    paths = projection.bootstrap_paths(GROWTH, 100.0, n_years=len(years), n_sims=5000, seed=0)
+    bands = projection.percentile_bands(paths, years, percentiles=(5, 50, 95))
+    assert list(bands.columns) == ['Tahun', 'P5', 'P50', 'P95', 'Mean']
+    assert bands['Tahun'].tolist() == years
+    assert (bands.iloc[0, 1:] == 100.0).all()
+    assert (bands['P5'] <= bands['P50']).all() and (bands['P50'] <= bands['P95']).all()
+    # Ketidakpastian bertambah seiring horizon
+    width = (bands['P95'] - bands['P5']).to_numpy()
+    assert (np.diff(width) > 0).all()
+    np.testing.assert_allclose(bands['Mean'], paths.mean(axis=0))
@@ -0,0 +1,73 @@
+"""regression.fit_ols / predict / t_quantile dibandingkan dengan statsmodels & SciPy."""
+import numpy as np
+import pandas as pd
+import pytest
+
+import regression
+
+sm = pytest.importorskip('statsmodels.api')
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(42)
+    groups = np.repeat(['a', 'b', 'c'], [8, 15, 40])
+    x = rng.uniform(0, 10, len(groups))
+    slopes = {'a': 1.5, 'b': -0.7, 'c': 0.2}
+    y = np.array([slopes[g] for g in groups]) * x + 3 + rng.normal(0, 1, len(groups))
+    return pd.DataFrame({'x': x, 'y': y, 'group': groups})
+
+
+def _statsmodels_fit(df):
+    return sm.OLS(df['y'].to_numpy(), sm.add_constant(df['x'].to_numpy())).fit()
+
+
+def test_coefficients_match_statsmodels(data):
+    fit = regression.fit_ols(data['x'], data['y'], data['group'])
+    assert list(fit.index) == ['a', 'b', 'c']
+    for group, rows in data.groupby('group'):
+        ref = _statsmodels_fit(rows)
+        assert fit.loc[group, 'intercept'] == pytest.approx(ref.params[0], rel=1e-10)
+        assert fit.loc[group, 'slope'] == pytest.approx(ref.params[1], rel=1e-10)
+        assert fit.loc[group, 'r2'] == pytest.approx(ref.rsquared, rel=1e-10)
+        assert fit.loc[group, 'resid_var'] == pytest.approx(ref.scale, rel=1e-10)
+        assert fit.loc[group, 'n'] == len(rows)
+
+
+def test_confidence_band_matches_statsmodels(data):
+    fit = regression.fit_ols(data['x'], data['y'], data['group'])
+    x_grid = np.linspace(0, 10, 11)
+    yhat, lower, upper = regression.predict(fit, x_grid, level=0.95)
+    assert yhat.shape == lower.shape == upper.shape == (3, len(x_grid))
+    for i, (group, rows) in enumerate(data.groupby('group')):
+        pred = _statsmodels_fit(rows).get_prediction(sm.add_constant(x_grid))
+        ci = pred.conf_int(alpha=0.05)
+        np.testing.assert_allclose(yhat[i], pred.predicted_mean, rtol=1e-10)
+        # Kuantil t Cornish-Fisher: galat relatif lebar pita < 0.2% (dof >= 3)
+        np.testing.assert_allclose(upper[i] - yhat[i], ci[:, 1] - pred.predicted_mean, rtol=2e-3)
+        np.testing.assert_allclose(yhat[i] - lower[i], pred.predicted_mean - ci[:, 0], rtol=2e-3)
+
+
+def test_nan_pairs_are_dropped(data):
+    with_nan = data.copy()
+    with_nan.loc[[0, 9, 30], 'y'] = np.nan
+    with_nan.loc[[5], 'x'] = np.nan
+    fit = regression.fit_ols(with_nan['x'], with_nan['y'])
+    ref = _statsmodels_fit(with_nan.dropna())
+    assert fit.loc['all', 'n'] == len(data) - 4
+    assert fit.loc['all', 'slope'] == pytest.approx(ref.params[1], rel=1e-10)
+    assert fit.loc['all', 'intercept'] == pytest.approx(ref.params[0], rel=1e-10)
+
+
+def test_t_quantile_matches_scipy():
+    stats = pytest.importorskip('scipy.stats')
+    dof = np.arange(1, 201)
+    for p in (0.9, 0.95, 0.975, 0.99, 0.995):
+        expected = stats.t.ppf(p, dof)
+        got = regression.t_quantile(p, dof)
+        # dof 1 & 2 eksak, selebihnya Cornish-Fisher dengan batas galat sesuai docstring
+        np.testing.assert_allclose(got[:2], expected[:2], rtol=1e-12)
+        np.testing.assert_allclose(got[4:], expected[4:], rtol=1e-3)
+        if p <= 0.975:
+            np.testing.assert_allclose(got[2:], expected[2:], rtol=2e-3)
+    assert np.isnan(regression.t_quantile(0.975, 0))
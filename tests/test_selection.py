@@ -0,0 +1,90 @@
+"""selection.BitmapIndex dibandingkan dengan boolean mask pandas biasa."""
+import numpy as np
+import pandas as pd
+import pytest
+
+import countries
+from selection import BitmapIndex
+
+NAMES = ['China', 'Viet Nam', 'Vietnam', 'Germany', 'France', 'Indonesia', 'Atlantis']
+REGION = {'CHN': 'Asia', 'VNM': 'Asia', 'IDN': 'Asia', 'DEU': 'Europe', 'FRA': 'Europe'}
+RATING = {'CHN': '5', 'VNM': '5', 'IDN': '5', 'DEU': '1', 'FRA': '2'}
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(11)
+    # 203 baris: bukan kelipatan 8, bit sisa di byte terakhir bitmap ikut teruji
+    df = pd.DataFrame({'Country': rng.choice(NAMES, 203), 'Year': rng.integers(2000, 2025, 203)})
+    df['Value'] = rng.normal(size=len(df))
+    df.loc[[4, 50], 'Year'] = pd.NA
+    df['Year'] = df['Year'].astype('Int64')
+    return df
+
+
+@pytest.fixture
+def index(frame):
+    return BitmapIndex(frame, 'Country', region_of=REGION, rating_of=RATING)
+
+
+@pytest.fixture
+def iso3(frame):
+    return countries.to_iso3(frame['Country'])
+
+
+CRITERIA = [
+    {},
+    {'country': ['CHN']},
+    {'country': ['VNM', 'DEU', 'XXX']},
+    {'year': range(2010, 2016)},
+    {'region': ['Asia'], 'year': [2001, 2020]},
+    {'rating': ['5'], 'country': ['CHN', 'FRA']},
+    {'region': ['Europe'], 'rating': ['1', '2'], 'year': range(2000, 2025)},
+    {'country': []},
+    {'country': None, 'region': None},
+]
+
+
+def _mask(frame, iso3, criteria):
+    mask = pd.Series(True, index=frame.index)
+    keys = {'country': iso3, 'year': frame['Year'], 'region': iso3.map(REGION), 'rating': iso3.map(RATING)}
+    for dim, wanted in criteria.items():
+        if wanted is not None:
+            mask &= keys[dim].isin(list(wanted)).fillna(False).astype(bool)
+    return mask.to_numpy()
+
+
+@pytest.mark.parametrize('criteria', CRITERIA)
+def test_positions_match_mask(frame, index, iso3, criteria):
+    expected = np.flatnonzero(_mask(frame, iso3, criteria))
+    np.testing.assert_array_equal(index.positions(**criteria), expected)
+    pd.testing.assert_frame_equal(index.take(**criteria), frame[_mask(frame, iso3, criteria)])
+
+
+def test_take_aligned_frame(frame, index, iso3):
+    extended = frame.assign(Extra=frame['Value'] * 2)
+    taken = index.take(extended, country=['CHN', 'IDN'])
+    pd.testing.assert_frame_equal(taken, extended[iso3.isin(['CHN', 'IDN']).to_numpy()])
+
+
+def test_take_rejects_misaligned_frame(frame, index):
+    with pytest.raises(ValueError):
+        index.take(frame.iloc[:0], country=['CHN'])
+
+
+def test_values_and_names(frame, index, iso3):
+    assert index.values('region') == ['Asia', 'Europe']
+    assert index.values('country', region=['Europe']) == ['DEU', 'FRA']
+    expected_years = sorted(frame.loc[iso3.eq('CHN').to_numpy(), 'Year'].dropna().astype(int).unique())
+    assert index.values('year', country=['CHN']) == expected_years
+    # 'Viet Nam' & 'Vietnam' satu ISO3; nama tampilan = nama pertama di frame
+    first_vnm = frame.loc[iso3.eq('VNM').to_numpy(), 'Country'].iloc[0]
+    assert index.name('VNM') == first_vnm
+    assert index.names(region=['Asia']) == sorted(['China', first_vnm, 'Indonesia'])
+    assert index.iso3(['Germany', 'Vietnam', 'Atlantis']) == ['DEU', 'VNM']
+
+
+def test_unknown_dimension(index):
+    with pytest.raises(KeyError):
+        index.positions(continent=['Asia'])
+    assert not BitmapIndex(pd.DataFrame({'Country': ['China']}), 'Country').has('year')
@@ -1,10 +1,13 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import plotly.express as px
-import io
+
+import data_store
+import figure_cache
+import instrument
+import selection
+import uas_charts
+import uas_data
 
 # ---------------------------------------------------------
 # 1. KONFIGURASI HALAMAN & STYLING (TETAP)
@@ -14,6 +17,8 @@ st.set_page_config(
     layout="wide",
     initial_sidebar_state="expanded"
 )
+instrument.begin_run('uas.py')
+data_store.start_watcher()
 
 st.markdown("""
 <style>
@@ -27,207 +32,39 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # ---------------------------------------------------------
-# 2. DATA LOADING FUNCTIONS (PERBAIKAN LOGIKA DATA)
+# 2. DATA LOADING FUNCTIONS: lihat uas_data.py
 # ---------------------------------------------------------
 
-@st.cache_data
-def get_modern_slavery_data():
-    try:
-        df = pd.read_csv('clean_data_modern_slavery.csv')
-        df.columns = df.columns.str.strip()
-        
-        # Konversi aman ke numerik
-        def clean_numeric_col(series):
-            return pd.to_numeric(series.astype(str).str.replace(',', '', regex=False).str.strip(), errors='coerce')
-        
-        df['Population'] = clean_numeric_col(df['Population'])
-        col_slavery = 'Estimated number of people in modern slavery'
-        
-        if col_slavery in df.columns:
-            df[col_slavery] = clean_numeric_col(df[col_slavery]).fillna(0)
-            # Hindari division by zero
-            df['Slavery_Pct'] = np.where(df['Population'] > 0, (df[col_slavery] / df['Population']) * 100, 0)
-        return df
-    except Exception as e:
-        st.error(f"Gagal memuat data Slavery: {e}")
-        return pd.DataFrame(columns=['Country', 'Population', 'Estimated number of people in modern slavery', 'Slavery_Pct'])
-
-@st.cache_data
-def get_global_manufacturing_shift():
-    try:
-        df = pd.read_excel('clean_mva_share.xlsx')
-        g7_list = ['United States', 'United Kingdom', 'France', 'Germany', 'Italy', 'Canada', 'Japan']
-        
-        # Filter tahun dan negara
-        df_filtered = df[df['Year'] >= 2005].copy()
-        
-        g7_data = df_filtered[df_filtered['Country Name'].isin(g7_list)]
-        g7_mean = g7_data.groupby('Year')['MVA_Pct_GDP'].median().reset_index()
-        
-        china_data = df_filtered[df_filtered['Country Name'] == 'China'][['Year', 'MVA_Pct_GDP']]
-        
-        merged = pd.merge(g7_mean, china_data, on='Year', how='inner')
-        merged.columns = ['Tahun', 'G7 (Democracies)', 'China (The Factory)']
-        return merged
-    except Exception as e:
-        return pd.DataFrame({'Tahun': range(2005, 2024), 'G7 (Democracies)': [0]*19, 'China (The Factory)': [0]*19})
-
-@st.cache_data
-def get_rights_vs_growth():
-    try:
-        ituc = pd.read_excel('clean_ituc_score.xlsx')
-        growth = pd.read_excel('clean_industrial_growth.xlsx')
-        
-        latest_year = growth['Year'].max()
-        latest_growth = growth[growth['Year'] == latest_year][['Country Name', 'Industrial_Growth_Pct']]
-        
-        countries_map = {
-            'Viet Nam': 'Vietnam', 'China': 'China', 'Bangladesh': 'Bangladesh', 
-            'France': 'France', 'Germany': 'Germany', 'Norway': 'Norway',
-            'Eswatini': 'Eswatini', 'Austria': 'Austria', 'Sweden': 'Sweden'
-        }
-        
-        target_growth = latest_growth[latest_growth['Country Name'].isin(countries_map.keys())].copy()
-        target_growth['ITUC_Lookup'] = target_growth['Country Name'].replace(countries_map)
-
-        ituc_dict = ituc.set_index('Country')['ITUC_Score'].to_dict()
-        target_growth['ITUC_Rights_Score'] = target_growth['ITUC_Lookup'].map(ituc_dict)
-        
-        # Bersihkan data dari NaN hasil mapping yang gagal
-        target_growth = target_growth.dropna(subset=['ITUC_Rights_Score'])
-        target_growth = target_growth.rename(columns={'Country Name': 'Negara', 'Industrial_Growth_Pct': 'Manuf_Growth_%'})
-        
-        return target_growth.sort_values('Manuf_Growth_%', ascending=False)
-    except:
-        return pd.DataFrame(columns=['Negara', 'Manuf_Growth_%', 'ITUC_Rights_Score'])
-
-@st.cache_data
-def get_working_hours_vs_growth():
-    try:
-        ilo = pd.read_excel('clean_hours_ilo.xlsx')
-        growth = pd.read_excel('clean_industrial_growth.xlsx')
-        
-        target_map = {
-            'Senegal': 'Senegal', 'Eswatini': 'Eswatini',
-            'Viet Nam': 'Viet Nam', 'Germany': 'Germany',
-            'Austria': 'Austria', 'Netherlands': 'Netherlands'
-        }
-        
-        ilo_latest = ilo.sort_values('Year', ascending=False).drop_duplicates('Country')
-        latest_growth_year = growth['Year'].max()
-        growth_latest = growth[growth['Year'] == latest_growth_year][['Country Name', 'Industrial_Growth_Pct']]
-        
-        df_ilo = ilo_latest[ilo_latest['Country'].isin(target_map.keys())].copy()
-        df_ilo['Growth_Name'] = df_ilo['Country'].map(target_map)
-        
-        df_merged = pd.merge(df_ilo, growth_latest, left_on='Growth_Name', right_on='Country Name')
-        df_merged = df_merged.rename(columns={'Country': 'Negara', 'Annual_Hours_Est': 'Jam Kerja', 'Industrial_Growth_Pct': 'Pertumbuhan'})
-        
-        return df_merged[['Negara', 'Jam Kerja', 'Pertumbuhan']].sort_values('Jam Kerja', ascending=False)
-    except:
-        return pd.DataFrame(columns=['Negara', 'Jam Kerja', 'Pertumbuhan'])
-
-# ---------------------------------------------------------
-# 2. DATA LOADING FUNCTIONS (UNTUK BAB II)
-# ---------------------------------------------------------
-
-@st.cache_data
-def get_unfair_wage_comparison():
-    return pd.DataFrame({
-        'Negara': ['Indonesia', 'Russia', 'China', 'India'],
-        'Upah ($)': [340, 278, 248, 60],
-        'GDP ($ Trillion)': [1.37, 2.02, 17.79, 3.55],
-        'Status': ['Kita', 'Superpower', 'Superpower', 'Emerging Giant'],
-        'Color': ['#FF4B4B', '#00FF00', '#00FF00', '#00FF00'] 
-    })
-
-@st.cache_data
-def get_prison_stats():
-    """Mengambil data dari Tahanan_Indo.csv dengan fallback angka statis."""
-    try:
-        df_prison = pd.read_csv("Tahanan_Indo.csv")
-        df_prison['Jumlah'] = df_prison['Jumlah'].astype(str).str.replace(',', '').astype(int)
-        
-        tp_val = df_prison[df_prison['Kapasitas Penghuni'].str.contains("TP", na=False)]['Jumlah'].values[0]
-        kp_val = df_prison[df_prison['Kapasitas Penghuni'].str.contains("KP", na=False)]['Jumlah'].values[0]
-        
-        return pd.DataFrame({
-            'Kategori': ['Kapasitas Resmi', 'Penghuni Aktual (Overcrowding)'],
-            'Jumlah': [kp_val, tp_val]
-        })
-    except:
-        return pd.DataFrame({
-            'Kategori': ['Kapasitas Resmi', 'Penghuni Aktual (Overcrowding)'],
-            'Jumlah': [149705, 277236]
-        })
-
-@st.cache_data
-def get_slavery_gdp():
-    try:
-        get_slavery = pd.read_csv("clean_data_modern_slavery.csv")
-        get_gdp = pd.read_csv("clean_gdp.csv")
-        
-        # Bersihkan nama kolom
-        get_slavery.columns = get_slavery.columns.str.strip()
-        get_gdp.columns = get_gdp.columns.str.strip()
-        
-        df_merged = pd.merge(get_slavery, get_gdp, on='Country')
-        df_merged['GDP_Trillion'] = df_merged['GDP (nominal, 2023)'] / 1e12
-        df_merged['Slavery_Pop'] = pd.to_numeric(df_merged['Estimated number of people in modern slavery'].astype(str).str.replace(',', ''), errors='coerce')
-        df_merged['Negara'] = df_merged['Country']
-        return df_merged
-    except:
-        return pd.DataFrame({
-            'Negara': ['Indonesia', 'China', 'India', 'Russia'],
-            'GDP_Trillion': [1.37, 17.79, 3.55, 2.02],
-            'Slavery_Pop': [1830000, 5770000, 11000000, 1890000]
-        })
-    
-@st.cache_data
-def load_integrated_data():
-    # 1. Data Penjara (Deskriptif)
-    try:
-        df_prison = pd.read_csv("Tahanan_Indo.csv")
-        df_prison['Jumlah'] = df_prison['Jumlah'].astype(str).str.replace(',', '').astype(int)
-        tp_val = df_prison[df_prison['Kapasitas Penghuni'].str.contains("TP", na=False)]['Jumlah'].values[0]
-        kp_val = df_prison[df_prison['Kapasitas Penghuni'].str.contains("KP", na=False)]['Jumlah'].values[0]
-    except:
-        tp_val, kp_val = 277236, 149705
-
-    # 2. Data Modern Slavery & GDP (Diagnostic & Predictive)
-    try:
-        df_slavery = pd.read_csv("clean_data_modern_slavery.csv")
-        df_gdp = pd.read_csv("clean_gdp.csv")
-        
-        df_slavery.columns = df_slavery.columns.str.strip()
-        df_gdp.columns = df_gdp.columns.str.strip()
-        
-        df_merged = pd.merge(df_slavery, df_gdp, on='Country')
-        df_merged['GDP_Trillion'] = df_merged['GDP (nominal, 2023)'] / 1e12
-        df_merged['Slavery_Pop'] = pd.to_numeric(df_merged['Estimated number of people in modern slavery'].astype(str).str.replace(',', ''), errors='coerce')
-        
-        targets = ['China', 'Russia', 'India', 'Indonesia']
-        df_bench = df_merged[df_merged['Country'].isin(targets)].copy()
-        # Efficiency Score: Output per person
-        df_bench['Efficiency_Score'] = (df_bench['GDP_Trillion'] * 1e6) / df_bench['Slavery_Pop']
-    except:
-        df_bench = pd.DataFrame({
-            'Country': ['India', 'Indonesia', 'Russia', 'China'],
-            'Efficiency_Score': [0.32, 0.74, 1.06, 3.08],
-            'Slavery_Pop': [11000000, 1830000, 1890000, 5770000]
-        })
-        df_gdp = pd.DataFrame({'Country':['Indonesia'], 'GDP (nominal, 2023)':[1.37e12], 'GDP Growth':[5.05]})
-
-    return tp_val, kp_val, df_bench, df_gdp
 # ---------------------------------------------------------
 # 3. SIDEBAR NAVIGATION (TETAP)
 # ---------------------------------------------------------
+# Loader (uas_data) dan indeks seleksi sidebar (selection.get) yang dipakai setiap bab.
+CHAPTER_LOADERS = {
+    "BAB I: The Global Context": [uas_data.get_global_manufacturing_shift, uas_data.get_modern_slavery_data,
+                                  uas_data.get_rights_vs_growth, uas_data.get_working_hours_vs_growth],
+    "BAB II: National System Failure": [uas_data.get_unfair_wage_comparison, uas_data.get_prison_stats,
+                                        uas_data.get_slavery_gdp],
+    "BAB III: Neo-Slavery Efficiency Model": [uas_data.load_integrated_data],
+}
+CHAPTER_SELECTIONS = {
+    "BAB I: The Global Context": ['slavery'],
+}
+# Dataset (nama di data_store.SOURCES) yang dibutuhkan setiap bab, diturunkan dari deklarasi
+# `datasets=` loader dan dari selection.datasets, sehingga tidak bisa menyimpang dari kodenya.
+# Dataset bab yang dibuka mulai dimuat bersamaan begitu bab dipilih (seksi chart menunggu dataset
+# masing-masing); bab lain di-prefetch setelah halaman selesai dirender.
+CHAPTER_DATASETS = {
+    chapter: list(dict.fromkeys(
+        [name for loader in loaders for name in loader.datasets]
+        + [name for index in CHAPTER_SELECTIONS.get(chapter, ()) for name in selection.datasets(index)]
+    ))
+    for chapter, loaders in CHAPTER_LOADERS.items()
+}
+PREFETCH_OTHER_CHAPTERS = True
+
 st.sidebar.title("Navigasi Laporan")
-page = st.sidebar.radio("Pilih Bab:", [
-    "BAB I: The Global Context",
-    "BAB II: National System Failure",
-    "BAB III: Neo-Slavery Efficiency Model"
-])
+page = st.sidebar.radio("Pilih Bab:", list(CHAPTER_DATASETS))
+data_store.load_async(CHAPTER_DATASETS[page])
 
 
 # ---------------------------------------------------------
@@ -240,16 +77,13 @@ if page == "BAB I: The Global Context":
     
     # --- Grafik 1: MVA SHIFT ---
     st.subheader("1. The Industrial Density Shift")
-    df_shift = get_global_manufacturing_shift()
+    df_shift = uas_data.get_global_manufacturing_shift()
 
     if not df_shift.empty:
-        fig1 = go.Figure()
-        fig1.add_trace(go.Scatter(x=df_shift['Tahun'], y=df_shift['G7 (Democracies)'], name='G7 (Democracies)', line=dict(width=4, color='#FF4B4B'), fill='tozeroy'))
-        fig1.add_trace(go.Scatter(x=df_shift['Tahun'], y=df_shift['China (The Factory)'], name='China (Authoritarian)', line=dict(width=4, color='#00FF00'), fill='tonexty'))
-        fig1.update_layout(title="Nilai Tambah Manufaktur % dari GDP: G7 vs China", template="plotly_dark", height=450, xaxis_title="Tahun", yaxis_title="MVA % terhadap GDP")
+        fig1 = figure_cache.cached_figure(uas_charts.fig_industrial_shift, df_shift)
         st.plotly_chart(fig1, use_container_width=True)
 
-    df_slavery = get_modern_slavery_data()
+    df_slavery = uas_data.get_modern_slavery_data()
 
     g7_countries = [
         'United States of America', 'United Kingdom', 'Japan', 
@@ -257,42 +91,23 @@ if page == "BAB I: The Global Context":
     ]
     comp_countries = ['China'] + g7_countries
 
-    df_comp = df_slavery[df_slavery['Country'].isin(comp_countries)].copy()
+    # Negara pembanding dipilih di sidebar (awal: China + G7); baris diambil lewat indeks bitmap
+    slavery_index = selection.get('slavery')
+    st.sidebar.title("Filter Data")
+    filters = selection.sidebar_filters(slavery_index, key='uas_bab1')
+    iso3_comp = selection.country_picker("Negara pembanding (Modern Slavery)", slavery_index, comp_countries, filters,
+                                         key='uas_comp_countries')
+    # Loader gagal (frame fallback, pesan galat sudah tampil): barisnya tidak sejajar dengan indeks
+    if len(df_slavery) == slavery_index.n:
+        df_comp = slavery_index.take(df_slavery, country=iso3_comp).copy()
+    else:
+        df_comp = df_slavery.iloc[:0]
 
     if not df_comp.empty:
         df_comp['Sort_Order'] = df_comp['Country'].apply(lambda x: 0 if x == 'China' else 1)
         df_comp = df_comp.sort_values(['Sort_Order', 'Estimated number of people in modern slavery'], ascending=[True, False])
 
-        fig_slavery_comp = px.bar(
-            df_comp, 
-            x='Country', 
-            y='Estimated number of people in modern slavery',
-            title="Perbandingan Modern Slavery (China vs G7)",
-            labels={'Estimated number of people in modern slavery': 'Jumlah Orang'},
-            color='Country',
-            color_discrete_map={
-                'China': '#00FF00', 
-                'United States of America': '#FF4B4B', 
-                'United Kingdom': '#FF4B4B',
-                'Japan': '#FF4B4B',
-                'Germany': '#FF4B4B',
-                'France': '#FF4B4B',
-                'Italy': '#FF4B4B',
-                'Canada': '#FF4B4B'
-            },
-            template="plotly_dark",
-            text_auto='.2s' 
-        )
-
-        fig_slavery_comp.update_layout(
-            showlegend=False,
-            height=500,
-            xaxis_title="Negara",
-            yaxis_title="Estimasi Jumlah Orang di Modern Slavery",
-            yaxis=dict(showgrid=True, gridcolor="rgba(255,255,255,0.05)")
-        )
-
-        fig_slavery_comp.update_traces(textposition='outside', textfont_size=14)
+        fig_slavery_comp = figure_cache.cached_figure(uas_charts.fig_slavery_comparison, df_comp)
         
         st.markdown("""
         <div class="analysis-box">
@@ -307,24 +122,10 @@ if page == "BAB I: The Global Context":
 
     # --- Grafik 2: LIBERTY PENALTY ---
     st.subheader("2. The Liberty Penalty")
-    df_rights = get_rights_vs_growth()
+    df_rights = uas_data.get_rights_vs_growth()
     
     if not df_rights.empty:
-        fig2 = px.bar(
-            df_rights, 
-            x='Negara', 
-            y='Manuf_Growth_%', 
-            color='ITUC_Rights_Score', 
-            title="Hubungan Skor Hak Buruh vs Pertumbuhan Industri", 
-            template="plotly_dark", 
-            color_continuous_scale='RdYlGn', # Inverted agar skor tinggi (buruk) berwarna merah/hijau sesuai selera
-            labels={
-                'ITUC_Rights_Score': 'Skor ITUC (1=Terbaik, 5=Terburuk)',
-                'Manuf_Growth_%': 'Pertumbuhan Industri (%)'
-            }, 
-            text_auto='.2f'
-        )
-        fig2.add_hline(y=0, line_dash="dash", line_color="white")
+        fig2 = figure_cache.cached_figure(uas_charts.fig_liberty_penalty, df_rights)
         st.plotly_chart(fig2, use_container_width=True)
 
         st.markdown("""
@@ -339,51 +140,10 @@ if page == "BAB I: The Global Context":
 
     # --- Grafik 3: DISCIPLINE DIVIDEND ---
     st.subheader("3. The Discipline Dividend: Global Correlation")
-    df_hours_growth = get_working_hours_vs_growth()
+    df_hours_growth = uas_data.get_working_hours_vs_growth()
     
     if not df_hours_growth.empty:
-        fig3 = make_subplots(specs=[[{"secondary_y": True}]])
-
-        fig3.add_trace(
-            go.Bar(
-                x=df_hours_growth['Negara'], 
-                y=df_hours_growth['Jam Kerja'], 
-                name='Jam Kerja/Tahun', 
-                marker_color='#1E88E5', 
-                text=df_hours_growth['Jam Kerja'].round(0), 
-                textposition='inside', 
-                offsetgroup=1
-            ), 
-            secondary_y=False
-        )
-
-        colors = ['#00FF00' if x > 0 else '#FF4B4B' for x in df_hours_growth['Pertumbuhan']]
-
-        fig3.add_trace(
-            go.Bar(
-                x=df_hours_growth['Negara'], 
-                y=df_hours_growth['Pertumbuhan'], 
-                name='Pertumbuhan Industri %', 
-                marker_color=colors, 
-                text=df_hours_growth['Pertumbuhan'].apply(lambda x: f"{x:.1f}%"), 
-                textposition='outside', 
-                offsetgroup=2
-            ), 
-            secondary_y=True
-        )
-
-        fig3.add_hline(y=0, line_dash="solid", line_color="white", line_width=2, secondary_y=True)
-        fig3.update_layout(
-            title=dict(text="Jam Kerja vs Pertumbuhan Industri 2024", font=dict(size=20)),
-            template="plotly_dark",
-            barmode='group',
-            height=600,
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-            xaxis=dict(title="Negara"),
-            yaxis=dict(title="Jam Kerja per Tahun", range=[0, df_hours_growth['Jam Kerja'].max() * 1.2]),
-            yaxis2=dict(title="Pertumbuhan Industri (%)", side="right", range=[-10, 25])
-        )
-
+        fig3 = figure_cache.cached_figure(uas_charts.fig_discipline_dividend, df_hours_growth)
         st.plotly_chart(fig3, use_container_width=True)
 
     
@@ -399,26 +159,19 @@ elif page == "BAB II: National System Failure":
     # --- SEKSI A: THE ECONOMIC DELUSION ---
     st.subheader("1. The Delusional Pricing")
 
-    df_wage = get_unfair_wage_comparison()
-    fig_wage = go.Figure(data=[
-        go.Bar(x=df_wage['Negara'], y=df_wage['Upah ($)'], marker_color=df_wage['Color'],
-               text=df_wage['Upah ($)'], textposition='auto', customdata=df_wage['GDP ($ Trillion)'],
-               hovertemplate="<b>%{x}</b><br>Upah: $%{y}<br>GDP: $%{customdata} T<extra></extra>")
-    ])
-    fig_wage.update_layout(title="Upah Minimum vs Raksasa Global", 
-                          yaxis=dict(title="USD/Bulan", range=[0, 400], showgrid=False), 
-                          template="plotly_dark")
+    df_wage = uas_data.get_unfair_wage_comparison()
+    fig_wage = figure_cache.cached_figure(uas_charts.fig_wage_pricing, df_wage)
     st.plotly_chart(fig_wage, use_container_width=True)
 
     c1, c2, c3, c4 = st.columns(4)
     with c1: 
-        st.metric("🇮🇩 Indonesia", f"${df_wage.iloc[0]['GDP ($ Trillion)']} T")
+        st.metric("🇮🇩 Indonesia", f"${df_wage.iloc[0]['GDP ($ Trillion)']:g} T")
     with c2: 
-        st.metric("🇷🇺 Russia", f"${df_wage.iloc[1]['GDP ($ Trillion)']} T")
+        st.metric("🇷🇺 Russia", f"${df_wage.iloc[1]['GDP ($ Trillion)']:g} T")
     with c3: 
-        st.metric("🇨🇳 China", f"${df_wage.iloc[2]['GDP ($ Trillion)']} T")
+        st.metric("🇨🇳 China", f"${df_wage.iloc[2]['GDP ($ Trillion)']:g} T")
     with c4: 
-        st.metric("🇮🇳 India", f"${df_wage.iloc[3]['GDP ($ Trillion)']} T")
+        st.metric("🇮🇳 India", f"${df_wage.iloc[3]['GDP ($ Trillion)']:g} T")
 
     st.markdown("""
     <div class="analysis-box">
@@ -437,11 +190,8 @@ elif page == "BAB II: National System Failure":
     # --- SEKSI B: THE EFFICIENCY TRANSITION (WASTED ASSETS) ---
     st.subheader("2. Wasted Assets")
 
-    df_pris = get_prison_stats()
-    fig_pris = px.bar(df_pris, x='Kategori', y='Jumlah', text='Jumlah', 
-                      title="Krisis Overcrowding Lapas (Data Terkini)", 
-                      template="plotly_dark", color='Kategori', 
-                      color_discrete_sequence=['#1E88E5', '#FF4B4B'])
+    df_pris = uas_data.get_prison_stats()
+    fig_pris = figure_cache.cached_figure(uas_charts.fig_prison_overcrowding, df_pris)
 
     st.plotly_chart(fig_pris, use_container_width=True)
 
@@ -467,40 +217,10 @@ elif page == "BAB II: National System Failure":
     # --- SEKSI C: THE SECRET RECIPE (GLOBAL CONTEXT) ---
     st.subheader("3. Korelasi GDP vs Populasi Modern Slavery")
 
-    df_plot = get_slavery_gdp().query("Negara in ['Indonesia', 'China', 'India', 'Russia']").copy()
+    df_plot = uas_data.get_slavery_gdp().query("Negara in ['Indonesia', 'China', 'India', 'Russia']").copy()
     df_plot['Color'] = df_plot['Negara'].apply(lambda x: '#FF4B4B' if x == 'Indonesia' else '#00FF00')
 
-    fig_bub = px.scatter(
-        df_plot, x="GDP_Trillion", y="Slavery_Pop", size="Slavery_Pop",
-        color="Color", color_discrete_map="identity",
-        text="Negara", hover_name="Negara", size_max=60,
-        template="plotly_dark", height=600,
-        labels={"GDP_Trillion": "GDP (Trillion USD)", "Slavery_Pop": "Populasi Modern Slavery"}
-    )
-
-    # --- TAMBAHAN ANOTASI RUSSIA ---
-    try:
-        russia_data = df_plot[df_plot['Negara'] == 'Russia'].iloc[0]
-        fig_bub.add_annotation(
-            x=russia_data['GDP_Trillion'], 
-            y=russia_data['Slavery_Pop'],
-            text="<b>Russia:</b> Populasi Slavery mirip Indo,<br>tapi GDP jauh lebih tinggi (+47%)",
-            showarrow=True,
-            arrowhead=2,
-            ax=0, ay=-60,
-            bgcolor="#00FF00",
-            font=dict(color="black", size=12),
-            borderpad=4
-        )
-    except:
-        pass
-
-    fig_bub.update_traces(textposition='top center', marker=dict(line=dict(width=2, color='white')), cliponaxis=False)
-    fig_bub.update_layout(
-        xaxis=dict(title="GDP Nominal (Trillion USD)", showgrid=False, zerolinecolor='rgba(255,255,255,0.2)'),
-        yaxis=dict(title="Estimasi Populasi Slavery", gridcolor='rgba(255,255,255,0.05)', tickformat=",.0f"),
-        showlegend=False
-    )
+    fig_bub = figure_cache.cached_figure(uas_charts.fig_slavery_gdp_bubble, df_plot)
 
     st.plotly_chart(fig_bub, use_container_width=True)
     st.markdown("""
@@ -530,7 +250,7 @@ elif page == "BAB II: National System Failure":
 
 elif page == "BAB III: Neo-Slavery Efficiency Model":
     # Memanggil fungsi data
-    tp_total, kp_total, df_bench, df_gdp_global = load_integrated_data()
+    tp_total, kp_total, df_bench, df_gdp_global = uas_data.load_integrated_data()
 
     st.title("BAB III: The Neo-Slavery Efficiency Model")
     st.markdown("### Strategi Implementasi: Mengoptimalisasi Unit Tenaga Kerja Tanpa Beban Upah.")
@@ -560,12 +280,7 @@ elif page == "BAB III: Neo-Slavery Efficiency Model":
         st.metric("Total Efficiency Pool", f"{total_asset_pool:,.0f}", delta="Ready for Deployment")
 
     with col2:
-        fig_desc = go.Figure(data=[go.Pie(
-            labels=['Modern Slavery Eksis', 'Surplus Tahanan (Potential)'],
-            values=[indo_slavery, tp_total - kp_total],
-            hole=.4, marker_colors=['#FF4B4B', '#1E88E5']
-        )])
-        fig_desc.update_layout(title="Komposisi Aset Tenaga Kerja Efisiensi Tinggi", template="plotly_dark", height=400)
+        fig_desc = figure_cache.cached_figure(uas_charts.fig_asset_composition, indo_slavery, tp_total - kp_total)
         st.plotly_chart(fig_desc, use_container_width=True)
 
     
@@ -586,52 +301,12 @@ elif page == "BAB III: Neo-Slavery Efficiency Model":
     
     with col1:
         # Bar chart efisiensi per negara
-        fig_efisiensi = go.Figure()
-        fig_efisiensi.add_trace(go.Bar(
-            x=df_before['Negara'],
-            y=df_before['Efisiensi (GDP/Head)'],
-            marker_color=df_before['Efisiensi_Warna'],
-            text=df_before['Efisiensi (GDP/Head)'].apply(lambda x: f"${x:,.0f}"),
-            textposition='auto',
-            name='Output per Head'
-        ))
-        
-        fig_efisiensi.update_layout(
-            title="Efisiensi Output per Tenaga Kerja Non-Regulasi",
-            template="plotly_dark",
-            height=400,
-            yaxis_title="USD per Head",
-            xaxis_title="Negara",
-            showlegend=False
-        )
+        fig_efisiensi = figure_cache.cached_figure(uas_charts.fig_efficiency_bar, df_before)
         st.plotly_chart(fig_efisiensi, use_container_width=True)
     
     with col2:
         # Scatter plot GDP vs Populasi Slavery
-        fig_scatter = px.scatter(
-            df_before, 
-            x='GDP (Triliun USD)', 
-            y='Populasi Slavery',
-            size='Populasi Slavery',
-            color='Negara',
-            color_discrete_map={'Indonesia': '#FF4B4B', 'Russia': '#00FF00', 'China': '#00FF00', 'India': '#00FF00'},
-            text='Negara',
-            size_max=60,
-            title="Korelasi GDP vs Basis Tenaga Kerja"
-        )
-        
-        fig_scatter.update_traces(
-            textposition='top center',
-            marker=dict(line=dict(width=2, color='white'))
-        )
-        
-        fig_scatter.update_layout(
-            template="plotly_dark",
-            height=400,
-            xaxis_title="GDP (Triliun USD)",
-            yaxis_title="Populasi Modern Slavery",
-            showlegend=False
-        )
+        fig_scatter = figure_cache.cached_figure(uas_charts.fig_labor_base_scatter, df_before)
         st.plotly_chart(fig_scatter, use_container_width=True)
     
     # Perhitungan diagnostik
@@ -707,15 +382,7 @@ elif page == "BAB III: Neo-Slavery Efficiency Model":
         'Skenario': ['Normal Growth (Status Quo)']*len(years) + ['Optimized Efficiency Model (Pivot)']*len(years)
     })
 
-    fig_pred = px.line(df_proj, x='Tahun', y='GDP (Triliun IDR)', color='Skenario', markers=True,
-                    color_discrete_map={'Normal Growth (Status Quo)': '#636EFA', 'Optimized Efficiency Model (Pivot)': '#00FF00'},
-                    title="Proyeksi Akselerasi Ekonomi: Integrasi Aset Neo-Slavery")
-
-    fig_pred.add_trace(go.Scatter(x=years, y=gdp_boosted, fill=None, mode='lines', line_color='rgba(0,255,0,0)', showlegend=False))
-    fig_pred.add_trace(go.Scatter(x=years, y=gdp_standard, fill='tonexty', mode='lines', line_color='rgba(0,255,0,0)', 
-                                fillcolor='rgba(0, 255, 0, 0.1)', name='Potential Gain'))
-
-    fig_pred.update_layout(template="plotly_dark", hovermode="x unified", yaxis_title="Triliun Rupiah (IDR)")
+    fig_pred = figure_cache.cached_figure(uas_charts.fig_gdp_projection, df_proj, years, gdp_standard, gdp_boosted)
     st.plotly_chart(fig_pred, use_container_width=True)
 
     # 4. Metrics & Realistic Insights
@@ -773,4 +440,15 @@ elif page == "BAB III: Neo-Slavery Efficiency Model":
             <li><b>Interpretasi Pivot Fiskal:</b> Angka <b>97,8%</b> ini merepresentasikan konversi total dari <b>Beban Negara</b> menjadi <b>Marjin Keuntungan Manufaktur</b>. Penghematan drastis ini dialokasikan langsung untuk membiayai akselerasi industri strategis nasional tanpa bergantung pada utang luar negeri.</li>
         </ul>
     </div>
-    """, unsafe_allow_html=True)
\ No newline at end of file
+    """, unsafe_allow_html=True)
+
+# ---------------------------------------------------------
+# 5. PREFETCH DATASET BAB LAIN (LATAR BELAKANG)
+# ---------------------------------------------------------
+if PREFETCH_OTHER_CHAPTERS:
+    data_store.prefetch(name for chapter, names in CHAPTER_DATASETS.items() if chapter != page for name in names)
+
+# ---------------------------------------------------------
+# 6. INSTRUMENTASI (hanya tampil jika DASHBOARD_INSTRUMENT aktif)
+# ---------------------------------------------------------
+instrument.render_panel()
@@ -0,0 +1,273 @@
+"""Pembangun figure Plotly untuk uas.py (fungsi murni: DataFrame/parameter -> figure)."""
+
+import downsample
+
+# ---------------------------------------------------------
+# BAB I
+# ---------------------------------------------------------
+
+def fig_industrial_shift(df_shift):
+    import plotly.graph_objects as go
+
+    # Deret panjang (sejak 1960): titik dipangkas (LTTB) dan dirender WebGL di atas ambang
+    df_shift = downsample.downsample_wide(df_shift, 'Tahun', ['G7 (Democracies)', 'China (The Factory)'])
+    Scatter = downsample.scatter_trace(2 * len(df_shift))
+    fig1 = go.Figure()
+    fig1.add_trace(Scatter(x=df_shift['Tahun'], y=df_shift['G7 (Democracies)'], name='G7 (Democracies)', line=dict(width=4, color='#FF4B4B'), fill='tozeroy'))
+    fig1.add_trace(Scatter(x=df_shift['Tahun'], y=df_shift['China (The Factory)'], name='China (Authoritarian)', line=dict(width=4, color='#00FF00'), fill='tonexty'))
+    fig1.update_layout(title="Nilai Tambah Manufaktur % dari GDP: G7 vs China", template="plotly_dark", height=450, xaxis_title="Tahun", yaxis_title="MVA % terhadap GDP")
+    return fig1
+
+
+def fig_slavery_comparison(df_comp):
+    import plotly.express as px
+
+    fig_slavery_comp = px.bar(
+        df_comp,
+        x='Country',
+        y='Estimated number of people in modern slavery',
+        title="Perbandingan Modern Slavery (China vs G7)",
+        labels={'Estimated number of people in modern slavery': 'Jumlah Orang'},
+        color='Country',
+        color_discrete_map={
+            'China': '#00FF00',
+            'United States of America': '#FF4B4B',
+            'United Kingdom': '#FF4B4B',
+            'Japan': '#FF4B4B',
+            'Germany': '#FF4B4B',
+            'France': '#FF4B4B',
+            'Italy': '#FF4B4B',
+            'Canada': '#FF4B4B'
+        },
+        template="plotly_dark",
+        text_auto='.2s'
+    )
+
+    fig_slavery_comp.update_layout(
+        showlegend=False,
+        height=500,
+        xaxis_title="Negara",
+        yaxis_title="Estimasi Jumlah Orang di Modern Slavery",
+        yaxis=dict(showgrid=True, gridcolor="rgba(255,255,255,0.05)")
+    )
+
+    fig_slavery_comp.update_traces(textposition='outside', textfont_size=14)
+    return fig_slavery_comp
+
+
+def fig_liberty_penalty(df_rights):
+    import plotly.express as px
+
+    fig2 = px.bar(
+        df_rights,
+        x='Negara',
+        y='Manuf_Growth_%',
+        color='ITUC_Rights_Score',
+        title="Hubungan Skor Hak Buruh vs Pertumbuhan Industri",
+        template="plotly_dark",
+        color_continuous_scale='RdYlGn', # Inverted agar skor tinggi (buruk) berwarna merah/hijau sesuai selera
+        labels={
+            'ITUC_Rights_Score': 'Skor ITUC (1=Terbaik, 5=Terburuk)',
+            'Manuf_Growth_%': 'Pertumbuhan Industri (%)'
+        },
+        text_auto='.2f'
+    )
+    fig2.add_hline(y=0, line_dash="dash", line_color="white")
+    return fig2
+
+
+def fig_discipline_dividend(df_hours_growth):
+    from plotly.subplots import make_subplots
+    import plotly.graph_objects as go
+
+    fig3 = make_subplots(specs=[[{"secondary_y": True}]])
+
+    fig3.add_trace(
+        go.Bar(
+            x=df_hours_growth['Negara'],
+            y=df_hours_growth['Jam Kerja'],
+            name='Jam Kerja/Tahun',
+            marker_color='#1E88E5',
+            text=df_hours_growth['Jam Kerja'].round(0),
+            textposition='inside',
+            offsetgroup=1
+        ),
+        secondary_y=False
+    )
+
+    colors = ['#00FF00' if x > 0 else '#FF4B4B' for x in df_hours_growth['Pertumbuhan']]
+
+    fig3.add_trace(
+        go.Bar(
+            x=df_hours_growth['Negara'],
+            y=df_hours_growth['Pertumbuhan'],
+            name='Pertumbuhan Industri %',
+            marker_color=colors,
+            text=df_hours_growth['Pertumbuhan'].apply(lambda x: f"{x:.1f}%"),
+            textposition='outside',
+            offsetgroup=2
+        ),
+        secondary_y=True
+    )
+
+    fig3.add_hline(y=0, line_dash="solid", line_color="white", line_width=2, secondary_y=True)
+    fig3.update_layout(
+        title=dict(text="Jam Kerja vs Pertumbuhan Industri 2024", font=dict(size=20)),
+        template="plotly_dark",
+        barmode='group',
+        height=600,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        xaxis=dict(title="Negara"),
+        yaxis=dict(title="Jam Kerja per Tahun", range=[0, df_hours_growth['Jam Kerja'].max() * 1.2]),
+        yaxis2=dict(title="Pertumbuhan Industri (%)", side="right", range=[-10, 25])
+    )
+    return fig3
+
+
+# ---------------------------------------------------------
+# BAB II
+# ---------------------------------------------------------
+
+def fig_wage_pricing(df_wage):
+    import plotly.graph_objects as go
+    fig_wage = go.Figure(data=[
+        go.Bar(x=df_wage['Negara'], y=df_wage['Upah ($)'], marker_color=df_wage['Color'],
+               text=df_wage['Upah ($)'], textposition='auto', customdata=df_wage['GDP ($ Trillion)'],
+               hovertemplate="<b>%{x}</b><br>Upah: $%{y}<br>GDP: $%{customdata} T<extra></extra>")
+    ])
+    fig_wage.update_layout(title="Upah Minimum vs Raksasa Global",
+                          yaxis=dict(title="USD/Bulan", range=[0, 400], showgrid=False),
+                          template="plotly_dark")
+    return fig_wage
+
+
+def fig_prison_overcrowding(df_pris):
+    import plotly.express as px
+
+    return px.bar(df_pris, x='Kategori', y='Jumlah', text='Jumlah',
+                  title="Krisis Overcrowding Lapas (Data Terkini)",
+                  template="plotly_dark", color='Kategori',
+                  color_discrete_sequence=['#1E88E5', '#FF4B4B'])
+
+
+def fig_slavery_gdp_bubble(df_plot):
+    import plotly.express as px
+
+    fig_bub = px.scatter(
+        df_plot, x="GDP_Trillion", y="Slavery_Pop", size="Slavery_Pop",
+        color="Color", color_discrete_map="identity",
+        text="Negara", hover_name="Negara", size_max=60,
+        template="plotly_dark", height=600, render_mode=downsample.render_mode(len(df_plot)),
+        labels={"GDP_Trillion": "GDP (Trillion USD)", "Slavery_Pop": "Populasi Modern Slavery"}
+    )
+
+    # --- TAMBAHAN ANOTASI RUSSIA ---
+    try:
+        russia_data = df_plot[df_plot['Negara'] == 'Russia'].iloc[0]
+        fig_bub.add_annotation(
+            x=russia_data['GDP_Trillion'],
+            y=russia_data['Slavery_Pop'],
+            text="<b>Russia:</b> Populasi Slavery mirip Indo,<br>tapi GDP jauh lebih tinggi (+47%)",
+            showarrow=True,
+            arrowhead=2,
+            ax=0, ay=-60,
+            bgcolor="#00FF00",
+            font=dict(color="black", size=12),
+            borderpad=4
+        )
+    except:
+        pass
+
+    fig_bub.update_traces(textposition='top center', marker=dict(line=dict(width=2, color='white')))
+    # Scattergl tidak punya cliponaxis
+    fig_bub.update_traces(cliponaxis=False, selector={'type': 'scatter'})
+    fig_bub.update_layout(
+        xaxis=dict(title="GDP Nominal (Trillion USD)", showgrid=False, zerolinecolor='rgba(255,255,255,0.2)'),
+        yaxis=dict(title="Estimasi Populasi Slavery", gridcolor='rgba(255,255,255,0.05)', tickformat=",.0f"),
+        showlegend=False
+    )
+    return fig_bub
+
+
+# ---------------------------------------------------------
+# BAB III
+# ---------------------------------------------------------
+
+def fig_asset_composition(indo_slavery, prison_surplus):
+    import plotly.graph_objects as go
+    fig_desc = go.Figure(data=[go.Pie(
+        labels=['Modern Slavery Eksis', 'Surplus Tahanan (Potential)'],
+        values=[indo_slavery, prison_surplus],
+        hole=.4, marker_colors=['#FF4B4B', '#1E88E5']
+    )])
+    fig_desc.update_layout(title="Komposisi Aset Tenaga Kerja Efisiensi Tinggi", template="plotly_dark", height=400)
+    return fig_desc
+
+
+def fig_efficiency_bar(df_before):
+    import plotly.graph_objects as go
+    fig_efisiensi = go.Figure()
+    fig_efisiensi.add_trace(go.Bar(
+        x=df_before['Negara'],
+        y=df_before['Efisiensi (GDP/Head)'],
+        marker_color=df_before['Efisiensi_Warna'],
+        text=df_before['Efisiensi (GDP/Head)'].apply(lambda x: f"${x:,.0f}"),
+        textposition='auto',
+        name='Output per Head'
+    ))
+
+    fig_efisiensi.update_layout(
+        title="Efisiensi Output per Tenaga Kerja Non-Regulasi",
+        template="plotly_dark",
+        height=400,
+        yaxis_title="USD per Head",
+        xaxis_title="Negara",
+        showlegend=False
+    )
+    return fig_efisiensi
+
+
+def fig_labor_base_scatter(df_before):
+    import plotly.express as px
+
+    fig_scatter = px.scatter(
+        df_before,
+        x='GDP (Triliun USD)',
+        y='Populasi Slavery',
+        size='Populasi Slavery',
+        color='Negara',
+        color_discrete_map={'Indonesia': '#FF4B4B', 'Russia': '#00FF00', 'China': '#00FF00', 'India': '#00FF00'},
+        text='Negara',
+        size_max=60,
+        title="Korelasi GDP vs Basis Tenaga Kerja"
+    )
+
+    fig_scatter.update_traces(
+        textposition='top center',
+        marker=dict(line=dict(width=2, color='white'))
+    )
+
+    fig_scatter.update_layout(
+        template="plotly_dark",
+        height=400,
+        xaxis_title="GDP (Triliun USD)",
+        yaxis_title="Populasi Modern Slavery",
+        showlegend=False
+    )
+    return fig_scatter
+
+
+def fig_gdp_projection(df_proj, years, gdp_standard, gdp_boosted):
+    import plotly.express as px
+    import plotly.graph_objects as go
+
+    fig_pred = px.line(df_proj, x='Tahun', y='GDP (Triliun IDR)', color='Skenario', markers=True,
+                    color_discrete_map={'Normal Growth (Status Quo)': '#636EFA', 'Optimized Efficiency Model (Pivot)': '#00FF00'},
+                    title="Proyeksi Akselerasi Ekonomi: Integrasi Aset Neo-Slavery")
+
+    fig_pred.add_trace(go.Scatter(x=years, y=gdp_boosted, fill=None, mode='lines', line_color='rgba(0,255,0,0)', showlegend=False))
+    fig_pred.add_trace(go.Scatter(x=years, y=gdp_standard, fill='tonexty', mode='lines', line_color='rgba(0,255,0,0)',
+                                fillcolor='rgba(0, 255, 0, 0.1)', name='Potential Gain'))
+
+    fig_pred.update_layout(template="plotly_dark", hovermode="x unified", yaxis_title="Triliun Rupiah (IDR)")
+    return fig_pred
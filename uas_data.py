@@ -0,0 +1,153 @@
+"""Loader data (di-cache) untuk uas.py, bisa dipanggil tanpa menjalankan halaman Streamlit."""
+import streamlit as st
+import pandas as pd
+import numpy as np
+
+import compact
+import data_store
+import derived
+import instrument
+import panel_index
+import query
+
+# ---------------------------------------------------------
+# 2. DATA LOADING FUNCTIONS (PERBAIKAN LOGIKA DATA)
+# ---------------------------------------------------------
+
+@compact.shared_data(datasets=('slavery',))
+def get_modern_slavery_data():
+    try:
+        df = data_store.get_frame('slavery')
+        # Kolom angka sudah numerik sejak ingest (data_store.clean_numeric)
+        col_slavery = 'Estimated number of people in modern slavery'
+        
+        if col_slavery in df.columns:
+            df[col_slavery] = df[col_slavery].fillna(0)
+            # Hindari division by zero
+            df['Slavery_Pct'] = np.where(df['Population'] > 0, (df[col_slavery] / df['Population']) * 100, 0)
+        return df
+    except Exception as e:
+        st.error(f"Gagal memuat data Slavery: {e}")
+        return pd.DataFrame(columns=['Country', 'Population', 'Estimated number of people in modern slavery', 'Slavery_Pct'])
+
+@compact.shared_data(datasets=('mva',))
+def get_global_manufacturing_shift():
+    try:
+        mva = panel_index.get('mva')
+        g7_list = ['United States', 'United Kingdom', 'France', 'Germany', 'Italy', 'Canada', 'Japan']
+        
+        # Median G7 per tahun & deret China sejak 2005 (dari indeks panel, tanpa scan seluruh tabel)
+        g7_mean = mva.group_stat(g7_list, 'median', min_year=2005)
+        
+        china_data = mva.country('China', min_year=2005)[['Year', 'MVA_Pct_GDP']]
+        
+        with instrument.span('merge', 'G7 median + China (Year)'):
+            merged = pd.merge(g7_mean, china_data, on='Year', how='inner')
+        merged.columns = ['Tahun', 'G7 (Democracies)', 'China (The Factory)']
+        return merged
+    except Exception as e:
+        return pd.DataFrame({'Tahun': range(2005, 2024), 'G7 (Democracies)': [0]*19, 'China (The Factory)': [0]*19})
+
+@compact.shared_data(datasets=('ituc_score', 'growth'))
+def get_rights_vs_growth():
+    try:
+        target_countries = [
+            'Viet Nam', 'China', 'Bangladesh', 'France', 'Germany', 'Norway',
+            'Eswatini', 'Austria', 'Sweden'
+        ]
+
+        # Join pada kode ISO3, bukan string nama negara; negara tanpa skor ITUC tidak ikut
+        return query.query(f'''
+            SELECT g."Country Name" AS "Negara", g."Industrial_Growth_Pct" AS "Manuf_Growth_%", g."ISO3",
+                   CAST(s."ITUC_Score" AS DOUBLE) AS "ITUC_Rights_Score"
+            FROM latest_growth g
+            JOIN ituc_score s ON s."ISO3" = g."ISO3"
+            WHERE g."Country Name" IN ({query.placeholders(target_countries)})
+            ORDER BY "Manuf_Growth_%" DESC NULLS LAST, g._row, s._row
+        ''', target_countries, label='growth + ituc_score (ISO3)')
+    except:
+        return pd.DataFrame(columns=['Negara', 'Manuf_Growth_%', 'ITUC_Rights_Score'])
+
+@compact.shared_data(datasets=('hours_ilo', 'growth'))
+def get_working_hours_vs_growth():
+    try:
+        target_countries = ['Senegal', 'Eswatini', 'Viet Nam', 'Germany', 'Austria', 'Netherlands']
+
+        return query.query(f'''
+            SELECT h."Country" AS "Negara", h."Annual_Hours_Est" AS "Jam Kerja", g."Industrial_Growth_Pct" AS "Pertumbuhan"
+            FROM hours_latest h
+            JOIN latest_growth g ON g."ISO3" = h."ISO3"
+            WHERE h."Country" IN ({query.placeholders(target_countries)})
+            ORDER BY "Jam Kerja" DESC NULLS LAST, h._row, g._row
+        ''', target_countries, label='hours_ilo + growth (ISO3)')
+    except:
+        return pd.DataFrame(columns=['Negara', 'Jam Kerja', 'Pertumbuhan'])
+
+# ---------------------------------------------------------
+# 2. DATA LOADING FUNCTIONS (UNTUK BAB II)
+# ---------------------------------------------------------
+
+@compact.shared_data
+def get_unfair_wage_comparison():
+    return pd.DataFrame({
+        'Negara': ['Indonesia', 'Russia', 'China', 'India'],
+        'Upah ($)': [340, 278, 248, 60],
+        'GDP ($ Trillion)': [1.37, 2.02, 17.79, 3.55],
+        'Status': ['Kita', 'Superpower', 'Superpower', 'Emerging Giant'],
+        'Color': ['#FF4B4B', '#00FF00', '#00FF00', '#00FF00'] 
+    })
+
+@compact.shared_data(datasets=('tahanan',))
+def get_prison_stats():
+    """Mengambil data dari Tahanan_Indo.csv dengan fallback angka statis."""
+    try:
+        df_prison = data_store.get_frame('tahanan')
+        
+        tp_val = df_prison[df_prison['Kapasitas Penghuni'].str.contains("TP", na=False)]['Jumlah'].values[0]
+        kp_val = df_prison[df_prison['Kapasitas Penghuni'].str.contains("KP", na=False)]['Jumlah'].values[0]
+        
+        return pd.DataFrame({
+            'Kategori': ['Kapasitas Resmi', 'Penghuni Aktual (Overcrowding)'],
+            'Jumlah': [kp_val, tp_val]
+        })
+    except:
+        return pd.DataFrame({
+            'Kategori': ['Kapasitas Resmi', 'Penghuni Aktual (Overcrowding)'],
+            'Jumlah': [149705, 277236]
+        })
+
+@compact.shared_data(datasets=('slavery', 'gdp'))
+def get_slavery_gdp():
+    try:
+        # Gabungan slavery + GDP dibangun sekali di derived.py (dipakai bersama dengan debunk.py)
+        return derived.get('slavery_gdp_by_country')
+    except:
+        return pd.DataFrame({
+            'Negara': ['Indonesia', 'China', 'India', 'Russia'],
+            'GDP_Trillion': [1.37, 17.79, 3.55, 2.02],
+            'Slavery_Pop': [1830000, 5770000, 11000000, 1890000]
+        })
+    
+@compact.shared_data(datasets=('tahanan', 'slavery', 'gdp'))
+def load_integrated_data():
+    # 1. Data Penjara (Deskriptif)
+    try:
+        df_prison = data_store.get_frame('tahanan')
+        tp_val = df_prison[df_prison['Kapasitas Penghuni'].str.contains("TP", na=False)]['Jumlah'].values[0]
+        kp_val = df_prison[df_prison['Kapasitas Penghuni'].str.contains("KP", na=False)]['Jumlah'].values[0]
+    except:
+        tp_val, kp_val = 277236, 149705
+
+    # 2. Data Modern Slavery & GDP (Diagnostic & Predictive)
+    try:
+        df_bench = derived.get('efficiency_bench')
+        df_gdp = data_store.get_frame('gdp')
+    except:
+        df_bench = pd.DataFrame({
+            'Country': ['India', 'Indonesia', 'Russia', 'China'],
+            'Efficiency_Score': [0.32, 0.74, 1.06, 3.08],
+            'Slavery_Pop': [11000000, 1830000, 1890000, 5770000]
+        })
+        df_gdp = pd.DataFrame({'Country':['Indonesia'], 'GDP (nominal, 2023)':[1.37e12], 'GDP Growth':[5.05]})
+
+    return tp_val, kp_val, df_bench, df_gdp
@@ -0,0 +1,5 @@
+-- Baris ILO terbaru per negara (jam kerja tahunan/mingguan)
+SELECT h.*
+FROM hours_ilo h
+JOIN (SELECT "Country", MAX("Year") AS "Year" FROM hours_ilo GROUP BY "Country") latest
+  ON latest."Country" = h."Country" AND latest."Year" = h."Year"
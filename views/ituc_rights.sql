@@ -0,0 +1,3 @@
+-- ITUC Global Rights Index (ITUC.csv) dengan skor numerik: '5+' dihitung 6 untuk keperluan statistik
+SELECT *, CAST(CASE WHEN "Rating" = '5+' THEN '6' ELSE "Rating" END AS DOUBLE) AS "ITUC_Rights_Score"
+FROM ituc
@@ -0,0 +1,4 @@
+-- Pertumbuhan industri (WDI) semua negara pada tahun terbaru panel growth
+SELECT *
+FROM growth
+WHERE "Year" = (SELECT MAX("Year") FROM growth)
@@ -0,0 +1,198 @@
+"""Warm-up cache saat server boot, dengan sinyal readiness untuk load balancer.
+
+Pemakaian:
+    python warmup.py                                   # warm-up di proses ini saja (cek waktu tiap langkah)
+    python warmup.py --serve uas.py                    # jalankan server Streamlit, warm-up di latar belakang
+    python warmup.py --serve debunk.py --figures --ready-port 8502 -- --server.port 8501
+    python warmup.py --serve uas.py --ready-file /tmp/dashboard-ready
+
+Selama warm-up, GET http://<host>:<ready-port>/ready menjawab 503; setelah semua loader (dan opsional
+figure) terisi menjawab 200. Argumen setelah `--` diteruskan ke `streamlit run`.
+"""
+import argparse
+import json
+import logging
+import pickle
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import countries
+import data_store
+import debunk_data
+import derived
+import figure_cache
+import panel_index
+import query
+import selection
+import uas_data
+
+BASE_DIR = Path(__file__).resolve().parent
+
+# (label, loader ter-cache, argumen) -- argumen sama dengan yang dipakai halaman
+LOADERS = [
+    ('uas.get_modern_slavery_data', uas_data.get_modern_slavery_data, ()),
+    ('uas.get_global_manufacturing_shift', uas_data.get_global_manufacturing_shift, ()),
+    ('uas.get_rights_vs_growth', uas_data.get_rights_vs_growth, ()),
+    ('uas.get_working_hours_vs_growth', uas_data.get_working_hours_vs_growth, ()),
+    ('uas.get_unfair_wage_comparison', uas_data.get_unfair_wage_comparison, ()),
+    ('uas.get_prison_stats', uas_data.get_prison_stats, ()),
+    ('uas.get_slavery_gdp', uas_data.get_slavery_gdp, ()),
+    ('uas.load_integrated_data', uas_data.load_integrated_data, ()),
+    ('debunk.load_data', debunk_data.load_data, ()),
+    ('debunk.load_rights_data', debunk_data.load_rights_data, (2024,)),
+]
+
+# Dataset yang punya widget seleksi di sidebar (selection.get)
+SELECTION_DATASETS = ('mva', 'growth', 'slavery')
+
+logger = logging.getLogger('dashboard.warmup')
+
+_ready = threading.Event()
+_status = {'state': 'idle', 'steps': [], 'error': None, 'started': None, 'seconds': None}
+_status_lock = threading.Lock()
+
+
+def is_ready():
+    return _ready.is_set()
+
+
+def status():
+    with _status_lock:
+        return {**_status, 'steps': list(_status['steps'])}
+
+
+def _step(label, func):
+    t0 = time.perf_counter()
+    func()
+    with _status_lock:
+        _status['steps'].append({'step': label, 'ms': (time.perf_counter() - t0) * 1000})
+
+
+def _render_figures():
+    """Dijalankan di proses terpisah: AppTest mengganti Runtime Streamlit, jadi tidak boleh di proses server."""
+    import headless
+
+    for app in headless.APPS:
+        headless.run_app(app)
+    return figure_cache.export_entries()
+
+
+def warm_figures(timeout=600):
+    """Render semua halaman di subprocess lalu salin cache figure-nya ke proses ini; mengembalikan jumlah."""
+    with tempfile.NamedTemporaryFile(suffix='.pickle') as out:
+        subprocess.run([sys.executable, str(Path(__file__).resolve()), '--dump-figures', out.name],
+                       cwd=BASE_DIR, check=True, timeout=timeout, capture_output=True)
+        entries = pickle.loads(Path(out.name).read_bytes())
+    figure_cache.import_entries(entries)
+    return len(entries)
+
+
+def warm(figures=False, ready_file=None):
+    """Isi semua cache: sumber data, indeks panel, node turunan, tabel SQL, indeks bitmap, loader (dan opsional figure)."""
+    with _status_lock:
+        _status.update(state='warming', steps=[], error=None, started=time.time(), seconds=None)
+    t0 = time.perf_counter()
+    try:
+        _step('sumber data', lambda: [f.result() for f in data_store.load_async(data_store.SOURCES).values()])
+        _step('indeks negara', countries.country_index)
+        _step('indeks panel', lambda: [panel_index.get(name) for name in panel_index.PANELS])
+        _step('tabel turunan', lambda: [derived.get(name) for name in derived.NODES])
+        _step('tabel SQL', query.refresh)
+        _step('indeks bitmap', lambda: [selection.get(name) for name in SELECTION_DATASETS])
+        for label, loader, args in LOADERS:
+            _step(label, lambda: loader(*args))
+        if figures:
+            _step('figure', warm_figures)
+    except Exception as e:
+        logger.exception('warm-up gagal')
+        with _status_lock:
+            _status.update(state='failed', error=f'{type(e).__name__}: {e}')
+        return False
+    with _status_lock:
+        _status.update(state='ready', seconds=time.perf_counter() - t0)
+    _ready.set()
+    if ready_file:
+        Path(ready_file).write_text(json.dumps(status()), encoding='utf-8')
+    logger.info('warm-up selesai dalam %.1f s', time.perf_counter() - t0)
+    return True
+
+
+def start(figures=False, ready_file=None):
+    """Warm-up di thread daemon; tidak memblokir boot server."""
+    thread = threading.Thread(target=warm, kwargs={'figures': figures, 'ready_file': ready_file},
+                              name='cache-warmup', daemon=True)
+    thread.start()
+    return thread
+
+
+class _ReadinessHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.rstrip('/') not in ('/ready', ''):
+            self.send_error(404)
+            return
+        body = json.dumps(status()).encode()
+        self.send_response(200 if is_ready() else 503)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Probe load balancer tiap beberapa detik tidak perlu masuk log
+        pass
+
+
+def serve_readiness(port, host='0.0.0.0'):
+    """Endpoint readiness HTTP (200 setelah warm, 503 sebelumnya) di thread daemon."""
+    server = ThreadingHTTPServer((host, port), _ReadinessHandler)
+    threading.Thread(target=server.serve_forever, name='readiness', daemon=True).start()
+    return server
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    streamlit_args = argv[argv.index('--') + 1:] if '--' in argv else []
+    argv = argv[:argv.index('--')] if '--' in argv else argv
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--serve', metavar='SCRIPT', help='jalankan `streamlit run SCRIPT` dengan warm-up di latar belakang')
+    parser.add_argument('--figures', action='store_true', help='render semua halaman (subprocess) untuk mengisi cache figure')
+    parser.add_argument('--ready-port', type=int, help='port endpoint readiness HTTP (GET /ready)')
+    parser.add_argument('--ready-file', help='file yang ditulis setelah warm-up selesai')
+    parser.add_argument('--dump-figures', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.dump_figures:
+        logging.disable(logging.CRITICAL)
+        Path(args.dump_figures).write_bytes(pickle.dumps(_render_figures()))
+        return 0
+
+    if args.ready_file:
+        Path(args.ready_file).unlink(missing_ok=True)
+    if args.ready_port:
+        serve_readiness(args.ready_port)
+
+    if args.serve:
+        from streamlit.web import cli
+
+        start(figures=args.figures, ready_file=args.ready_file)
+        return cli.main(args=['run', args.serve, *streamlit_args], prog_name='streamlit')
+
+    logging.disable(logging.CRITICAL)
+    ok = warm(figures=args.figures, ready_file=args.ready_file)
+    result = status()
+    for step in result['steps']:
+        print(f"  {step['step']:40s} {step['ms']:8.1f} ms")
+    print(f"Status: {result['state']}" + (f" ({result['seconds']:.2f} s)" if ok else f" - {result['error']}"))
+    if args.figures:
+        print(f"Cache figure: {figure_cache.stats()['entries']} entri")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
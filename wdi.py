@@ -0,0 +1,72 @@
+"""Pembaca streaming untuk file mentah World Bank WDI (format lebar: satu kolom per tahun)."""
+import pandas as pd
+
+ID_COLS = ['Country Name', 'Country Code']
+INDICATOR_COL = 'Indicator Code'
+
+
+def _find_header_row(path, max_lines=50):
+    # Preamble WDI ("Data Source", "Last Updated Date", baris kosong) panjangnya bisa berbeda
+    with open(path, encoding='utf-8-sig') as f:
+        for i, line in enumerate(f):
+            if line.startswith('"Country Name"') or line.startswith('Country Name'):
+                return i
+            if i >= max_lines:
+                break
+    raise ValueError(f"{path}: header 'Country Name' WDI tidak ditemukan")
+
+
+def _is_wanted_col(col):
+    # Membuang 'Indicator Name' dan kolom kosong akibat koma di akhir baris
+    return col in ID_COLS or col == INDICATOR_COL or col.strip().isdigit()
+
+
+def iter_wdi(path, value_name='Value', chunksize=2000, indicator=None):
+    """Yield potongan long-form (Country Name, Country Code, Year, value_name) per `chunksize` baris.
+
+    Frame lebar penuh tidak pernah dibentuk, sehingga bulk export WDI ratusan MB tetap hemat memori.
+    Dengan `indicator` (mis. 'NY.GDP.PCAP.PP.CD') hanya baris indikator itu yang diambil, disaring
+    per potongan sebelum melt; tanpa `indicator` kolom 'Indicator Code' ikut di hasil agar indikator
+    yang berbeda di bulk file tidak tercampur dalam satu deret.
+    """
+    id_cols = ID_COLS + [INDICATOR_COL]
+    reader = pd.read_csv(
+        path,
+        skiprows=_find_header_row(path),
+        encoding='utf-8-sig',
+        usecols=_is_wanted_col,
+        dtype={col: 'str' for col in id_cols},
+        chunksize=chunksize,
+    )
+    for chunk in reader:
+        if indicator is not None:
+            chunk = chunk[chunk[INDICATOR_COL] == indicator].drop(columns=INDICATOR_COL)
+            if chunk.empty:
+                continue
+        keep = ID_COLS if indicator is not None else id_cols
+        long = chunk.melt(id_vars=keep, var_name='Year', value_name=value_name)
+        long = long.dropna(subset=[value_name])
+        long['Year'] = long['Year'].str.strip().astype('int16')
+        yield long
+
+
+def read_wdi(path, value_name='Value', chunksize=2000, indicator=None):
+    """Gabungkan semua potongan `iter_wdi` (sudah tersaring per indikator) menjadi satu panel long-form."""
+    chunks = list(iter_wdi(path, value_name=value_name, chunksize=chunksize, indicator=indicator))
+    if not chunks:
+        if indicator is not None:
+            raise ValueError(f"{path}: tidak ada nilai untuk indikator WDI {indicator!r}")
+        return pd.DataFrame(columns=ID_COLS + [INDICATOR_COL, 'Year', value_name])
+    return pd.concat(chunks, ignore_index=True)
+
+
+def latest_values(long_df, value_name='Value'):
+    """Nilai non-null terbaru per negara, diindeks dengan 'Country Code'."""
+    latest = long_df.sort_values('Year').drop_duplicates('Country Code', keep='last')
+    return latest.set_index('Country Code')[['Country Name', 'Year', value_name]]
+
+
+def read_country_codes(path):
+    """Pasangan (Country Name, Country Code) untuk semua baris WDI, termasuk yang tanpa nilai."""
+    return pd.read_csv(path, skiprows=_find_header_row(path), encoding='utf-8-sig',
+                       usecols=ID_COLS, dtype='str')